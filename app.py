@@ -1,63 +1,118 @@
-from flask import Flask  # type: ignore
+from flask import Flask, current_app  # type: ignore
 from extensions import db, cors
+import importlib
 import os
-from routes.seasons import seasons_bp
-from routes.teams import teams_bp
-from routes.players import players_bp
-from routes.games import games_bp
-from routes.awards import awards_bp
-from routes.dashboard import dashboard_bp
-from routes.recruiting import recruiting_bp
-from routes.transfer import transfer_bp
-from routes.career import career_bp
-from routes.playoff import playoff_bp
-from routes.promotion import promotion_bp
-from routes.draft import draft_bp
-from routes.rankings import rankings_bp
-from routes.honors import honors_bp
-from routes.conferences import conferences_bp
-from routes.season_actions import season_actions_bp
-# Initialize Flask app
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///dynasty_season1.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
-cors.init_app(app)
-# Register blueprints
-app.register_blueprint(seasons_bp, url_prefix='/api')
-app.register_blueprint(teams_bp, url_prefix='/api')
-app.register_blueprint(players_bp, url_prefix='/api')
-app.register_blueprint(games_bp, url_prefix='/api')
-app.register_blueprint(awards_bp, url_prefix='/api')
-app.register_blueprint(dashboard_bp, url_prefix='/api')
-app.register_blueprint(recruiting_bp, url_prefix='/api')
-app.register_blueprint(transfer_bp, url_prefix='/api')
-app.register_blueprint(career_bp, url_prefix='/api')
-app.register_blueprint(playoff_bp, url_prefix='/api')
-app.register_blueprint(promotion_bp, url_prefix='/api')
-app.register_blueprint(draft_bp, url_prefix='/api')
-app.register_blueprint(rankings_bp, url_prefix='/api')
-app.register_blueprint(honors_bp, url_prefix='/api')
-app.register_blueprint(conferences_bp, url_prefix='/api')
-app.register_blueprint(season_actions_bp, url_prefix='/api')
-'''print("Registered routes:")
-for rule in app.url_map.iter_rules():
-    print(rule)'''
-
-
-# Serve React frontend (placeholder)
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
+from config import Config
+from sqlite_tuning import init_sqlite_pragmas, report_sqlite_settings
+from data_versions import init_data_versions
+from rankings_provider import init_rankings_provider
+
+# (module, blueprint attribute) for every API blueprint. Route modules are only
+# imported when an app with routes is created, so scripts that just need the
+# database do not pay for importing the web stack.
+BLUEPRINTS = [
+    ('routes.seasons', 'seasons_bp'),
+    ('routes.teams', 'teams_bp'),
+    ('routes.players', 'players_bp'),
+    ('routes.games', 'games_bp'),
+    ('routes.awards', 'awards_bp'),
+    ('routes.dashboard', 'dashboard_bp'),
+    ('routes.recruiting', 'recruiting_bp'),
+    ('routes.transfer', 'transfer_bp'),
+    ('routes.career', 'career_bp'),
+    ('routes.playoff', 'playoff_bp'),
+    ('routes.promotion', 'promotion_bp'),
+    ('routes.draft', 'draft_bp'),
+    ('routes.rankings', 'rankings_bp'),
+    ('routes.honors', 'honors_bp'),
+    ('routes.conferences', 'conferences_bp'),
+    ('routes.season_actions', 'season_actions_bp'),
+    ('routes.export', 'export_bp'),
+]
+
+
+def register_blueprints(app: Flask) -> None:
+    """Import every route module and register its blueprint under /api."""
+    for module_name, attribute in BLUEPRINTS:
+        module = importlib.import_module(module_name)
+        app.register_blueprint(getattr(module, attribute), url_prefix='/api')
+
+
 def serve_frontend(path):
-    static_folder = os.path.join(app.root_path, 'static')
+    """Serve the React frontend (placeholder)."""
+    static_folder = os.path.join(current_app.root_path, 'static')
     if path != '' and os.path.exists(os.path.join(static_folder, path)):
-        return app.send_static_file(path)
+        return current_app.send_static_file(path)
     else:
-        return app.send_static_file('index.html')
+        return current_app.send_static_file('index.html')
+
+
+def create_app(config=None, with_routes: bool = True) -> Flask:
+    """
+    Create and configure a Flask application.
+
+    Args:
+        config: Optional settings applied on top of Config, either a dict of
+            config keys or an object/class with uppercase attributes
+        with_routes (bool): Register the API blueprints and the frontend route.
+            Scripts that only need the database should use create_db_app instead.
+
+    Returns:
+        Flask: Configured application with Flask-SQLAlchemy, CORS and the SQLite
+        connection pragmas initialized
+    """
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    if isinstance(config, dict):
+        app.config.update(config)
+    elif config is not None:
+        app.config.from_object(config)
+    db.init_app(app)
+    cors.init_app(app)
+    init_sqlite_pragmas(app)
+    init_data_versions(app)
+    init_rankings_provider(app)
+
+    if with_routes:
+        register_blueprints(app)
+        from response_cache import init_response_cache
+        init_response_cache(app)
+        # Opt-in request instrumentation: set DYNASTY_METRICS=1 and read /api/_metrics
+        if app.config['METRICS_ENABLED']:
+            from instrumentation import init_instrumentation
+            init_instrumentation(app)
+        app.add_url_rule('/', 'serve_frontend', serve_frontend, defaults={'path': ''})
+        app.add_url_rule('/<path:path>', 'serve_frontend', serve_frontend)
+    return app
+
+
+def create_db_app(config=None) -> Flask:
+    """
+    Create a lightweight app for scripts and migrations: database only, no routes.
+
+    Usage:
+        app = create_db_app()
+        with app.app_context():
+            ...
+    """
+    import models  # noqa: F401  Register every table on db.metadata
+    return create_app(config, with_routes=False)
+
+
+def __getattr__(name):
+    # Keep `from app import app` working for existing scripts; the full app is
+    # only built the first time it is requested.
+    if name == 'app':
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
+    app = create_app()
     with app.app_context():
         db.create_all()
+    report_sqlite_settings(app)
     # Listen on all network interfaces so the API is reachable from other devices
     app.run(debug=True, port=5001, host="0.0.0.0")
@@ -0,0 +1,328 @@
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extensions import db
+from models import (
+    Season, Conference, Team, TeamSeason, Player, PlayerSeason, Game, Award, AwardWinner,
+    Honor, HonorWinner, Recruit, SeasonStanding
+)
+from models import Transfer
+from utils_standings import rebuild_season_standings
+from utils_career import rebuild_player_careers
+from utils_ratings import rebuild_elo_ratings
+
+CONFERENCES = [
+    "ACC", "American", "Big 12", "Big Ten", "Conference USA", "MAC",
+    "Mountain West", "Pac-12", "SEC", "Sun Belt", "Independents"
+]
+AWARDS = [
+    "Heisman Trophy Award", "Davey O'Brien Award (QB)", "Doak Walker Award (RB)",
+    "Biletnikoff Award (WR)", "John Mackey Award (TE)", "Nagurski Award (DPOTY)",
+    "Butkus Award (LB)", "Jim Thorpe Award (DB)", "Lou Groza Award (K)", "Ray Guy Award (P)"
+]
+# Roster template per 85-man roster, scaled by roster_size
+POSITIONS = [
+    ("QB", 4), ("HB", 5), ("FB", 1), ("WR", 9), ("TE", 5), ("LT", 3), ("LG", 3), ("C", 3),
+    ("RG", 3), ("RT", 3), ("LEDG", 4), ("REDG", 4), ("DT", 7), ("SAM", 3), ("MIKE", 4),
+    ("WILL", 3), ("CB", 10), ("FS", 4), ("SS", 4), ("K", 1), ("P", 2)
+]
+CLASSES = ["FR", "SO", "JR", "SR"]
+PROGRESSION_MAP = {"FR": "SO", "SO": "JR", "JR": "SR"}
+DEV_TRAITS = ["Normal", "Impact", "Star", "Elite"]
+STATES = ["TX", "FL", "CA", "GA", "OH", "PA", "AL", "LA", "NC", "MI"]
+REGULAR_SEASON_WEEKS = 12
+FIRST_SEASON_YEAR = 2026
+
+
+def roster_positions(roster_size: int) -> list[str]:
+    """Expand the position template to a list of roster_size positions."""
+    template = [pos for pos, count in POSITIONS for _ in range(count)]
+    return [template[i % len(template)] for i in range(roster_size)]
+
+
+def stat_line(rnd: random.Random, position: str) -> dict:
+    """Random season stats that look plausible for the position."""
+    stats = {'games_played': rnd.randint(0, 13)}
+    if position == "QB":
+        attempts = rnd.randint(0, 450)
+        stats.update(
+            attempts=attempts, completions=int(attempts * rnd.uniform(0.5, 0.72)),
+            pass_yards=int(attempts * rnd.uniform(6, 9)), pass_tds=rnd.randint(0, 40),
+            interceptions=rnd.randint(0, 15), rush_attempts=rnd.randint(0, 120),
+            rush_yards=rnd.randint(-20, 700), rush_tds=rnd.randint(0, 10)
+        )
+    elif position in ("HB", "FB"):
+        carries = rnd.randint(0, 280)
+        stats.update(
+            rush_attempts=carries, rush_yards=int(carries * rnd.uniform(3, 6.5)),
+            rush_tds=rnd.randint(0, 20), longest_rush=rnd.randint(0, 90),
+            rush_fumbles=rnd.randint(0, 5), receptions=rnd.randint(0, 40),
+            rec_yards=rnd.randint(0, 400), rec_tds=rnd.randint(0, 4)
+        )
+    elif position in ("WR", "TE"):
+        catches = rnd.randint(0, 100)
+        stats.update(
+            receptions=catches, rec_yards=int(catches * rnd.uniform(8, 17)),
+            rec_tds=rnd.randint(0, 15), longest_rec=rnd.randint(0, 90), rec_drops=rnd.randint(0, 8)
+        )
+    elif position not in ("LT", "LG", "C", "RG", "RT", "K", "P"):
+        stats.update(
+            tackles=rnd.randint(0, 120), tfl=rnd.randint(0, 20), sacks=rnd.randint(0, 14),
+            interceptions=rnd.randint(0, 7), forced_fumbles=rnd.randint(0, 5), def_tds=rnd.randint(0, 2)
+        )
+    return stats
+
+
+def bulk_insert(model, rows: list[dict]) -> None:
+    """Insert plain dict rows for a model without building ORM objects."""
+    if rows:
+        db.session.bulk_insert_mappings(model, rows)
+
+
+def generate_dynasty(seasons: int = 3, teams: int = 136, roster_size: int = 85, seed: int = 0) -> dict:
+    """
+    Populate the current app's database with a synthetic multi-season dynasty.
+
+    Every team gets a full roster with one PlayerSeason row per player per season,
+    a full regular-season schedule with scores, and the season ends with a seeded
+    12-team playoff. Awards, weekly honors, recruits and transfers are added each
+    season. Seniors leave after each season and freshmen refill the rosters.
+
+    Args:
+        seasons (int): Number of seasons to generate
+        teams (int): Number of teams (136 matches the FBS set in populate_db.py)
+        roster_size (int): Players per team per season
+        seed (int): Random seed; the same arguments always produce the same data
+
+    Returns:
+        dict: Row counts per table
+
+    Note:
+        Must be called inside an app context on an empty database.
+    """
+    rnd = random.Random(seed)
+    db.create_all()
+
+    conferences = [Conference(name=name, tier=1) for name in CONFERENCES]
+    db.session.add_all(conferences)
+    db.session.flush()
+    conference_ids = [c.conference_id for c in conferences]
+
+    bulk_insert(Team, [
+        {
+            'name': f"Team {i + 1:03d}",
+            'abbreviation': f"T{i + 1:03d}",
+            'primary_conference_id': conference_ids[i % len(conference_ids)],
+            'is_user_controlled': i == 0,
+            'logo_url': "college_football_logos/placeholder.svg"
+        }
+        for i in range(teams)
+    ])
+    team_rows = db.session.query(Team.team_id, Team.primary_conference_id).order_by(Team.team_id).all()
+    team_ids = [team_id for team_id, _ in team_rows]
+    team_conf = dict(team_rows)
+
+    bulk_insert(Award, [{'name': name, 'description': name} for name in AWARDS])
+    national_honors = [
+        Honor(name="National Offensive Player of the Week", side="offense"),
+        Honor(name="National Defensive Player of the Week", side="defense"),
+        Honor(name="All-American First Team", side=None)
+    ]
+    db.session.add_all(national_honors)
+    db.session.flush()
+    award_ids = [award_id for (award_id,) in db.session.query(Award.award_id).order_by(Award.award_id)]
+    offense_honor, defense_honor, all_american = [h.honor_id for h in national_honors]
+
+    positions = roster_positions(roster_size)
+    # Active roster: list of [player_id, position, class] per team
+    rosters = {team_id: [] for team_id in team_ids}
+    name_counter = 0
+
+    def sign_players(signings: list[tuple[int, str, str]]) -> None:
+        """Create players for (team_id, position, class) tuples and add them to the rosters."""
+        nonlocal name_counter
+        players = []
+        for team_id, position, _ in signings:
+            name_counter += 1
+            players.append(Player(
+                name=f"Player {name_counter:06d}", position=position,
+                recruit_stars=rnd.randint(1, 5), state=rnd.choice(STATES),
+                redshirt_used=False, team_id=team_id, leaving=False
+            ))
+        db.session.add_all(players)
+        db.session.flush()
+        for player, (team_id, position, player_class) in zip(players, signings):
+            rosters[team_id].append([player.player_id, position, player_class])
+
+    # Spread the starting roster evenly over the four classes
+    sign_players([
+        (team_id, position, CLASSES[index % len(CLASSES)])
+        for team_id in team_ids
+        for index, position in enumerate(positions)
+    ])
+
+    for season_index in range(seasons):
+        season = Season(year=FIRST_SEASON_YEAR + season_index)
+        db.session.add(season)
+        db.session.flush()
+        season_id = season.season_id
+
+        bulk_insert(TeamSeason, [
+            {
+                'team_id': team_id, 'season_id': season_id, 'conference_id': team_conf[team_id],
+                'wins': 0, 'losses': 0, 'conference_wins': 0, 'conference_losses': 0,
+                'prestige': str(rnd.randint(1, 6)), 'team_rating': str(rnd.randint(60, 95))
+            }
+            for team_id in team_ids
+        ])
+
+        player_seasons = []
+        for team_id, roster in rosters.items():
+            for player_id, position, player_class in roster:
+                player_seasons.append({
+                    'player_id': player_id, 'season_id': season_id, 'team_id': team_id,
+                    'player_class': player_class, 'current_year': player_class,
+                    'redshirted': rnd.random() < 0.05, 'ovr_rating': rnd.randint(55, 95),
+                    'dev_trait': rnd.choice(DEV_TRAITS), 'height': f"6'{rnd.randint(0, 6)}\"",
+                    'weight': rnd.randint(170, 330), 'speed': rnd.randint(60, 95),
+                    **stat_line(rnd, position)
+                })
+        bulk_insert(PlayerSeason, player_seasons)
+
+        # Regular season: every team plays once per week against a random opponent
+        games = []
+        for week in range(1, REGULAR_SEASON_WEEKS + 1):
+            order = team_ids[:]
+            rnd.shuffle(order)
+            for home, away in zip(order[::2], order[1::2]):
+                home_score, away_score = rnd.randint(0, 56), rnd.randint(0, 56)
+                if home_score == away_score:
+                    home_score += 3
+                games.append({
+                    'season_id': season_id, 'week': week, 'home_team_id': home, 'away_team_id': away,
+                    'home_score': home_score, 'away_score': away_score, 'overtime': False,
+                    'game_type': 'Regular', 'neutral_site': False
+                })
+        bulk_insert(Game, games)
+        db.session.flush()
+        rebuild_season_standings(season_id)
+        db.session.flush()
+
+        # Copy records onto TeamSeason and rank teams by record for the Top 25
+        standings = SeasonStanding.query.filter_by(season_id=season_id).all()
+        ranked = sorted(standings, key=lambda s: (-s.wins, s.losses, -(s.points_for - s.points_against), s.team_id))
+        rank_by_team = {s.team_id: index + 1 for index, s in enumerate(ranked[:25])}
+        standing_by_team = {s.team_id: s for s in standings}
+        mappings = []
+        for ts_id, team_id in db.session.query(TeamSeason.team_season_id, TeamSeason.team_id).filter_by(season_id=season_id):
+            standing = standing_by_team[team_id]
+            games_played = standing.wins + standing.losses
+            mappings.append({
+                'team_season_id': ts_id, 'wins': standing.wins, 'losses': standing.losses,
+                'conference_wins': standing.conference_wins, 'conference_losses': standing.conference_losses,
+                'points_for': standing.points_for, 'points_against': standing.points_against,
+                'off_ppg': round(standing.points_for / games_played, 1) if games_played else None,
+                'def_ppg': round(standing.points_against / games_played, 1) if games_played else None,
+                'final_rank': rank_by_team.get(team_id)
+            })
+        db.session.bulk_update_mappings(TeamSeason, mappings)
+
+        # 12-team playoff seeded from the Top 25, results filled in round by round
+        seeds = {index + 1: s.team_id for index, s in enumerate(ranked[:12])}
+
+        def play(week: int, round_name: str, home: int, away: int) -> int:
+            home_score, away_score = rnd.randint(10, 45), rnd.randint(10, 45)
+            if home_score == away_score:
+                home_score += 7
+            db.session.add(Game(
+                season_id=season_id, week=week, home_team_id=home, away_team_id=away,
+                home_score=home_score, away_score=away_score, game_type='Playoff',
+                playoff_round=round_name, neutral_site=week >= 19
+            ))
+            return home if home_score > away_score else away
+
+        first_round = [play(17, 'First Round', seeds[h], seeds[a]) for h, a in ((5, 12), (6, 11), (7, 10), (8, 9))]
+        quarterfinals = [
+            play(18, 'Quarterfinals', seeds[seed_no], first_round[3 - index])
+            for index, seed_no in enumerate((1, 2, 3, 4))
+        ]
+        semifinals = [
+            play(19, 'Semifinals', quarterfinals[0], quarterfinals[3]),
+            play(19, 'Semifinals', quarterfinals[1], quarterfinals[2])
+        ]
+        play(20, 'Championship', semifinals[0], semifinals[1])
+        db.session.flush()
+        rebuild_season_standings(season_id)
+
+        # Awards and honors go to random rostered players
+        all_players = [(team_id, p[0], p[1]) for team_id, roster in rosters.items() for p in roster]
+        award_winners = []
+        for award_id in award_ids:
+            team_id, player_id, _ = rnd.choice(all_players)
+            award_winners.append({'award_id': award_id, 'season_id': season_id, 'player_id': player_id, 'team_id': team_id})
+        bulk_insert(AwardWinner, award_winners)
+        honor_winners = []
+        for week in range(1, REGULAR_SEASON_WEEKS + 1):
+            for honor_id in (offense_honor, defense_honor):
+                team_id, player_id, _ = rnd.choice(all_players)
+                honor_winners.append({'player_id': player_id, 'team_id': team_id, 'season_id': season_id, 'honor_id': honor_id, 'week': week})
+        for team_id, player_id, _ in rnd.sample(all_players, min(25, len(all_players))):
+            honor_winners.append({'player_id': player_id, 'team_id': team_id, 'season_id': season_id, 'honor_id': all_american, 'week': None})
+        bulk_insert(HonorWinner, honor_winners)
+
+        # Recruiting class and transfer portal for every team
+        seniors_per_team = {team_id: sum(1 for p in roster if p[2] == "SR") for team_id, roster in rosters.items()}
+        recruits = []
+        transfers = []
+        for team_id in team_ids:
+            for _ in range(seniors_per_team[team_id]):
+                recruits.append({
+                    'name': f"Recruit {len(recruits) + 1:06d}", 'position': rnd.choice(positions),
+                    'recruit_stars': rnd.randint(1, 5), 'recruit_rank_nat': rnd.randint(1, 3000),
+                    'recruit_rank_pos': rnd.randint(1, 300), 'speed': rnd.randint(60, 95),
+                    'dev_trait': rnd.choice(DEV_TRAITS), 'height': f"6'{rnd.randint(0, 6)}\"",
+                    'weight': rnd.randint(170, 330), 'state': rnd.choice(STATES),
+                    'team_id': team_id, 'season_id': season_id, 'committed': True,
+                    'ovr_rating': rnd.randint(50, 80)
+                })
+            for _ in range(3):
+                transfers.append({
+                    'name': f"Transfer {len(transfers) + 1:06d}", 'position': rnd.choice(positions),
+                    'previous_school': f"Team {rnd.choice(team_ids):03d}", 'ovr_rating': rnd.randint(60, 90),
+                    'recruit_stars': rnd.randint(1, 5), 'recruit_rank_pos': rnd.randint(1, 300),
+                    'dev_trait': rnd.choice(DEV_TRAITS), 'height': f"6'{rnd.randint(0, 6)}\"",
+                    'weight': rnd.randint(170, 330), 'state': rnd.choice(STATES),
+                    'current_status': rnd.choice(CLASSES), 'team_id': team_id, 'season_id': season_id,
+                    'committed': True
+                })
+        bulk_insert(Recruit, recruits)
+        bulk_insert(Transfer, transfers)
+        db.session.commit()
+
+        # Offseason: seniors leave, everyone else moves up a class, freshmen refill the roster
+        if season_index < seasons - 1:
+            leaving_ids = []
+            signings = []
+            for team_id in team_ids:
+                roster = rosters[team_id]
+                leaving_ids.extend(p[0] for p in roster if p[2] == "SR")
+                # Freshmen take over the departing seniors' positions
+                signings.extend((team_id, p[1], "FR") for p in roster if p[2] == "SR")
+                rosters[team_id] = [[pid, pos, PROGRESSION_MAP[cls]] for pid, pos, cls in roster if cls != "SR"]
+            sign_players(signings)
+            for start in range(0, len(leaving_ids), 500):
+                Player.query.filter(Player.player_id.in_(leaving_ids[start:start + 500])).update(
+                    {Player.team_id: None, Player.leaving: True}, synchronize_session=False
+                )
+            db.session.commit()
+
+    # Derived tables the write endpoints would have maintained
+    rebuild_player_careers()
+    rebuild_elo_ratings()
+    db.session.commit()
+
+    return {
+        table.__tablename__: db.session.query(table).count()
+        for table in (Season, Team, TeamSeason, Player, PlayerSeason, Game, AwardWinner, HonorWinner, Recruit, Transfer)
+    }
@@ -0,0 +1,278 @@
+import sys
+import os
+import argparse
+import json
+import logging
+import platform
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from flask import Flask
+from sqlalchemy import event
+from app import create_app
+from extensions import db
+from models import Season, Player, PlayerSeason, Team, AwardWinner, HonorWinner
+from benchmarks.generate_dynasty import generate_dynasty
+
+
+# Maximum statements per request for endpoints whose query count must not grow
+# with the number of seasons, teams or games. run_benchmarks reports violations.
+QUERY_BUDGETS = {
+    'dashboard': 9,
+    'team_roster': 2,
+    'all_players': 3,
+    'bulk_stats': 10,
+    'playoff_odds': 4,
+    'season_projection': 4,
+    'honors': 1,
+    'season_honors': 3,
+    'season_awards': 3,
+    'season_awards_all': 4,
+    'player_awards': 1,
+    'player_honors': 1,
+    # The bracket SELECT, at most one UPDATE per bracket game (11), the standings
+    # refresh (3 SELECTs and one UPDATE per playoff team, 12), the version bumps (4)
+    # and the Elo replay from the earliest changed week (5)
+    'playoff_results': 40,
+}
+
+
+def build_app(database_path: str) -> Flask:
+    """
+    Create an app with every API blueprint bound to the given SQLite file.
+
+    The response cache is disabled so repeated runs time the views, not cache hits.
+    """
+    return create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{database_path}", 'RESPONSE_CACHE_MAX_BYTES': 0})
+
+
+class QueryCounter:
+    """Counts statements executed on an engine while active."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def time_request(client, counter: QueryCounter, method: str, path: str, runs: int, json_body=None) -> dict:
+    """Issue the same request `runs` times and summarize latency, query count and size."""
+    timings = []
+    queries = []
+    status = None
+    size = None
+    for _ in range(runs):
+        counter.count = 0
+        start = time.perf_counter()
+        response = client.open(path, method=method, json=json_body)
+        timings.append((time.perf_counter() - start) * 1000)
+        queries.append(counter.count)
+        status = response.status_code
+        size = len(response.get_data())
+    return {
+        'method': method,
+        'path': path,
+        'status': status,
+        'runs': runs,
+        'ms': {
+            'min': round(min(timings), 3),
+            'median': round(statistics.median(timings), 3),
+            'mean': round(statistics.mean(timings), 3),
+            'max': round(max(timings), 3)
+        },
+        'queries': max(queries),
+        'response_bytes': size
+    }
+
+
+def run_benchmarks(seasons: int = 3, teams: int = 136, roster_size: int = 85, seed: int = 0, runs: int = 5) -> dict:
+    """
+    Generate a synthetic dynasty in a temporary SQLite file and time the key endpoints.
+
+    Args:
+        seasons (int): Number of seasons to generate
+        teams (int): Number of teams
+        roster_size (int): Players per team per season
+        seed (int): Random seed for the generator
+        runs (int): Timed repetitions per read-only endpoint
+
+    Returns:
+        dict: JSON-serializable report with the configuration, dataset size and
+        per-endpoint timings. Season progression mutates the database, so it is
+        timed once, after every read-only endpoint.
+    """
+    # Route modules log every request at DEBUG; keep the timings free of console I/O
+    logging.getLogger('routes').setLevel(logging.WARNING)
+    handle, database_path = tempfile.mkstemp(suffix='.db', prefix='dynasty_bench_')
+    os.close(handle)
+    try:
+        bench_app = build_app(database_path)
+        with bench_app.app_context():
+            start = time.perf_counter()
+            dataset = generate_dynasty(seasons=seasons, teams=teams, roster_size=roster_size, seed=seed)
+            generation_seconds = time.perf_counter() - start
+
+            latest = Season.query.order_by(Season.year.desc()).first()
+            user_team = Team.query.filter_by(is_user_controlled=True).first()
+            # A player with the longest career gives the career endpoint the most work
+            career_player = (
+                db.session.query(PlayerSeason.player_id)
+                .group_by(PlayerSeason.player_id)
+                .order_by(db.func.count().desc(), PlayerSeason.player_id)
+                .first()[0]
+            )
+            # A player with the most award wins and honors gives those endpoints the most rows
+            award_player = (
+                db.session.query(AwardWinner.player_id)
+                .filter(AwardWinner.player_id.isnot(None))
+                .group_by(AwardWinner.player_id)
+                .order_by(db.func.count().desc(), AwardWinner.player_id)
+                .first()[0]
+            )
+            honor_player = (
+                db.session.query(HonorWinner.player_id)
+                .filter(HonorWinner.player_id.isnot(None))
+                .group_by(HonorWinner.player_id)
+                .order_by(db.func.count().desc(), HonorWinner.player_id)
+                .first()[0]
+            )
+            counter = QueryCounter(db.engine)
+            client = bench_app.test_client()
+
+            results = {
+                'dashboard': time_request(client, counter, 'GET', '/api/dashboard', runs),
+                'season_teams': time_request(client, counter, 'GET', f"/api/seasons/{latest.season_id}/teams", runs),
+                'team_roster': time_request(
+                    client, counter, 'GET', f"/api/seasons/{latest.season_id}/teams/{user_team.team_id}/players", runs
+                ),
+                'all_players': time_request(client, counter, 'GET', f"/api/players?team_id={user_team.team_id}", runs),
+                'player_career': time_request(client, counter, 'GET', f"/api/players/{career_player}/career", runs),
+                'playoff_bracket': time_request(client, counter, 'GET', f"/api/playoff/{latest.season_id}/bracket", runs),
+                'playoff_odds': time_request(client, counter, 'GET', f"/api/playoff/{latest.season_id}/odds", runs),
+                'season_leaders': time_request(client, counter, 'GET', f"/api/seasons/{latest.season_id}/leaders", runs),
+                'power_ratings': time_request(
+                    client, counter, 'GET', f"/api/seasons/{latest.season_id}/power-ratings", runs
+                ),
+                'season_projection': time_request(
+                    client, counter, 'GET', f"/api/seasons/{latest.season_id}/projections", runs
+                ),
+                'honors': time_request(client, counter, 'GET', '/api/honors', runs),
+                'season_honors': time_request(client, counter, 'GET', f"/api/seasons/{latest.season_id}/honors", runs),
+                'season_awards': time_request(client, counter, 'GET', f"/api/seasons/{latest.season_id}/awards", runs),
+                'season_awards_all': time_request(
+                    client, counter, 'GET', f"/api/seasons/{latest.season_id}/awards/all", runs
+                ),
+                'player_awards': time_request(client, counter, 'GET', f"/api/players/{award_player}/awards", runs),
+                'player_honors': time_request(client, counter, 'GET', f"/api/players/{honor_player}/honors", runs),
+            }
+
+            # Write endpoints mutate the database, so they are timed once, after the reads
+            roster = [
+                player_id for player_id, in db.session.query(PlayerSeason.player_id)
+                .filter_by(season_id=latest.season_id, team_id=user_team.team_id)
+            ]
+            results['bulk_stats'] = time_request(
+                client, counter, 'POST', f"/api/seasons/{latest.season_id}/teams/{user_team.team_id}/bulk_stats", 1,
+                json_body=[{'player_id': player_id, 'stat_field': 'tackles', 'value': 40} for player_id in roster]
+            )
+
+            # A whole bracket's results in one request: every round is re-derived from the one before
+            bracket = client.get(f"/api/playoff/{latest.season_id}/bracket").get_json()
+            results['playoff_results'] = time_request(
+                client, counter, 'POST', f"/api/playoff/{latest.season_id}/batch-playoff-result", 1,
+                json_body={'results': [
+                    {'game_id': game['game_id'], 'home_score': 24, 'away_score': 17}
+                    for games in bracket.values() for game in games
+                ]}
+            )
+
+            # Progression needs the next season to exist
+            db.session.add(Season(year=latest.year + 1))
+            db.session.commit()
+            results['season_progression'] = time_request(
+                client, counter, 'POST', f"/api/seasons/{latest.season_id}/players/progression", 1
+            )
+            players = db.session.query(Player).count()
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        os.remove(database_path)
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform()
+        },
+        'config': {'seasons': seasons, 'teams': teams, 'roster_size': roster_size, 'seed': seed, 'runs': runs},
+        'dataset': {**dataset, 'players_after_progression': players},
+        'generation_seconds': round(generation_seconds, 3),
+        'results': results
+    }
+    report['query_budget_failures'] = check_query_budgets(report)
+    return report
+
+
+def check_query_budgets(report: dict) -> dict:
+    """Return {endpoint: {queries, budget}} for every endpoint that exceeded its QUERY_BUDGETS entry."""
+    failures = {}
+    for name, budget in QUERY_BUDGETS.items():
+        result = report['results'].get(name)
+        if result and result['queries'] > budget:
+            failures[name] = {'queries': result['queries'], 'budget': budget}
+    return failures
+
+
+def compare_reports(baseline: dict, report: dict) -> dict:
+    """Compare median latency and query counts per endpoint against a previous report."""
+    comparison = {}
+    for name, result in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous:
+            continue
+        before = previous['ms']['median']
+        after = result['ms']['median']
+        comparison[name] = {
+            'baseline_median_ms': before,
+            'median_ms': after,
+            'speedup': round(before / after, 2) if after else None,
+            'baseline_queries': previous['queries'],
+            'queries': result['queries']
+        }
+    if baseline.get('config') != report['config']:
+        comparison['warning'] = "Baseline was generated with a different configuration"
+    return comparison
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time key API endpoints against a synthetic dynasty.")
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--teams', type=int, default=136)
+    parser.add_argument('--roster-size', type=int, default=85)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help="Write the JSON report to this file instead of stdout")
+    parser.add_argument('--baseline', help="Previous JSON report to compare median timings against")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        seasons=args.seasons, teams=args.teams, roster_size=args.roster_size, seed=args.seed, runs=args.runs
+    )
+    if args.baseline:
+        with open(args.baseline) as f:
+            report['comparison'] = compare_reports(json.load(f), report)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + "\n")
+        print(f"Wrote benchmark report to {args.output}")
+    else:
+        print(output)
+    if report['query_budget_failures']:
+        sys.exit(f"Query budget exceeded: {json.dumps(report['query_budget_failures'])}")
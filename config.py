@@ -0,0 +1,67 @@
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+class Config:
+    """
+    Application settings, read from environment variables when the module is imported.
+
+    Database:
+        DATABASE_URL: SQLAlchemy database URL (default sqlite:///dynasty_season1.db,
+            which Flask-SQLAlchemy places in the instance folder)
+
+    SQLite connection pragmas, applied to every new connection (ignored for other databases):
+        SQLITE_JOURNAL_MODE: WAL lets readers continue while a write commits (default WAL)
+        SQLITE_SYNCHRONOUS: NORMAL is durable across app crashes in WAL mode (default NORMAL)
+        SQLITE_MMAP_SIZE: bytes of the database file to memory-map (default 256 MiB)
+        SQLITE_CACHE_SIZE: page cache; negative values are KiB (default -65536, 64 MiB)
+        SQLITE_TEMP_STORE: MEMORY keeps temp tables and sort spills in RAM (default MEMORY)
+        SQLITE_BUSY_TIMEOUT_MS: how long a writer waits for a lock before failing (default 5000)
+
+    Instrumentation:
+        DYNASTY_METRICS: set to 1 to enable /api/_metrics (default off)
+        DYNASTY_SLOW_QUERY_MS: log statements slower than this many milliseconds (default 100)
+
+    Response cache:
+        DYNASTY_CACHE_MAX_BYTES: memory bound of the in-process response cache,
+            0 disables it (default 32 MiB)
+
+    Rankings used by POST /seasons/<id>/update_stats for final_rank:
+        DYNASTY_RANKINGS_PROVIDER: 'stored' reads them from the database, 'http'
+            fetches them from DYNASTY_RANKINGS_URL (default stored)
+        DYNASTY_RANKINGS_URL: rankings service URL (default http://localhost:3000/rankings)
+        DYNASTY_RANKINGS_TIMEOUT_SECONDS: per-attempt HTTP timeout (default 1)
+        DYNASTY_RANKINGS_RETRIES: extra HTTP attempts per fetch (default 1)
+    """
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///dynasty_season1.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    SQLITE_PRAGMAS = {
+        'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'mmap_size': _env_int('SQLITE_MMAP_SIZE', 256 * 1024 * 1024),
+        'cache_size': _env_int('SQLITE_CACHE_SIZE', -65536),
+        'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'MEMORY'),
+        'busy_timeout': _env_int('SQLITE_BUSY_TIMEOUT_MS', 5000),
+    }
+
+    METRICS_ENABLED = _env_bool('DYNASTY_METRICS', False)
+    SLOW_QUERY_MS = float(os.environ.get('DYNASTY_SLOW_QUERY_MS', 100))
+
+    RESPONSE_CACHE_MAX_BYTES = _env_int('DYNASTY_CACHE_MAX_BYTES', 32 * 1024 * 1024)
+
+    RANKINGS_PROVIDER = os.environ.get('DYNASTY_RANKINGS_PROVIDER', 'stored')
+    RANKINGS_URL = os.environ.get('DYNASTY_RANKINGS_URL', 'http://localhost:3000/rankings')
+    RANKINGS_TIMEOUT_SECONDS = float(os.environ.get('DYNASTY_RANKINGS_TIMEOUT_SECONDS', 1))
+    RANKINGS_RETRIES = _env_int('DYNASTY_RANKINGS_RETRIES', 1)
@@ -0,0 +1,192 @@
+from functools import wraps
+
+from flask import make_response, request
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models import (
+    Season, Conference, Team, TeamSeason, Player, PlayerSeason, Game, SeasonStanding, Award,
+    AwardWinner, Honor, HonorWinner, Recruit, Transfer, SeasonDataVersion
+)
+
+GLOBAL_SCOPE = 0
+# Rows that belong to one season: a write bumps that season's version
+SEASON_SCOPED_MODELS = (TeamSeason, PlayerSeason, Game, SeasonStanding, AwardWinner, HonorWinner, Recruit, Transfer)
+# Rows shared by every season (names, conferences, ...): a write bumps the global version
+GLOBAL_MODELS = (Season, Conference, Team, Player, Award, Honor)
+
+version_table = SeasonDataVersion.__table__
+
+# Callbacks run after a commit that changed tracked data, see on_data_committed
+_commit_listeners = []
+
+
+def bump_versions(connection, scopes) -> None:
+    """Increment the version of each scope (season id, or GLOBAL_SCOPE) on the given connection."""
+    scopes = sorted(set(scopes))
+    if not scopes:
+        return
+    connection.execute(
+        update(version_table)
+        .where(version_table.c.season_id.in_(scopes))
+        .values(version=version_table.c.version + 1)
+    )
+    existing = set(connection.execute(
+        select(version_table.c.season_id).where(version_table.c.season_id.in_(scopes))
+    ).scalars())
+    missing = [scope for scope in scopes if scope not in existing]
+    if missing:
+        connection.execute(version_table.insert(), [{'season_id': scope, 'version': 1} for scope in missing])
+
+
+def _pending_changes(session) -> dict:
+    """Scopes and team ids changed in the session's current transaction (team_ids None: unknown)."""
+    return session.info.setdefault('data_changes', {'scopes': set(), 'team_ids': set()})
+
+
+def bump_season_version(season_id=None, team_ids=None) -> None:
+    """
+    Mark a season's data as changed in the current transaction.
+
+    Writes made through the ORM unit of work or Query.update/delete are tracked
+    automatically. Call this after bulk_insert_mappings / bulk_update_mappings,
+    which bypass session events. Pass None to bump the global scope, which
+    changes the version of every season. team_ids lists the teams whose rows
+    were written, when known.
+    """
+    scope = GLOBAL_SCOPE if season_id is None else season_id
+    changes = _pending_changes(db.session())
+    changes['scopes'].add(scope)
+    if team_ids is None or changes['team_ids'] is None:
+        changes['team_ids'] = None
+    else:
+        changes['team_ids'].update(team_ids)
+    bump_versions(db.session.connection(), [scope])
+
+
+def on_data_committed(callback) -> None:
+    """
+    Register callback(scopes, team_ids), run after every commit that changed
+    tracked data. scopes holds season ids and/or GLOBAL_SCOPE; team_ids is None
+    when a bulk write did not say which teams it touched.
+    """
+    if callback not in _commit_listeners:
+        _commit_listeners.append(callback)
+
+
+def _scopes_for_instance(obj) -> set:
+    if isinstance(obj, GLOBAL_MODELS):
+        return {GLOBAL_SCOPE}
+    if isinstance(obj, SEASON_SCOPED_MODELS):
+        history = inspect(obj).attrs.season_id.history
+        season_ids = set(history.added or ()) | set(history.deleted or ()) | set(history.unchanged or ())
+        season_ids.discard(None)
+        return season_ids or {GLOBAL_SCOPE}
+    return set()
+
+
+def _team_ids_for_instance(obj) -> set:
+    if isinstance(obj, Team):
+        return {obj.team_id}
+    team_ids = set()
+    state = inspect(obj)
+    for attribute in ('team_id', 'home_team_id', 'away_team_id'):
+        if attribute in state.attrs.keys():
+            history = state.attrs[attribute].history
+            team_ids |= set(history.added or ()) | set(history.deleted or ()) | set(history.unchanged or ())
+    team_ids.discard(None)
+    return team_ids
+
+
+def _after_flush(session, flush_context) -> None:
+    changed = list(session.new) + list(session.deleted) + [
+        obj for obj in session.dirty if session.is_modified(obj, include_collections=False)
+    ]
+    scopes = set()
+    team_ids = set()
+    for obj in changed:
+        obj_scopes = _scopes_for_instance(obj)
+        if obj_scopes:
+            scopes |= obj_scopes
+            team_ids |= _team_ids_for_instance(obj)
+    if scopes:
+        changes = _pending_changes(session)
+        changes['scopes'] |= scopes
+        if changes['team_ids'] is not None:
+            changes['team_ids'] |= team_ids
+        bump_versions(session.connection(), scopes)
+
+
+def _after_commit(session) -> None:
+    changes = session.info.pop('data_changes', None)
+    if not changes:
+        return
+    for callback in _commit_listeners:
+        callback(changes['scopes'], changes['team_ids'])
+
+
+def _after_rollback(session) -> None:
+    session.info.pop('data_changes', None)
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    # Query.update()/delete() and ORM insert() statements carry arbitrary criteria,
+    # so a write to any tracked table conservatively bumps the global scope
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    tracked = SEASON_SCOPED_MODELS + GLOBAL_MODELS
+    if any(issubclass(mapper.class_, tracked) for mapper in orm_execute_state.all_mappers):
+        _pending_changes(orm_execute_state.session)['scopes'].add(GLOBAL_SCOPE)
+        bump_versions(orm_execute_state.session.connection(), [GLOBAL_SCOPE])
+
+
+def init_data_versions(app) -> None:
+    """
+    Register the session hooks that keep season versions up to date and make sure
+    the version table exists, so databases created before it was added keep working.
+    Safe to call for several apps.
+    """
+    with app.app_context():
+        version_table.create(bind=db.engine, checkfirst=True)
+    if not event.contains(Session, 'after_flush', _after_flush):
+        event.listen(Session, 'after_flush', _after_flush)
+        event.listen(Session, 'do_orm_execute', _do_orm_execute)
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_rollback', _after_rollback)
+
+
+def get_season_etag(season_id: int) -> str:
+    """Return an ETag for a season's current data, built from its version and the global version."""
+    versions = dict(db.session.execute(
+        select(version_table.c.season_id, version_table.c.version)
+        .where(version_table.c.season_id.in_([GLOBAL_SCOPE, season_id]))
+    ).all())
+    return f"s{season_id}-v{versions.get(season_id, 0)}-g{versions.get(GLOBAL_SCOPE, 0)}"
+
+
+def season_etag(view):
+    """
+    Decorator for season-scoped GET endpoints that adds ETag / If-None-Match support.
+
+    A request whose If-None-Match matches the season's current ETag gets an empty
+    304 after a single version lookup, without running the view. Otherwise the
+    view runs and the response is tagged with the version read afterwards, so a
+    view that writes (e.g. the bracket repairing playoff rounds) is tagged correctly.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        season_id = kwargs['season_id']
+        etag = get_season_etag(season_id)
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            etag = get_season_etag(season_id)
+        response.set_etag(etag)
+        # Let clients keep the payload but always revalidate it
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    return wrapper
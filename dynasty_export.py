@@ -0,0 +1,91 @@
+import sys
+import argparse
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from extensions import db
+from models import (
+    Season, Conference, Team, TeamSeason, Player, PlayerSeason, Game, Award,
+    AwardWinner, Honor, HonorWinner, Recruit, Transfer, SeasonRanking
+)
+
+EXPORT_FORMAT_VERSION = 1
+# Source tables in dependency order, so an import can insert them top to bottom.
+# Standings and data versions are derived and rebuilt after an import.
+EXPORT_TABLES = (
+    Season, Conference, Team, TeamSeason, Player, PlayerSeason, Game,
+    Award, AwardWinner, Honor, HonorWinner, Recruit, Transfer, SeasonRanking
+)
+DEFAULT_BATCH_SIZE = 1000
+
+
+def export_header() -> dict:
+    """First line of an export: format version, export time and the table order."""
+    return {
+        'table': '_meta',
+        'row': {
+            'format_version': EXPORT_FORMAT_VERSION,
+            'exported_at': datetime.now(timezone.utc).isoformat(),
+            'tables': [model.__tablename__ for model in EXPORT_TABLES]
+        }
+    }
+
+
+def iter_export_rows(batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Yield {'table': name, 'row': {column: value}} for every row of every exported
+    table, header first.
+
+    Rows are read as Core rows in primary key order with yield_per batches on a
+    streaming cursor, so memory use stays constant however large the dynasty is.
+    """
+    yield export_header()
+    for model in EXPORT_TABLES:
+        table = model.__table__
+        name = table.name
+        statement = select(table).order_by(*table.primary_key.columns)
+        result = db.session.execute(statement, execution_options={'yield_per': batch_size})
+        for row in result:
+            yield {'table': name, 'row': dict(row._mapping)}
+
+
+def iter_export_lines(batch_size: int = DEFAULT_BATCH_SIZE):
+    """Yield the export as newline-terminated NDJSON strings."""
+    for record in iter_export_rows(batch_size):
+        yield json.dumps(record, separators=(',', ':')) + "\n"
+
+
+def export_dynasty(path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Write the whole dynasty to an NDJSON file.
+
+    Returns:
+        dict: Row count per table
+    """
+    counts = {}
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in iter_export_rows(batch_size):
+            if record['table'] != '_meta':
+                counts[record['table']] = counts.get(record['table'], 0) + 1
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+    return counts
+
+
+if __name__ == "__main__":
+    from app import create_db_app
+
+    parser = argparse.ArgumentParser(description="Export every dynasty table as newline-delimited JSON.")
+    parser.add_argument('output', help="NDJSON file to write, or - for stdout")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    app = create_db_app()
+    with app.app_context():
+        if args.output == '-':
+            for line in iter_export_lines(args.batch_size):
+                sys.stdout.write(line)
+        else:
+            counts = export_dynasty(args.output, args.batch_size)
+            print(f"Exported {sum(counts.values())} rows to {args.output}: {counts}")
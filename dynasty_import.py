@@ -0,0 +1,263 @@
+import sys
+import os
+import argparse
+import csv
+import json
+import time
+
+from marshmallow import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from dynasty_export import EXPORT_FORMAT_VERSION, EXPORT_TABLES
+from data_versions import bump_season_version
+from schemas import snapshot_row_schema
+from utils_standings import rebuild_season_standings
+from utils_career import rebuild_player_careers
+from utils_ratings import rebuild_elo_ratings
+
+DEFAULT_CHUNK_SIZE = 5000
+SNAPSHOT_TABLES = {model.__tablename__: model.__table__ for model in EXPORT_TABLES}
+
+
+def iter_ndjson_snapshot(path: str):
+    """Yield (table, row, line number) from an NDJSON export, checking the _meta line's format version."""
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                table, row = record['table'], record['row']
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(f"line {line_number}: expected a JSON object with 'table' and 'row'")
+            if table == '_meta':
+                version = row.get('format_version')
+                if version != EXPORT_FORMAT_VERSION:
+                    raise ValueError(f"line {line_number}: unsupported export format version {version}")
+                continue
+            yield table, row, line_number
+
+
+def iter_csv_snapshot(directory: str):
+    """
+    Yield (table, row, line number) from a directory holding one <table>.csv per
+    exported table, header row = column names. Missing files are skipped and
+    empty cells are read as null.
+    """
+    for name in SNAPSHOT_TABLES:
+        path = os.path.join(directory, f"{name}.csv")
+        if not os.path.exists(path):
+            continue
+        with open(path, newline='', encoding='utf-8') as f:
+            for line_number, row in enumerate(csv.DictReader(f), 2):
+                yield name, row, line_number
+
+
+class _TableState:
+    """Per-table bookkeeping for SnapshotImporter: id allocation, natural keys and foreign keys."""
+
+    def __init__(self, table, referenced: bool):
+        self.table = table
+        self.schema = snapshot_row_schema(table)
+        self.pk = list(table.primary_key.columns)[0].name
+        self.foreign_keys = [
+            (column.name, fk.column.table.name)
+            for column in table.columns for fk in column.foreign_keys
+        ]
+        self.referenced = referenced
+        max_id = db.session.execute(select(func.max(table.c[self.pk]))).scalar()
+        # Ids are kept as exported when the target table is empty; otherwise new
+        # rows are numbered after the current maximum
+        self.preserve_ids = max_id is None
+        self.last_id = max_id or 0
+        # Single-column unique key (season year, team/conference/award/honor name):
+        # a row that already exists in the target is reused instead of inserted
+        self.natural_key = next(
+            (column.name for column in table.columns if column.unique and not column.primary_key), None
+        )
+        self.existing = {}
+        if self.natural_key and not self.preserve_ids:
+            self.existing = dict(db.session.execute(select(table.c[self.natural_key], table.c[self.pk])).all())
+        self.rows = 0
+        self.reused = 0
+        self.seconds = 0.0
+
+
+class SnapshotImporter:
+    """
+    Load an exported dynasty snapshot into the current database.
+
+    Rows are validated with the marshmallow snapshot schemas, foreign keys are
+    rewritten through in-memory old id -> new id maps built while the parent
+    tables are loaded, and each chunk is written with one Core executemany
+    insert. The whole import, derived tables included, is one transaction, so
+    a failure leaves the database as it was. Tables must arrive parents first,
+    as an export writes them.
+
+    Usage:
+        importer = SnapshotImporter()
+        report = importer.run(iter_ndjson_snapshot('dynasty.ndjson'))
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, dry_run: bool = False):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.id_maps = {}
+        self.states = {}
+        self.season_ids = set()
+        self.referenced_tables = {
+            fk.column.table.name for table in SNAPSHOT_TABLES.values() for fk in table.foreign_keys
+        }
+
+    def _state(self, name: str) -> _TableState:
+        state = self.states.get(name)
+        if state is None:
+            table = SNAPSHOT_TABLES.get(name)
+            if table is None:
+                raise ValueError(f"unknown table '{name}'")
+            state = _TableState(table, name in self.referenced_tables)
+            self.states[name] = state
+            self.id_maps.setdefault(name, {})
+        return state
+
+    def _prepare_chunk(self, state: _TableState, chunk: list) -> list:
+        """Validate a chunk of (row, line number) pairs and return the rows to insert, with ids remapped."""
+        name = state.table.name
+        raw_rows = [{key: value for key, value in row.items() if value is not None and value != ''} for row, _ in chunk]
+        try:
+            loaded = state.schema.load(raw_rows, many=True)
+        except ValidationError as e:
+            index, messages = next(iter(e.messages.items()))
+            raise ValueError(f"{name} line {chunk[index][1]}: {messages}")
+
+        inserts = []
+        id_map = self.id_maps[name]
+        for (_, line_number), data in zip(chunk, loaded):
+            row = {column.name: data.get(column.name) for column in state.table.columns}
+            for column, parent in state.foreign_keys:
+                old = row[column]
+                if old is None:
+                    continue
+                new = self.id_maps.get(parent, {}).get(old)
+                if new is None:
+                    raise ValueError(f"{name} line {line_number}: {column} {old} not found in {parent}")
+                row[column] = new
+            old_id = row[state.pk]
+            if state.natural_key:
+                existing_id = state.existing.get(row[state.natural_key])
+                if existing_id is not None:
+                    id_map[old_id] = existing_id
+                    state.reused += 1
+                    continue
+            if state.preserve_ids and old_id is not None:
+                new_id = old_id
+                state.last_id = max(state.last_id, old_id)
+            else:
+                state.last_id += 1
+                new_id = state.last_id
+            row[state.pk] = new_id
+            if state.referenced and old_id is not None:
+                id_map[old_id] = new_id
+            if 'season_id' in row and row['season_id'] is not None:
+                self.season_ids.add(row['season_id'])
+            inserts.append(row)
+        return inserts
+
+    def _flush(self, name: str, chunk: list) -> None:
+        if not chunk:
+            return
+        state = self.states[name]
+        start = time.perf_counter()
+        rows = self._prepare_chunk(state, chunk)
+        if rows and not self.dry_run:
+            try:
+                db.session.execute(state.table.insert(), rows)
+            except IntegrityError as e:
+                raise ValueError(f"{name} lines {chunk[0][1]}-{chunk[-1][1]}: {e.orig}")
+        state.rows += len(rows)
+        state.seconds += time.perf_counter() - start
+
+    def run(self, records) -> dict:
+        """
+        Import (table, row, line number) records, e.g. from iter_ndjson_snapshot.
+
+        Returns:
+            dict: Inserted and reused rows, seconds and rows per second per table
+            and in total. Raises ValueError on the first invalid row or chunk that
+            violates a constraint, after rolling back every row written before it.
+            Importing into a populated database merges by natural key (see
+            _TableState); rows that collide with existing ones, e.g. the
+            team_seasons of a season imported twice, fail the whole import.
+        """
+        start = time.perf_counter()
+        current, chunk = None, []
+        try:
+            for name, row, line_number in records:
+                if name != current or len(chunk) >= self.chunk_size:
+                    self._flush(current, chunk)
+                    current, chunk = name, []
+                    self._state(name)
+                chunk.append((row, line_number))
+            self._flush(current, chunk)
+
+            if not self.dry_run and self.states:
+                # Bulk inserts bypass the session hooks: bump every season and rebuild
+                # the derived standings, career totals and Elo ratings before the
+                # single commit
+                for season_id in sorted(self.season_ids):
+                    rebuild_season_standings(season_id)
+                rebuild_player_careers()
+                rebuild_elo_ratings()
+                bump_season_version()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        seconds = time.perf_counter() - start
+        total = sum(state.rows for state in self.states.values())
+        return {
+            'dry_run': self.dry_run,
+            'tables': {
+                name: {
+                    'rows': state.rows,
+                    'reused': state.reused,
+                    'seconds': round(state.seconds, 3),
+                    'rows_per_second': round(state.rows / state.seconds) if state.seconds else None
+                }
+                for name, state in self.states.items()
+            },
+            'rows': total,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(total / seconds) if seconds else None
+        }
+
+
+def import_snapshot(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, dry_run: bool = False) -> dict:
+    """Import an NDJSON export file, or a directory of per-table CSV files. Returns the importer report."""
+    records = iter_csv_snapshot(path) if os.path.isdir(path) else iter_ndjson_snapshot(path)
+    return SnapshotImporter(chunk_size=chunk_size, dry_run=dry_run).run(records)
+
+
+if __name__ == "__main__":
+    from app import create_db_app
+
+    parser = argparse.ArgumentParser(description="Load a dynasty snapshot (NDJSON export or CSV directory).")
+    parser.add_argument('snapshot', help="NDJSON file written by dynasty_export.py, or a directory of <table>.csv")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per insert statement")
+    parser.add_argument('--dry-run', action='store_true', help="Validate and resolve ids without writing")
+    parser.add_argument('--create-tables', action='store_true', help="Create missing tables first")
+    args = parser.parse_args()
+
+    app = create_db_app()
+    with app.app_context():
+        if args.create_tables:
+            db.create_all()
+        try:
+            report = import_snapshot(args.snapshot, chunk_size=args.chunk_size, dry_run=args.dry_run)
+        except ValueError as e:
+            sys.exit(f"Import failed: {e}")
+    print(json.dumps(report, indent=2))
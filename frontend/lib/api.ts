@@ -344,7 +344,7 @@ export async function declareAwardWinner(seasonId: number, awardId: number, play
 
 // GAMES
 export async function fetchGames() {
-  const response = await fetch(`${API_BASE_URL}/games`)
+  const response = await fetch(`${API_BASE_URL}/games?all=true`)
   if (!response.ok) throw new Error("Failed to fetch games")
   return response.json()
 }
@@ -472,7 +472,7 @@ export async function updatePlayerComprehensive(playerId: number, data: any): Pr
 }
 
 export async function fetchAllPlayersBySeason(seasonId: number) {
-  const response = await fetch(`${API_BASE_URL}/seasons/${seasonId}/players`);
+  const response = await fetch(`${API_BASE_URL}/seasons/${seasonId}/players?all=true`);
   if (!response.ok) throw new Error("Failed to fetch all players for season");
   return response.json();
 }
@@ -0,0 +1,195 @@
+import threading
+import time
+from collections import defaultdict, deque
+
+from flask import Blueprint, Response, current_app, g, has_request_context, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from routes import logger
+
+metrics_bp = Blueprint('metrics', __name__)
+
+METRIC_FIELDS = ('queries', 'sql_ms', 'serialize_ms', 'total_ms', 'response_bytes')
+
+
+class EndpointMetrics:
+    """
+    Rolling window of per-request samples keyed by endpoint.
+
+    Each endpoint keeps at most `window` recent samples so the percentiles
+    reflect current behaviour rather than the whole process lifetime.
+    """
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._totals = defaultdict(int)
+
+    def record(self, endpoint: str, sample: dict) -> None:
+        with self._lock:
+            self._samples[endpoint].append(sample)
+            self._totals[endpoint] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            samples = {endpoint: list(values) for endpoint, values in self._samples.items()}
+            totals = dict(self._totals)
+        return {
+            endpoint: {
+                'requests': totals[endpoint],
+                'window': len(values),
+                **{
+                    field: summarize([s[field] for s in values if s.get(field) is not None])
+                    for field in METRIC_FIELDS
+                }
+            }
+            for endpoint, values in sorted(samples.items())
+        }
+
+
+def percentile(sorted_values: list, pct: float):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(values: list) -> dict:
+    """Summarize a list of samples as p50/p95/p99/max."""
+    values = sorted(values)
+    if not values:
+        return {'p50': None, 'p95': None, 'p99': None, 'max': None}
+    return {
+        'p50': round(percentile(values, 50), 3),
+        'p95': round(percentile(values, 95), 3),
+        'p99': round(percentile(values, 99), 3),
+        'max': round(values[-1], 3)
+    }
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider that accumulates the time spent serializing responses on the request."""
+
+    def dumps(self, obj, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            if has_request_context() and hasattr(g, '_metrics'):
+                g._metrics['serialize_ms'] += (time.perf_counter() - start) * 1000
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # The start time lives on the statement's execution context (the connection
+    # only for the rare statement without one), so a statement that fails and
+    # never reaches _after_cursor_execute leaves nothing behind to skew later timings
+    if context is not None:
+        context._metrics_query_start = time.perf_counter()
+    else:
+        conn.info['_metrics_query_start'] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        start = getattr(context, '_metrics_query_start', None)
+    else:
+        start = conn.info.pop('_metrics_query_start', None)
+    if start is None:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if not has_request_context() or not hasattr(g, '_metrics'):
+        return
+    g._metrics['queries'] += 1
+    g._metrics['sql_ms'] += elapsed_ms
+    threshold = current_app.config.get('SLOW_QUERY_MS')
+    if threshold is not None and elapsed_ms >= threshold:
+        logger.warning(f"Slow query ({elapsed_ms:.1f} ms) in {request.method} {request.path}: {statement}")
+
+
+def _endpoint_key() -> str:
+    rule = request.url_rule.rule if request.url_rule else '<unmatched>'
+    return f"{request.method} {rule}"
+
+
+def _start_request() -> None:
+    g._metrics = {'queries': 0, 'sql_ms': 0.0, 'serialize_ms': 0.0, 'start': time.perf_counter()}
+
+
+def _finish_request(response: Response) -> Response:
+    metrics = g.pop('_metrics', None)
+    if metrics is None or request.blueprint == 'metrics':
+        return response
+    total_ms = (time.perf_counter() - metrics['start']) * 1000
+    # None for streamed and file responses, whose size is not known up front
+    response_bytes = response.calculate_content_length()
+    current_app.extensions['endpoint_metrics'].record(_endpoint_key(), {
+        'queries': metrics['queries'],
+        'sql_ms': metrics['sql_ms'],
+        'serialize_ms': metrics['serialize_ms'],
+        'total_ms': total_ms,
+        'response_bytes': response_bytes
+    })
+    response.headers['Server-Timing'] = (
+        f"db;desc=\"{metrics['queries']} queries\";dur={metrics['sql_ms']:.1f}, "
+        f"serialize;dur={metrics['serialize_ms']:.1f}, total;dur={total_ms:.1f}"
+    )
+    return response
+
+
+def init_instrumentation(app) -> None:
+    """
+    Enable per-request instrumentation on an app.
+
+    Records query count, SQL time, JSON serialization time, total time and
+    response size for every request, keyed by method and URL rule, and serves
+    rolling percentiles at /api/_metrics. Statements slower than
+    SLOW_QUERY_MS are logged through the routes logger.
+
+    Args:
+        app: Flask application to instrument
+
+    Note:
+        The cursor hooks are attached to the Engine class so they also cover
+        engines created lazily by Flask-SQLAlchemy. They only record while an
+        instrumented request is active.
+    """
+    app.config.setdefault('METRICS_WINDOW', 500)
+    app.config.setdefault('SLOW_QUERY_MS', 100)
+    app.extensions['endpoint_metrics'] = EndpointMetrics(app.config['METRICS_WINDOW'])
+    app.json = TimedJSONProvider(app)
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.register_blueprint(metrics_bp, url_prefix='/api')
+
+
+@metrics_bp.route('/_metrics', methods=['GET'])
+def get_metrics() -> Response:
+    """
+    Return rolling per-endpoint percentiles for query count, SQL time,
+    serialization time, total time and response size.
+    """
+    store = current_app.extensions['endpoint_metrics']
+    return jsonify({
+        'window': store.window,
+        'slow_query_ms': current_app.config.get('SLOW_QUERY_MS'),
+        'endpoints': store.snapshot()
+    })
+
+
+@metrics_bp.route('/_metrics', methods=['DELETE'])
+def reset_metrics() -> Response:
+    """Clear all recorded samples."""
+    current_app.extensions['endpoint_metrics'].reset()
+    return jsonify({'message': 'Metrics reset'})
@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import create_db_app
+from extensions import db
+from sqlalchemy import func, inspect
+
+app = create_db_app()
+
+
+def find_duplicate_keys(table, columns):
+    """Return the key tuples that appear more than once for the given columns."""
+    cols = [table.c[name] for name in columns]
+    rows = (
+        db.session.query(*cols, func.count().label('n'))
+        .group_by(*cols)
+        .having(func.count() > 1)
+        .all()
+    )
+    return [tuple(row[:-1]) for row in rows]
+
+
+def add_indexes():
+    """Create every index declared on the models that is missing from an existing database."""
+    created = 0
+    skipped = 0
+    with app.app_context():
+        inspector = inspect(db.engine)
+        existing_tables = set(inspector.get_table_names())
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {ix['name'] for ix in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda ix: ix.name):
+                if index.name in existing:
+                    continue
+                columns = [c.name for c in index.columns]
+                if index.unique:
+                    # A unique index cannot be built over duplicate natural keys
+                    duplicates = find_duplicate_keys(table, columns)
+                    if duplicates:
+                        print(f"Skipping {index.name}: {len(duplicates)} duplicate {tuple(columns)} keys in {table.name}, e.g. {duplicates[:5]}")
+                        skipped += 1
+                        continue
+                index.create(bind=db.engine)
+                print(f"Created {index.name} on {table.name}{tuple(columns)}")
+                created += 1
+        db.session.execute(db.text('ANALYZE'))
+        db.session.commit()
+    print(f"Created {created} indexes, skipped {skipped}")
+
+
+if __name__ == "__main__":
+    add_indexes()
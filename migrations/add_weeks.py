@@ -1,10 +1,12 @@
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from app import app
+from app import create_db_app
 from extensions import db
 from models import Season, Team, Game
 
+app = create_db_app()
+
 TOTAL_WEEKS = 17  # Final week number (0-17)
 
 
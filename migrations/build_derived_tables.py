@@ -0,0 +1,38 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import create_db_app
+from extensions import db
+from data_versions import bump_season_version
+from models import Season
+from utils_career import rebuild_player_careers
+from utils_standings import rebuild_season_standings
+from utils_ratings import rebuild_elo_ratings
+
+app = create_db_app()
+
+
+def build_derived_tables():
+    """
+    Create and fill the read-model tables maintained by the write endpoints, for
+    databases populated before those tables existed or outside the API:
+    player_careers from player_seasons, season_standings and team_power_ratings
+    from games. Safe to run again; every table is rebuilt from its source rows.
+    """
+    with app.app_context():
+        db.create_all()
+        rebuild_player_careers()
+        print("Rebuilt player_careers")
+        for season in Season.query.all():
+            rebuild_season_standings(season.season_id)
+        print("Rebuilt season_standings")
+        rebuild_elo_ratings()
+        print("Rebuilt team_power_ratings")
+        # player_careers and team_power_ratings are rebuilt with Core writes: bump
+        # every season so cached responses and ETags are dropped
+        bump_season_version()
+        db.session.commit()
+
+
+if __name__ == "__main__":
+    build_derived_tables()
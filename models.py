@@ -41,6 +41,11 @@ class Team(db.Model):
 
 class TeamSeason(db.Model):
     __tablename__ = 'team_seasons'
+    __table_args__ = (
+        db.Index('uq_team_seasons_season_team', 'season_id', 'team_id', unique=True),
+        db.Index('ix_team_seasons_team_season', 'team_id', 'season_id'),
+        db.Index('ix_team_seasons_season_conference', 'season_id', 'conference_id'),
+    )
     team_season_id = db.Column(db.Integer, primary_key=True)
     team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'), nullable=False)
     season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False)
@@ -97,6 +102,11 @@ class Player(db.Model):
 
 class PlayerSeason(db.Model):
     __tablename__ = 'player_seasons'
+    __table_args__ = (
+        db.Index('uq_player_seasons_player_season', 'player_id', 'season_id', unique=True),
+        db.Index('ix_player_seasons_season_team', 'season_id', 'team_id'),
+        db.Index('ix_player_seasons_team_season', 'team_id', 'season_id'),
+    )
     player_season_id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey('players.player_id'), nullable=False)
     season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False)
@@ -140,6 +150,12 @@ class PlayerSeason(db.Model):
 
 class Game(db.Model):
     __tablename__ = 'games'
+    __table_args__ = (
+        db.Index('ix_games_season_week', 'season_id', 'week'),
+        db.Index('ix_games_season_type', 'season_id', 'game_type'),
+        db.Index('ix_games_home_team', 'home_team_id', 'season_id'),
+        db.Index('ix_games_away_team', 'away_team_id', 'season_id'),
+    )
     game_id = db.Column(db.Integer, primary_key=True)
     season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False)
     week = db.Column(db.Integer, nullable=False)
@@ -153,6 +169,86 @@ class Game(db.Model):
     neutral_site = db.Column(db.Boolean, default=False)
 
 
+class SeasonStanding(db.Model):
+    # Game-derived record for a team in a season, maintained by utils_standings on every game write
+    __tablename__ = 'season_standings'
+    __table_args__ = (
+        db.Index('uq_season_standings_season_team', 'season_id', 'team_id', unique=True),
+        db.Index('ix_season_standings_team', 'team_id'),
+    )
+    standing_id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'), nullable=False)
+    wins = db.Column(db.Integer, default=0, nullable=False)
+    losses = db.Column(db.Integer, default=0, nullable=False)
+    conference_wins = db.Column(db.Integer, default=0, nullable=False)
+    conference_losses = db.Column(db.Integer, default=0, nullable=False)
+    points_for = db.Column(db.Integer, default=0, nullable=False)
+    points_against = db.Column(db.Integer, default=0, nullable=False)
+    streak = db.Column(db.Integer, default=0, nullable=False)  # +N = won last N, -N = lost last N
+
+
+class PlayerCareer(db.Model):
+    # Career totals per player across all seasons, maintained by utils_career when PlayerSeason stats change
+    __tablename__ = 'player_careers'
+    player_id = db.Column(db.Integer, db.ForeignKey('players.player_id'), primary_key=True, autoincrement=False)
+    seasons_played = db.Column(db.Integer, default=0, nullable=False)
+    first_season_id = db.Column(db.Integer)
+    last_season_id = db.Column(db.Integer)
+    team_ids = db.Column(db.String(128))  # Comma-separated ids of every team the player appeared for
+    games_played = db.Column(db.Integer, default=0, nullable=False)
+    completions = db.Column(db.Integer, default=0, nullable=False)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    pass_yards = db.Column(db.Integer, default=0, nullable=False)
+    pass_tds = db.Column(db.Integer, default=0, nullable=False)
+    interceptions = db.Column(db.Integer, default=0, nullable=False)
+    rush_attempts = db.Column(db.Integer, default=0, nullable=False)
+    rush_yards = db.Column(db.Integer, default=0, nullable=False)
+    rush_tds = db.Column(db.Integer, default=0, nullable=False)
+    longest_rush = db.Column(db.Integer, default=0, nullable=False)
+    rush_fumbles = db.Column(db.Integer, default=0, nullable=False)
+    receptions = db.Column(db.Integer, default=0, nullable=False)
+    rec_yards = db.Column(db.Integer, default=0, nullable=False)
+    rec_tds = db.Column(db.Integer, default=0, nullable=False)
+    longest_rec = db.Column(db.Integer, default=0, nullable=False)
+    rec_drops = db.Column(db.Integer, default=0, nullable=False)
+    tackles = db.Column(db.Integer, default=0, nullable=False)
+    tfl = db.Column(db.Integer, default=0, nullable=False)
+    sacks = db.Column(db.Integer, default=0, nullable=False)
+    forced_fumbles = db.Column(db.Integer, default=0, nullable=False)
+    def_tds = db.Column(db.Integer, default=0, nullable=False)
+
+
+class TeamPowerRating(db.Model):
+    # Elo rating after each week a team played (week 0 = season start), maintained by utils_ratings on game writes
+    __tablename__ = 'team_power_ratings'
+    __table_args__ = (
+        db.Index('uq_team_power_ratings_season_team_week', 'season_id', 'team_id', 'week', unique=True),
+    )
+    power_rating_id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'), nullable=False)
+    week = db.Column(db.Integer, nullable=False)
+    elo = db.Column(db.Float, nullable=False)
+
+
+class SeasonRanking(db.Model):
+    # Present when a season's TeamSeason.final_rank values were set on purpose (a manual edit or
+    # /teams/top25), which makes them authoritative for the stored rankings provider
+    __tablename__ = 'season_rankings'
+    season_ranking_id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False, unique=True)
+    source = db.Column(db.String(16), nullable=False)  # 'manual', or the /teams/top25 method
+
+
+class SeasonDataVersion(db.Model):
+    # Change counter per season, bumped by data_versions whenever that season's data is written.
+    # season_id 0 is the global scope for data shared by every season (teams, players, ...).
+    __tablename__ = 'season_data_versions'
+    season_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    version = db.Column(db.Integer, default=0, nullable=False)
+
+
 class Award(db.Model):
     __tablename__ = 'awards'
     award_id = db.Column(db.Integer, primary_key=True)
@@ -163,6 +259,10 @@ class Award(db.Model):
 
 class AwardWinner(db.Model):
     __tablename__ = 'award_winners'
+    __table_args__ = (
+        db.Index('ix_award_winners_season_award', 'season_id', 'award_id'),
+        db.Index('ix_award_winners_player', 'player_id'),
+    )
     award_winner_id = db.Column(db.Integer, primary_key=True)
     award_id = db.Column(db.Integer, db.ForeignKey('awards.award_id'), nullable=False)
     season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'), nullable=False)
@@ -190,6 +290,10 @@ class Honor(db.Model):
 # HonorWinner references Honor
 class HonorWinner(db.Model):
     __tablename__ = 'honor_winners'
+    __table_args__ = (
+        db.Index('ix_honor_winners_season_team', 'season_id', 'team_id'),
+        db.Index('ix_honor_winners_player', 'player_id'),
+    )
     honor_winner_id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey('players.player_id'), nullable=False)
     team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'), nullable=False)
@@ -200,6 +304,9 @@ class HonorWinner(db.Model):
 
 class Recruit(db.Model):
     __tablename__ = 'recruits'
+    __table_args__ = (
+        db.Index('ix_recruits_team_season', 'team_id', 'season_id'),
+    )
     recruit_id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(64), nullable=False)
     position = db.Column(db.String(8), nullable=False)
@@ -215,3 +322,23 @@ class Recruit(db.Model):
     season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'))
     committed = db.Column(db.Boolean, default=True)
     ovr_rating = db.Column(db.Integer, nullable=True)  # Optional overall rating
+
+
+# Committed transfers, activated as players during season progression
+class Transfer(db.Model):
+    __tablename__ = 'transfers'
+    transfer_id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(64), nullable=False)
+    position = db.Column(db.String(8), nullable=False)
+    previous_school = db.Column(db.String(64))
+    ovr_rating = db.Column(db.Integer)
+    recruit_stars = db.Column(db.Integer)  # NEW: star rating
+    recruit_rank_pos = db.Column(db.Integer)  # NEW: positional rank
+    dev_trait = db.Column(db.String(16))
+    height = db.Column(db.String(8))
+    weight = db.Column(db.Integer)
+    state = db.Column(db.String(2))
+    current_status = db.Column(db.String(8))
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'))
+    season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'))
+    committed = db.Column(db.Boolean, default=True)
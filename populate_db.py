@@ -1,8 +1,10 @@
-from app import app
+from app import create_db_app
 from extensions import db
 from models import Season, Conference, Team, TeamSeason, Award, Honor, Game
 import os
 
+app = create_db_app()
+
 
 def get_logo_filename(team_name):
     """Convert team name to logo filename format."""
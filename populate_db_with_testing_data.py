@@ -1,8 +1,13 @@
-from app import app
+from app import create_db_app
 from extensions import db
+from utils_career import rebuild_player_careers
+from utils_standings import rebuild_season_standings
+from utils_ratings import rebuild_elo_ratings
 from models import Season, Conference, Team, TeamSeason, Player, PlayerSeason, Game, Award, AwardWinner, Honor
 import random
 import os
+
+app = create_db_app()
 def backfill_all_season_games(tbd_team_id):
     """Ensure every season has a full 18-week schedule."""
     seasons = Season.query.all()
@@ -302,7 +307,7 @@ with app.app_context():
     # --- Add a random freshman recruit, a transfer, and a couple of players to the user team roster ---
     if user_team:
         # Add a random freshman recruit (committed)
-        from routes.recruiting import Recruit
+        from models import Recruit
         recruit = Recruit(
             name="Dylan Freshman",
             position="QB",
@@ -322,7 +327,7 @@ with app.app_context():
         db.session.add(recruit)
         db.session.flush()
         # Add a random transfer (committed)
-        from routes.transfer import Transfer
+        from models import Transfer
         transfer = Transfer(
             name="Marcus Transfer",
             position="RB",
@@ -626,4 +631,10 @@ with app.app_context():
         db.session.add(conf_off_player_of_week)
         db.session.add(conf_def_player_of_week)
         db.session.add(conf_all_team)
-    db.session.commit()
\ No newline at end of file
+    db.session.commit()
+    # Fill the read-model tables the write endpoints maintain
+    rebuild_player_careers()
+    for season in Season.query.all():
+        rebuild_season_standings(season.season_id)
+    rebuild_elo_ratings()
+    db.session.commit()
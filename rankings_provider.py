@@ -0,0 +1,152 @@
+import threading
+import time
+
+from flask import current_app, has_app_context
+from sqlalchemy import select
+
+from extensions import db
+from models import SeasonRanking, TeamSeason
+from routes import logger
+
+TOP_25 = 25
+# After a failed fetch the HTTP provider answers from its cache or fallback
+# without calling the service for this long
+FAILURE_COOLDOWN_SECONDS = 60.0
+
+
+class RankingsProvider:
+    """Source of a season's Top 25 for update_teamseason_stats_for_season."""
+
+    def top_25(self, season_id: int) -> dict:
+        """Return {team_id: rank} for the ranked teams of a season, empty when none are known."""
+        raise NotImplementedError
+
+
+class StoredRankingsProvider(RankingsProvider):
+    """
+    In-process rankings computed from the database.
+
+    The stored final_rank values are authoritative only when they were set on
+    purpose, by a manual edit or /teams/top25 (see mark_rankings_set). Otherwise
+    the Top 25 is ranked by power rating ('srs' or 'elo', see utils_ratings),
+    so the ranks update_stats writes back are never read back as input. Before
+    any game of the season is played there is nothing to rate, and the stored
+    values (e.g. the ranks create_season carries over) are kept. Pass
+    method=None to always use the stored values.
+    """
+
+    def __init__(self, method: str = 'srs'):
+        self.method = method
+
+    def _stored(self, season_id: int) -> dict:
+        return dict(db.session.execute(
+            select(TeamSeason.team_id, TeamSeason.final_rank)
+            .where(TeamSeason.season_id == season_id, TeamSeason.final_rank.isnot(None))
+        ).all())
+
+    def top_25(self, season_id: int) -> dict:
+        if self.method is None or rankings_are_set(season_id):
+            return self._stored(season_id)
+        from utils_ratings import compute_power_ratings
+        teams = compute_power_ratings(season_id)['teams']
+        if not any(team['wins'] or team['losses'] for team in teams):
+            return self._stored(season_id)
+        return {team['team_id']: team[f"{self.method}_rank"] for team in teams if team[f"{self.method}_rank"] <= TOP_25}
+
+
+class HttpRankingsProvider(RankingsProvider):
+    """
+    Rankings from an HTTP service returning [{'team_id': ..., 'rank': ...}, ...]
+    for GET <url>?season=<season_id>.
+
+    Each attempt is bounded by `timeout` seconds and a fetch makes at most
+    1 + `retries` attempts. The last good answer per season is kept in memory.
+    When a fetch fails, that answer is returned, or the fallback provider's
+    answer if there is none, and the service is not called again for
+    FAILURE_COOLDOWN_SECONDS, so a stopped service costs one bounded wait per
+    cooldown instead of one per request.
+    """
+
+    def __init__(self, url: str, timeout: float = 1.0, retries: int = 1, fallback: RankingsProvider = None):
+        self.url = url
+        self.timeout = timeout
+        self.retries = retries
+        self.fallback = fallback
+        self._lock = threading.Lock()
+        self._last_good = {}
+        self._retry_after = 0.0
+
+    def _fetch(self, season_id: int) -> dict:
+        import requests  # Imported here so startup does not pay for the HTTP client
+        last_error = None
+        for _ in range(1 + self.retries):
+            try:
+                resp = requests.get(self.url, params={'season': season_id}, timeout=self.timeout)
+                resp.raise_for_status()
+                return {
+                    entry['team_id']: entry['rank'] for entry in resp.json()
+                    if isinstance(entry, dict) and 'team_id' in entry and 'rank' in entry
+                }
+            except (requests.RequestException, ValueError, TypeError) as e:
+                last_error = e
+        raise RuntimeError(f"rankings fetch from {self.url} failed: {last_error}")
+
+    def top_25(self, season_id: int) -> dict:
+        if time.monotonic() >= self._retry_after:
+            try:
+                ranks = self._fetch(season_id)
+            except RuntimeError as e:
+                logger.warning(f"{e}; using the last good rankings for {FAILURE_COOLDOWN_SECONDS:.0f}s")
+                self._retry_after = time.monotonic() + FAILURE_COOLDOWN_SECONDS
+            else:
+                with self._lock:
+                    self._last_good[season_id] = ranks
+                return ranks
+        with self._lock:
+            cached = self._last_good.get(season_id)
+        if cached is not None:
+            return cached
+        return self.fallback.top_25(season_id) if self.fallback else {}
+
+
+def mark_rankings_set(season_id: int, source: str) -> None:
+    """
+    Record that a season's final_rank values were set on purpose ('manual', or the
+    /teams/top25 method), so the stored provider returns them as they are.
+    The caller is responsible for committing the session.
+    """
+    ranking = SeasonRanking.query.filter_by(season_id=season_id).first()
+    if ranking is None:
+        db.session.add(SeasonRanking(season_id=season_id, source=source))
+    else:
+        ranking.source = source
+
+
+def rankings_are_set(season_id: int) -> bool:
+    return db.session.execute(
+        select(SeasonRanking.season_id).where(SeasonRanking.season_id == season_id)
+    ).first() is not None
+
+
+def init_rankings_provider(app) -> None:
+    """
+    Select the app's rankings provider from RANKINGS_PROVIDER: 'stored' (default,
+    no network) or 'http' (RANKINGS_URL, RANKINGS_TIMEOUT_SECONDS,
+    RANKINGS_RETRIES, falling back to the stored rankings).
+    """
+    stored = StoredRankingsProvider()
+    if app.config.get('RANKINGS_PROVIDER', 'stored') == 'http':
+        app.extensions['rankings_provider'] = HttpRankingsProvider(
+            app.config['RANKINGS_URL'],
+            timeout=app.config.get('RANKINGS_TIMEOUT_SECONDS', 1.0),
+            retries=app.config.get('RANKINGS_RETRIES', 1),
+            fallback=stored
+        )
+    else:
+        app.extensions['rankings_provider'] = stored
+
+
+def get_rankings_provider() -> RankingsProvider:
+    """The current app's provider, or the stored rankings outside an app that set one up."""
+    provider = current_app.extensions.get('rankings_provider') if has_app_context() else None
+    return provider or StoredRankingsProvider()
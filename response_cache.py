@@ -0,0 +1,232 @@
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Blueprint, Response, current_app, has_app_context, jsonify, make_response, request
+
+from data_versions import GLOBAL_SCOPE, on_data_committed
+
+cache_bp = Blueprint('response_cache', __name__)
+
+# Fixed per-entry overhead added to the payload size when enforcing the memory bound
+ENTRY_OVERHEAD_BYTES = 512
+
+
+def season_tag(season_id) -> str:
+    return f"season:{season_id}"
+
+
+def team_tag(team_id) -> str:
+    return f"team:{team_id}"
+
+
+class ResponseCache:
+    """
+    Memory-bounded LRU of rendered responses, keyed by endpoint and arguments.
+
+    Every entry carries a set of tags (season:<id>, team:<id>). Invalidating a
+    tag drops every entry that carries it. Entries are evicted least recently
+    used first once the stored payloads exceed max_bytes; a single response
+    larger than a quarter of the bound is never stored.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_tag = {}
+        self._bytes = 0
+        # Bumped by every invalidation, so a response computed from data that was
+        # replaced while the view ran is not stored
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, body: bytes, status: int, mimetype: str, tags, generation: int) -> bool:
+        size = len(body) + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes // 4:
+            return False
+        with self._lock:
+            if generation != self.generation:
+                return False
+            self._remove(key)
+            self._entries[key] = {'body': body, 'status': status, 'mimetype': mimetype, 'tags': set(tags), 'size': size}
+            self._bytes += size
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def _remove(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry['size']
+        for tag in entry['tags']:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def invalidate(self, tags) -> int:
+        """Drop every entry carrying any of the tags. Returns the number of entries dropped."""
+        with self._lock:
+            self.generation += 1
+            keys = set()
+            for tag in tags:
+                keys |= self._keys_by_tag.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every entry with a tag starting with prefix, e.g. 'team:'."""
+        with self._lock:
+            tags = [tag for tag in self._keys_by_tag if tag.startswith(prefix)]
+        return self.invalidate(tags)
+
+    def clear(self) -> int:
+        with self._lock:
+            self.generation += 1
+            count = len(self._entries)
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._bytes = 0
+            self.invalidations += count
+            return count
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+def _invalidate_committed(scopes, team_ids) -> None:
+    # Commits run inside the app context that owns the session, so only that
+    # app's cache is affected
+    if not has_app_context():
+        return
+    cache = current_app.extensions.get('response_cache')
+    if cache is None:
+        return
+    if GLOBAL_SCOPE in scopes:
+        cache.clear()
+        return
+    cache.invalidate([season_tag(season_id) for season_id in scopes])
+    if team_ids is None:
+        # Bulk writes do not say which teams they touched
+        cache.invalidate_prefix('team:')
+    else:
+        cache.invalidate([team_tag(team_id) for team_id in team_ids])
+
+
+def init_response_cache(app) -> None:
+    """
+    Enable the response cache on an app and serve its counters at /api/_cache.
+
+    Args:
+        app: Flask application
+
+    Note:
+        Entries are invalidated when a transaction that changed tracked data
+        commits in this process (see data_versions.on_data_committed). Writes made
+        by other processes, e.g. several server workers or a populate script run
+        against a live database, are not seen; set RESPONSE_CACHE_MAX_BYTES=0 to
+        disable the cache in that setup.
+    """
+    max_bytes = app.config.get('RESPONSE_CACHE_MAX_BYTES', 0)
+    if max_bytes > 0:
+        app.extensions['response_cache'] = ResponseCache(max_bytes)
+        on_data_committed(_invalidate_committed)
+    app.register_blueprint(cache_bp, url_prefix='/api')
+
+
+def cached_response(tags):
+    """
+    Decorator for read-only GET endpoints whose response can be reused until
+    the data it was built from changes.
+
+    Args:
+        tags: Callable taking the view's keyword arguments and returning the
+            tags (see season_tag/team_tag) of the data the response depends on.
+            It is only called on a miss, after the view has run.
+
+    Note:
+        The key is the endpoint, its URL arguments and the query string. Only
+        200 responses are stored. Views that write to the database must not be
+        cached.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = current_app.extensions.get('response_cache')
+            if cache is None:
+                return view(*args, **kwargs)
+            key = (
+                request.endpoint,
+                tuple(sorted(kwargs.items())),
+                tuple(sorted(request.args.items(multi=True)))
+            )
+            entry = cache.get(key)
+            if entry is not None:
+                response = current_app.response_class(entry['body'], status=entry['status'], mimetype=entry['mimetype'])
+                response.headers['X-Cache'] = 'HIT'
+                return response
+            generation = cache.generation
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                cache.set(key, response.get_data(), response.status_code, response.mimetype, tags(**kwargs), generation)
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+
+@cache_bp.route('/_cache', methods=['GET'])
+def get_cache_stats() -> Response:
+    """Return response cache size and hit/miss/eviction counters."""
+    cache = current_app.extensions.get('response_cache')
+    if cache is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **cache.stats()})
+
+
+@cache_bp.route('/_cache', methods=['DELETE'])
+def clear_cache() -> Response:
+    """Drop every cached response and reset the counters."""
+    cache = current_app.extensions.get('response_cache')
+    if cache is None:
+        return jsonify({'enabled': False})
+    dropped = cache.clear()
+    cache.reset_counters()
+    return jsonify({'message': 'Response cache cleared', 'dropped': dropped})
@@ -1,9 +1,45 @@
 from flask import Blueprint, request, jsonify
 from extensions import db
-from models import Award, AwardWinner, Player, Team
+from models import Award, AwardWinner, Player, Team, Season
+from data_versions import season_etag
 
 awards_bp = Blueprint('awards', __name__)
 
+
+def query_award_winners(*criteria):
+    """
+    Build a single joined query for award winners and everything needed to display them.
+    Yields (AwardWinner, Award, player_name, Team, season_year) rows in award_winner_id order.
+    """
+    return (
+        db.session.query(AwardWinner, Award, Player.name, Team, Season.year)
+        .outerjoin(Award, AwardWinner.award_id == Award.award_id)
+        .outerjoin(Player, AwardWinner.player_id == Player.player_id)
+        .outerjoin(Team, AwardWinner.team_id == Team.team_id)
+        .outerjoin(Season, AwardWinner.season_id == Season.season_id)
+        .filter(*criteria)
+        .order_by(AwardWinner.award_winner_id)
+    )
+
+
+def serialize_award_winner(aw, award, player_name, team, season_year):
+    """Serialize one row of query_award_winners."""
+    return {
+        'award_winner_id': aw.award_winner_id,
+        'award_id': aw.award_id,
+        'award_name': award.name if award else None,
+        'award_description': award.description if award else None,
+        'has_winner': True,
+        'player_name': player_name,
+        'player_id': aw.player_id,
+        'team_name': team.name if team else None,
+        'team_id': aw.team_id,
+        'team_logo_url': team.logo_url if team else None,
+        'season_id': aw.season_id,
+        'season_year': season_year
+    }
+
+
 @awards_bp.route('/awards', methods=['GET'])
 def get_awards():
     awards = Award.query.all()
@@ -42,21 +78,19 @@ def delete_award(award_id):
     return jsonify({'message': 'Award deleted successfully'})
 
 @awards_bp.route('/seasons/<int:season_id>/awards', methods=['GET'])
+@season_etag
 def get_award_winners_by_season(season_id):
-    winners = AwardWinner.query.filter_by(season_id=season_id).all()
     result = []
-    for w in winners:
-        player = Player.query.get(w.player_id)
-        team = Team.query.get(w.team_id)
-        award = Award.query.get(w.award_id)
+    for row in query_award_winners(AwardWinner.season_id == season_id).all():
+        winner = serialize_award_winner(*row)
         result.append({
-            'award_winner_id': w.award_winner_id,
-            'award': award.name,
-            'player': player.name,
-            'player_id': player.player_id,
-            'team': team.name,
-            'team_id': team.team_id,
-            'team_logo_url': team.logo_url
+            'award_winner_id': winner['award_winner_id'],
+            'award': winner['award_name'],
+            'player': winner['player_name'],
+            'player_id': winner['player_id'],
+            'team': winner['team_name'],
+            'team_id': winner['team_id'],
+            'team_logo_url': winner['team_logo_url']
         })
     return jsonify(result)
 
@@ -74,14 +108,17 @@ def update_award_winner(award_winner_id):
     return jsonify({'message': 'Award winner updated successfully'})
 
 @awards_bp.route('/seasons/<int:season_id>/awards/all', methods=['GET'])
+@season_etag
 def get_all_awards_for_season(season_id):
     """Get all available awards for a season, with winners if they exist"""
     # Get all awards
     all_awards = Award.query.all()
     
-    # Get existing winners for this season
-    winners = AwardWinner.query.filter_by(season_id=season_id).all()
-    winners_by_award = {w.award_id: w for w in winners}
+    # Get existing winners for this season, with player/team details in the same query
+    winners_by_award = {
+        row[0].award_id: serialize_award_winner(*row)
+        for row in query_award_winners(AwardWinner.season_id == season_id).all()
+    }
     
     result = []
     for award in all_awards:
@@ -89,20 +126,7 @@ def get_all_awards_for_season(season_id):
         
         if winner:
             # Award has a winner
-            player = Player.query.get(winner.player_id)
-            team = Team.query.get(winner.team_id)
-            result.append({
-                'award_id': award.award_id,
-                'award_name': award.name,
-                'award_description': award.description,
-                'has_winner': True,
-                'award_winner_id': winner.award_winner_id,
-                'player_name': player.name if player else None,
-                'player_id': winner.player_id,
-                'team_name': team.name if team else None,
-                'team_id': winner.team_id,
-                'team_logo_url': team.logo_url if team else None
-            })
+            result.append(winner)
         else:
             # Award has no winner yet
             result.append({
@@ -131,7 +155,7 @@ def create_award_winner(season_id, award_id):
         return jsonify({'error': 'player_id and team_id are required'}), 400
     
     # Check if award exists
-    award = Award.query.get_or_404(award_id)
+    Award.query.get_or_404(award_id)
     
     # Check if winner already exists for this award and season
     existing_winner = AwardWinner.query.filter_by(
@@ -154,18 +178,5 @@ def create_award_winner(season_id, award_id):
     db.session.commit()
     
     # Return the created award winner with full details
-    player = Player.query.get(player_id)
-    team = Team.query.get(team_id)
-    
-    return jsonify({
-        'award_winner_id': award_winner.award_winner_id,
-        'award_id': award_id,
-        'award_name': award.name,
-        'award_description': award.description,
-        'has_winner': True,
-        'player_name': player.name if player else None,
-        'player_id': player_id,
-        'team_name': team.name if team else None,
-        'team_id': team_id,
-        'team_logo_url': team.logo_url if team else None
-    }), 201 
\ No newline at end of file
+    row = query_award_winners(AwardWinner.award_winner_id == award_winner.award_winner_id).one()
+    return jsonify(serialize_award_winner(*row)), 201 
\ No newline at end of file
@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify
 from extensions import db
 from models import Player, PlayerSeason
+from utils_career import refresh_player_careers
+from utils_leaderboards import compute_career_leaders, parse_leaderboard_args
 
 career_bp = Blueprint('career', __name__)
 
@@ -25,5 +27,48 @@ def update_career_progress(player_id):
         ps.ovr_rating = ovr_rating
         ps.player_class = player_class
         updated.append({'season_id': season_id, 'ovr_rating': ovr_rating})
+    refresh_player_careers([player_id])
     db.session.commit()
-    return jsonify({'updated': updated}), 201 
\ No newline at end of file
+    return jsonify({'updated': updated}), 201 
+
+@career_bp.route('/leaders/career', methods=['GET'])
+def get_career_leaders():
+    """
+    All-time leaderboard for one stat across every season of the dynasty.
+
+    Query Parameters:
+        stat (str): Career stat column (rush_yards, tackles, ...) or a rate:
+            completion_pct, yards_per_attempt, yards_per_carry (default rush_yards)
+        limit (int, optional): Number of leaders (default 25)
+        team_id (int, optional): Only count seasons played for this team
+        position (str, optional): Only rank players at this position
+        season_min (int, optional): First season id to count
+        season_max (int, optional): Last season id to count
+        min_attempts (int, optional): Career pass attempts to qualify for passing rates (default 200)
+        min_rush_attempts (int, optional): Career carries to qualify for yards per carry (default 100)
+
+    Returns:
+        Response: JSON object with stat, label and leaders (player_id, name,
+        position, seasons_played, team_ids, value), best first.
+
+    Raises:
+        400: If the stat or another query parameter is invalid
+    """
+    season_min = request.args.get('season_min', type=int)
+    season_max = request.args.get('season_max', type=int)
+    if season_min is not None and season_max is not None and season_min > season_max:
+        return jsonify({'error': 'season_min must not be greater than season_max'}), 400
+    try:
+        k, qualifiers = parse_leaderboard_args(default_limit=25)
+        result = compute_career_leaders(
+            request.args.get('stat', 'rush_yards'),
+            k=k,
+            qualifiers=qualifiers,
+            team_id=request.args.get('team_id', type=int),
+            position=request.args.get('position'),
+            season_min=season_min,
+            season_max=season_max
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(result)
@@ -0,0 +1,27 @@
+from flask import Blueprint, Response, request, stream_with_context
+from dynasty_export import DEFAULT_BATCH_SIZE, iter_export_lines
+
+export_bp = Blueprint('export', __name__)
+
+@export_bp.route('/export', methods=['GET'])
+def export_dynasty() -> Response:
+    """
+    Stream the whole dynasty as newline-delimited JSON.
+
+    Query Parameters:
+        batch_size (int, optional): Rows fetched per database round trip (default 1000)
+
+    Returns:
+        Response: application/x-ndjson stream. The first line is
+        {"table": "_meta", "row": {format_version, exported_at, tables}}, then one
+        {"table": name, "row": {...}} line per row of every table listed in
+        dynasty_export.EXPORT_TABLES, in that order.
+    """
+    batch_size = request.args.get('batch_size', DEFAULT_BATCH_SIZE, type=int)
+    if batch_size < 1:
+        batch_size = DEFAULT_BATCH_SIZE
+    return Response(
+        stream_with_context(iter_export_lines(batch_size)),
+        mimetype='application/x-ndjson',
+        headers={'Content-Disposition': 'attachment; filename=dynasty_export.ndjson'}
+    )
@@ -4,10 +4,15 @@ from models import Game, TeamSeason, Conference, Team
 from routes import logger
 from typing import Dict, List, Any, Optional, Union
 from utils import update_teamseason_ppg_for_team
+from utils_standings import refresh_team_standings
+from utils_ratings import refresh_elo_ratings
+from data_versions import season_etag
+from utils_pagination import ListArgs, paginated_response
 
 games_bp = Blueprint('games', __name__)
 
 @games_bp.route('/games/<int:season_id>', methods=['GET'])
+@season_etag
 def get_games_for_season(season_id: int) -> Response:
     """
     Retrieve all games for a specific season.
@@ -74,6 +79,8 @@ def create_game(season_id: int) -> Response:
         playoff_round=playoff_round
     )
     db.session.add(game)
+    db.session.flush()
+    refresh_team_standings(season_id, [home_team_id, away_team_id])
     db.session.commit()
     
     return jsonify({
@@ -110,6 +117,8 @@ def update_game(game_id: int) -> Response:
     """
     game = Game.query.get_or_404(game_id)
     data = request.json
+    # Teams on the game before the edit also need their standings refreshed
+    previous_team_ids = {game.home_team_id, game.away_team_id}
     
     if 'home_score' in data:
         game.home_score = data['home_score']
@@ -126,6 +135,8 @@ def update_game(game_id: int) -> Response:
     if 'overtime' in data:
         game.overtime = data['overtime']
     
+    refresh_team_standings(game.season_id, previous_team_ids | {game.home_team_id, game.away_team_id})
+    refresh_elo_ratings(game.season_id, from_week=game.week)
     db.session.commit()
 
     # Update PPG/PAPG for both teams in this game for the season
@@ -151,11 +162,16 @@ def delete_game(game_id: int) -> Response:
         404: If game is not found
     """
     game = Game.query.get_or_404(game_id)
+    season_id, week, team_ids = game.season_id, game.week, [game.home_team_id, game.away_team_id]
     db.session.delete(game)
+    db.session.flush()
+    refresh_team_standings(season_id, team_ids)
+    refresh_elo_ratings(season_id, from_week=week)
     db.session.commit()
     return jsonify({'message': 'Game deleted successfully'})
 
 @games_bp.route('/games/<int:season_id>/week/<int:week>', methods=['GET'])
+@season_etag
 def get_games_for_week(season_id: int, week: int) -> Response:
     """
     Retrieve all games for a specific week in a specific season.
@@ -183,6 +199,7 @@ def get_games_for_week(season_id: int, week: int) -> Response:
     } for g in games])
 
 @games_bp.route('/seasons/<int:season_id>/games', methods=['GET'])
+@season_etag
 def get_games_in_season(season_id: int) -> Response:
     """
     Retrieve games for a specific season with enhanced information.
@@ -309,20 +326,57 @@ def get_game_details(game_id: int) -> Response:
         'overtime': game.overtime
     })
 
+GAME_FIELDS = (
+    'game_id', 'season_id', 'week', 'home_team_id', 'away_team_id', 'home_score',
+    'away_score', 'game_type', 'playoff_round', 'neutral_site', 'overtime'
+)
+
 @games_bp.route('/games', methods=['GET'])
 def get_all_games() -> Response:
     """
-    Retrieve all games in the system.
+    Retrieve games across all seasons, one page at a time.
     
+    Query Parameters:
+        season_id (int, optional): Only games in this season
+        team_id (int, optional): Only games where this team is home or away
+        week_min (int, optional): Only games in this week or later
+        week_max (int, optional): Only games in this week or earlier
+        game_type (str, optional): Only games of this type, e.g. 'Regular'
+        limit, cursor, fields, all: See utils_pagination.ListArgs
+        
     Returns:
-        Response: JSON array containing all games with comprehensive information
-        including game_id, season_id, week, home_team_id, away_team_id,
-        home_score, away_score, game_type, playoff_round, neutral_site status,
-        and overtime status.
+        Response: {'items': [...], 'next_cursor': ...} ordered by season_id,
+        week and game_id, or a plain JSON array of every matching game with
+        all=true. Each game has game_id, season_id, week, home_team_id,
+        away_team_id, home_score, away_score, game_type, playoff_round,
+        neutral_site status, and overtime status.
+        
+    Raises:
+        400: If limit, cursor or fields is invalid
     """
-    games = Game.query.all()
-    return jsonify([
-        {
+    try:
+        args = ListArgs(GAME_FIELDS, key_size=3)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    query = Game.query
+    season_id = request.args.get('season_id', type=int)
+    if season_id is not None:
+        query = query.filter(Game.season_id == season_id)
+    team_id = request.args.get('team_id', type=int)
+    if team_id is not None:
+        query = query.filter((Game.home_team_id == team_id) | (Game.away_team_id == team_id))
+    week_min = request.args.get('week_min', type=int)
+    if week_min is not None:
+        query = query.filter(Game.week >= week_min)
+    week_max = request.args.get('week_max', type=int)
+    if week_max is not None:
+        query = query.filter(Game.week <= week_max)
+    game_type = request.args.get('game_type')
+    if game_type:
+        query = query.filter(Game.game_type == game_type)
+
+    def serialize(g):
+        return {
             'game_id': g.game_id,
             'season_id': g.season_id,
             'week': g.week,
@@ -334,6 +388,6 @@ def get_all_games() -> Response:
             'playoff_round': g.playoff_round,
             'neutral_site': g.neutral_site,
             'overtime': g.overtime
-        }
-        for g in games
-    ])
\ No newline at end of file
+        }, (g.season_id, g.week, g.game_id)
+
+    return paginated_response(query, (Game.season_id, Game.week, Game.game_id), serialize, args)
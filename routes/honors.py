@@ -1,9 +1,46 @@
 from flask import Blueprint, request, jsonify, Response
 from extensions import db
 from models import Honor, Player, Team, Season, HonorWinner, Conference
+from data_versions import season_etag
+from utils_pagination import ListArgs, paginated_response
 
 honors_bp = Blueprint('honors', __name__)
 
+
+def query_honor_winners(*criteria):
+    """
+    Build a single joined query for honor winners and everything needed to display them.
+    Yields (HonorWinner, player_name, team_name, season_year, Honor) rows in honor_winner_id order.
+    """
+    return (
+        db.session.query(HonorWinner, Player.name, Team.name, Season.year, Honor)
+        .outerjoin(Player, HonorWinner.player_id == Player.player_id)
+        .outerjoin(Team, HonorWinner.team_id == Team.team_id)
+        .outerjoin(Season, HonorWinner.season_id == Season.season_id)
+        .outerjoin(Honor, HonorWinner.honor_id == Honor.honor_id)
+        .filter(*criteria)
+        .order_by(HonorWinner.honor_winner_id)
+    )
+
+
+def serialize_honor_winner(hw, player_name, team_name, season_year, honor) -> dict:
+    """Serialize one row of query_honor_winners."""
+    return {
+        'honor_winner_id': hw.honor_winner_id,
+        'player_id': hw.player_id,
+        'player_name': player_name,
+        'team_id': hw.team_id,
+        'team_name': team_name,
+        'season_id': hw.season_id,
+        'season_year': season_year,
+        'honor_id': hw.honor_id,
+        'honor_name': honor.name if honor else None,
+        'honor_side': honor.side if honor else None,
+        'honor_conference_id': honor.conference_id if honor else None,
+        'week': hw.week
+    }
+
+
 @honors_bp.route('/honors/types', methods=['POST'])
 def create_honor_type() -> Response:
     data = request.json
@@ -37,16 +74,19 @@ def create_honor_type() -> Response:
 
 @honors_bp.route('/honors/types', methods=['GET'])
 def get_honor_types() -> Response:
-    honors = Honor.query.all()
+    query = (
+        db.session.query(Honor, Conference.name)
+        .outerjoin(Conference, Honor.conference_id == Conference.conference_id)
+    )
     return jsonify([
         {
             'honor_id': h.honor_id,
             'name': h.name,
             'side': h.side,
             'conference_id': h.conference_id,
-            'conference_name': Conference.query.get(h.conference_id).name if h.conference_id else None
+            'conference_name': conference_name if h.conference_id else None
         }
-        for h in honors
+        for h, conference_name in query.all()
     ])
 
 @honors_bp.route('/honors/types/<int:honor_id>', methods=['PUT'])
@@ -130,55 +170,77 @@ def add_honors(season_id: int, team_id: int) -> Response:
     return jsonify({'created_honor_winner_ids': created}), 201
 
 @honors_bp.route('/seasons/<int:season_id>/teams/<int:team_id>/honors', methods=['GET'])
+@season_etag
 def get_honors(season_id: int, team_id: int) -> Response:
-    honor_winners = HonorWinner.query.filter_by(season_id=season_id, team_id=team_id).all()
+    query = (
+        db.session.query(HonorWinner, Honor.name)
+        .outerjoin(Honor, HonorWinner.honor_id == Honor.honor_id)
+        .filter(HonorWinner.season_id == season_id, HonorWinner.team_id == team_id)
+    )
     return jsonify([
         {
             'honor_winner_id': hw.honor_winner_id, 
             'player_id': hw.player_id, 
             'honor_id': hw.honor_id,
             'week': hw.week,
-            'honor_name': Honor.query.get(hw.honor_id).name if hw.honor_id else None
+            'honor_name': honor_name if hw.honor_id else None
         }
-        for hw in honor_winners
+        for hw, honor_name in query.all()
     ])
 
+HONOR_WINNER_FIELDS = (
+    'honor_winner_id', 'player_id', 'player_name', 'team_id', 'team_name', 'season_id', 'season_year',
+    'honor_id', 'honor_name', 'honor_side', 'honor_conference_id', 'week'
+)
+
 @honors_bp.route('/honors', methods=['GET'])
 def get_all_honors() -> Response:
-    honor_winners = HonorWinner.query.all()
-    return jsonify([
-        {
-            'honor_winner_id': hw.honor_winner_id,
-            'player_id': hw.player_id,
-            'player_name': Player.query.get(hw.player_id).name if hw.player_id else None,
-            'team_id': hw.team_id,
-            'team_name': Team.query.get(hw.team_id).name if hw.team_id else None,
-            'season_id': hw.season_id,
-            'season_year': Season.query.get(hw.season_id).year if hw.season_id else None,
-            'honor_id': hw.honor_id,
-            'honor_name': Honor.query.get(hw.honor_id).name if hw.honor_id else None,
-            'week': hw.week
-        }
-        for hw in honor_winners
-    ])
+    """
+    Retrieve honor winners across all seasons, one page at a time, in honor_winner_id order.
+
+    Query Parameters:
+        season_id, team_id, honor_id (int, optional): Filter on the winner row
+        week_min, week_max (int, optional): Week range, inclusive
+        position (str, optional): Only winners whose player plays this position
+        limit, cursor, fields, all: See utils_pagination.ListArgs
+
+    Returns:
+        Response: {'items': [...], 'next_cursor': ...}, or a plain JSON array of
+        every matching winner with all=true
+    """
+    try:
+        args = ListArgs(HONOR_WINNER_FIELDS, key_size=1)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    criteria = []
+    for name, column in (
+        ('season_id', HonorWinner.season_id),
+        ('team_id', HonorWinner.team_id),
+        ('honor_id', HonorWinner.honor_id)
+    ):
+        value = request.args.get(name, type=int)
+        if value is not None:
+            criteria.append(column == value)
+    week_min = request.args.get('week_min', type=int)
+    if week_min is not None:
+        criteria.append(HonorWinner.week >= week_min)
+    week_max = request.args.get('week_max', type=int)
+    if week_max is not None:
+        criteria.append(HonorWinner.week <= week_max)
+    position = request.args.get('position')
+    if position:
+        criteria.append(Player.position == position)
+    return paginated_response(
+        query_honor_winners(*criteria),
+        (HonorWinner.honor_winner_id,),
+        lambda row: (serialize_honor_winner(*row), (row[0].honor_winner_id,)),
+        args
+    )
 
 @honors_bp.route('/seasons/<int:season_id>/honors', methods=['GET'])
+@season_etag
 def get_honors_by_season(season_id: int) -> Response:
-    honor_winners = HonorWinner.query.filter_by(season_id=season_id).all()
     return jsonify([
-        {
-            'honor_winner_id': hw.honor_winner_id,
-            'player_id': hw.player_id,
-            'player_name': Player.query.get(hw.player_id).name if hw.player_id else None,
-            'team_id': hw.team_id,
-            'team_name': Team.query.get(hw.team_id).name if hw.team_id else None,
-            'season_id': hw.season_id,
-            'season_year': Season.query.get(hw.season_id).year if hw.season_id else None,
-            'honor_id': hw.honor_id,
-            'honor_name': Honor.query.get(hw.honor_id).name if hw.honor_id else None,
-            'honor_side': Honor.query.get(hw.honor_id).side if hw.honor_id else None,
-            'honor_conference_id': Honor.query.get(hw.honor_id).conference_id if hw.honor_id else None,
-            'week': hw.week
-        }
-        for hw in honor_winners
-    ]) 
\ No newline at end of file
+        serialize_honor_winner(*row)
+        for row in query_honor_winners(HonorWinner.season_id == season_id).all()
+    ])
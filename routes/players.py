@@ -1,11 +1,46 @@
 from flask import Blueprint, request, jsonify, Response
 from extensions import db
-from models import Player, PlayerSeason, Team, Season, AwardWinner, HonorWinner, Award, Honor
+from models import Player, PlayerSeason, Team, Season, AwardWinner, HonorWinner
 from routes import logger
+from routes.awards import query_award_winners, serialize_award_winner
+from routes.honors import query_honor_winners, serialize_honor_winner
+from utils_pagination import ListArgs, paginated_response
+from utils_career import refresh_player_careers, get_player_career_totals
 from typing import Dict, List, Any, Optional, Union
 
 players_bp = Blueprint('players', __name__)
 
+# PlayerSeason columns the stat entry endpoints may write; all are integers except awards
+PLAYER_SEASON_STAT_FIELDS = (
+    'ovr_rating', 'games_played', 'completions', 'attempts', 'pass_yards',
+    'pass_tds', 'interceptions', 'rush_attempts', 'rush_yards', 'rush_tds',
+    'longest_rush', 'rush_fumbles', 'receptions', 'rec_yards', 'rec_tds',
+    'longest_rec', 'rec_drops', 'tackles', 'tfl', 'sacks', 'forced_fumbles',
+    'def_tds', 'awards'
+)
+
+
+def redshirted_player_ids(player_ids, before_season_id: Optional[int] = None) -> set:
+    """
+    Return the ids among player_ids with at least one redshirted season, looked
+    up with a single query for a whole roster.
+
+    Args:
+        player_ids: Player ids to check
+        before_season_id (int, optional): Only count seasons before this one
+    """
+    player_ids = list(player_ids)
+    if not player_ids:
+        return set()
+    query = db.session.query(PlayerSeason.player_id).filter(
+        PlayerSeason.player_id.in_(player_ids),
+        PlayerSeason.redshirted == True
+    )
+    if before_season_id is not None:
+        query = query.filter(PlayerSeason.season_id < before_season_id)
+    return {player_id for player_id, in query.distinct()}
+
+
 @players_bp.route('/players/<int:player_id>', methods=['GET'])
 def get_player(player_id: int) -> Response:
     """
@@ -125,6 +160,7 @@ def add_player_to_team(team_id: int) -> Response:
         height=height
     )
     db.session.add(player_season)
+    refresh_player_careers([player.player_id])
     db.session.commit()
     return jsonify({'player_id': player.player_id, 'name': player.name, 'position': player.position}), 201
 
@@ -150,8 +186,8 @@ def add_or_update_player_season(player_id: int) -> Response:
         400: If required fields are missing
         
     Note:
-        If a PlayerSeason record already exists for the player/season/team combination,
-        it will be updated. Otherwise, a new record will be created.
+        If a PlayerSeason record already exists for the player/season combination,
+        it will be updated (including its team). Otherwise, a new record will be created.
     """
     data = request.json
     season_id = data.get('season_id')
@@ -161,14 +197,14 @@ def add_or_update_player_season(player_id: int) -> Response:
     if not all([season_id, team_id, ovr_rating]):
         return jsonify({'error': 'Missing required fields'}), 400
 
-    # Try to find an existing PlayerSeason
+    # Try to find an existing PlayerSeason (one row per player and season)
     player_season = PlayerSeason.query.filter_by(
         player_id=player_id,
-        season_id=season_id,
-        team_id=team_id
+        season_id=season_id
     ).first()
 
     if player_season:
+        player_season.team_id = team_id
         player_season.ovr_rating = ovr_rating
         player_season.player_class = current_year
         # update other fields if needed
@@ -184,6 +220,7 @@ def add_or_update_player_season(player_id: int) -> Response:
         )
         db.session.add(player_season)
 
+    refresh_player_careers([player_id])
     db.session.commit()
     return jsonify({'player_season_id': player_season.player_season_id}), 201
 
@@ -212,6 +249,7 @@ def delete_player(player_id: int) -> Response:
     PlayerSeason.query.filter_by(player_id=player_id).delete()
     AwardWinner.query.filter_by(player_id=player_id).delete()
     HonorWinner.query.filter_by(player_id=player_id).delete()
+    refresh_player_careers([player_id])
     
     # Now delete the player
     db.session.delete(player)
@@ -243,6 +281,8 @@ def get_team_roster_for_season(season_id: int, team_id: int) -> Response:
         .join(Player, PlayerSeason.player_id == Player.player_id)
         .filter(PlayerSeason.season_id == season_id, PlayerSeason.team_id == team_id)
     )
+    rows = query.all()
+    ever_redshirted = redshirted_player_ids(ps.player_id for ps, player in rows if not player.redshirt_used)
     result = [
         {
             'player_id': ps.player_id,
@@ -255,10 +295,7 @@ def get_team_roster_for_season(season_id: int, team_id: int) -> Response:
             'state': player.state,
             'recruit_stars': player.recruit_stars,
             'redshirted': ps.redshirted,
-            'has_ever_redshirted': player.redshirt_used or db.session.query(PlayerSeason.redshirted).filter(
-                PlayerSeason.player_id == ps.player_id,
-                PlayerSeason.redshirted == True
-            ).count() > 0,
+            'has_ever_redshirted': player.redshirt_used or ps.player_id in ever_redshirted,
             'ovr_rating': ps.ovr_rating,
             'player_class': ps.player_class,
             'pass_yards': ps.pass_yards,
@@ -272,7 +309,7 @@ def get_team_roster_for_season(season_id: int, team_id: int) -> Response:
             'interceptions': ps.interceptions,
             'awards': ps.awards
         }
-        for ps, player in query.all()
+        for ps, player in rows
     ]
     return jsonify(result)
 
@@ -290,9 +327,9 @@ def get_player_career(player_id: int) -> Response:
         and team information for each season.
         
     Note:
-        Returns empty array if player has no career records. Statistics are
-        aggregated across all seasons and include both totals and averages.
-        Career highs are calculated for relevant statistical categories.
+        Returns empty array if player has no career records. Totals and career
+        highs are read from the player_careers row maintained by utils_career;
+        averages are derived from those totals.
     """
     from models import PlayerSeason, Team, Season
     # Join PlayerSeason with Team and Season to get team names and season years
@@ -303,43 +340,41 @@ def get_player_career(player_id: int) -> Response:
         .filter(PlayerSeason.player_id == player_id)
         .order_by(PlayerSeason.season_id)
     )
-    seasons = [ps for ps, _, _ in season_team_query]
-    team_names = {ps.player_season_id: team_name for ps, team_name, _ in season_team_query}
-    season_years = {ps.player_season_id: year for ps, _, year in season_team_query}
+    rows = season_team_query.all()
+    seasons = [ps for ps, _, _ in rows]
+    team_names = {ps.player_season_id: team_name for ps, team_name, _ in rows}
+    season_years = {ps.player_season_id: year for ps, _, year in rows}
     if not seasons:
         return jsonify([])
 
-    # Aggregate sums and maxes
-    def sum_stat(attr: str) -> int:
-        return sum(getattr(ps, attr) or 0 for ps in seasons)
-    def max_stat(attr: str) -> int:
-        return max((getattr(ps, attr) or 0) for ps in seasons)
     def safe_div(n: Optional[int], d: Optional[int]) -> float:
         if n is None or d is None or d == 0:
             return 0
         return n / d
 
-    games_played = sum_stat('games_played')
-    completions = sum_stat('completions')
-    attempts = sum_stat('attempts')
-    pass_yards = sum_stat('pass_yards')
-    pass_tds = sum_stat('pass_tds')
-    interceptions = sum_stat('interceptions')
-    rush_attempts = sum_stat('rush_attempts')
-    rush_yards = sum_stat('rush_yards')
-    rush_tds = sum_stat('rush_tds')
-    rush_fumbles = sum_stat('rush_fumbles')
-    longest_rush = max_stat('longest_rush')
-    receptions = sum_stat('receptions')
-    rec_yards = sum_stat('rec_yards')
-    rec_tds = sum_stat('rec_tds')
-    rec_drops = sum_stat('rec_drops')
-    longest_rec = max_stat('longest_rec')
-    tackles = sum_stat('tackles')
-    tfl = sum_stat('tfl')
-    sacks = sum_stat('sacks')
-    forced_fumbles = sum_stat('forced_fumbles')
-    def_tds = sum_stat('def_tds')
+    # Career totals come from the maintained player_careers row
+    totals = get_player_career_totals(player_id)
+    games_played = totals.games_played
+    completions = totals.completions
+    attempts = totals.attempts
+    pass_yards = totals.pass_yards
+    pass_tds = totals.pass_tds
+    interceptions = totals.interceptions
+    rush_attempts = totals.rush_attempts
+    rush_yards = totals.rush_yards
+    rush_tds = totals.rush_tds
+    rush_fumbles = totals.rush_fumbles
+    longest_rush = totals.longest_rush
+    receptions = totals.receptions
+    rec_yards = totals.rec_yards
+    rec_tds = totals.rec_tds
+    rec_drops = totals.rec_drops
+    longest_rec = totals.longest_rec
+    tackles = totals.tackles
+    tfl = totals.tfl
+    sacks = totals.sacks
+    forced_fumbles = totals.forced_fumbles
+    def_tds = totals.def_tds
 
     # Calculate averages
     pass_comp_pct = safe_div(completions, attempts) * 100 if attempts > 0 else 0
@@ -349,6 +384,8 @@ def get_player_career(player_id: int) -> Response:
     
     career_stats = {
         'games_played': games_played,
+        'seasons_played': totals.seasons_played,
+        'team_ids': sorted(int(team_id) for team_id in (totals.team_ids or '').split(',') if team_id),
         'passing': {
             'completions': completions,
             'attempts': attempts,
@@ -510,17 +547,9 @@ def get_all_players() -> Response:
     logger.debug(f"Number of players found: {len(results)}")
 
     # Determine if each player previously redshirted before the current season
-    prior_rs_lookup = {
-        p.player_id: (
-            PlayerSeason.query.filter(
-                PlayerSeason.player_id == p.player_id,
-                PlayerSeason.redshirted == True,
-                PlayerSeason.season_id < current_season.season_id,
-            ).count()
-            > 0
-        )
-        for p, _ in results
-    }
+    prior_redshirted = redshirted_player_ids(
+        (p.player_id for p, ps in results if ps.redshirted), before_season_id=current_season.season_id
+    )
     
     return jsonify([
         {
@@ -530,7 +559,7 @@ def get_all_players() -> Response:
             'team_id': p.team_id,
             'class': ps.current_year,
             'ovr_rating': ps.ovr_rating,
-            'redshirted': ps.redshirted and prior_rs_lookup.get(p.player_id, False),
+            'redshirted': ps.redshirted and p.player_id in prior_redshirted,
             'recruit_stars': p.recruit_stars,
             'dev_trait': ps.dev_trait,
             'height': ps.height,
@@ -582,18 +611,11 @@ def update_player_season_stats(player_id: int, season_id: int) -> Response:
         return jsonify({'error': 'PlayerSeason not found'}), 404
     
     # Update all the stats that can be modified
-    stat_fields = [
-        'ovr_rating', 'games_played', 'completions', 'attempts', 'pass_yards', 
-        'pass_tds', 'interceptions', 'rush_attempts', 'rush_yards', 'rush_tds',
-        'longest_rush', 'rush_fumbles', 'receptions', 'rec_yards', 'rec_tds',
-        'longest_rec', 'rec_drops', 'tackles', 'tfl', 'sacks', 'forced_fumbles',
-        'def_tds', 'awards'
-    ]
-    
-    for field in stat_fields:
+    for field in PLAYER_SEASON_STAT_FIELDS:
         if field in data:
             setattr(player_season, field, data[field])
     
+    refresh_player_careers([player_id])
     db.session.commit()
     return jsonify({'message': 'Player season stats updated'})
 
@@ -637,21 +659,36 @@ def update_player_profile(player_id: int) -> Response:
     else:
         return jsonify({'error': 'No valid fields to update'}), 400
 
+SEASON_PLAYER_FIELDS = ('player_id', 'name', 'position', 'team_id', 'team_name')
+
 @players_bp.route('/seasons/<int:season_id>/players', methods=['GET'])
 def get_all_players_for_season(season_id: int) -> Response:
     """
-    Retrieve all players participating in a specific season.
+    Retrieve players participating in a specific season, one page at a time.
     
     Args:
         season_id (int): ID of the season to get players for
         
+    Query Parameters:
+        team_id (int, optional): Only players on this team in the season
+        position (str, optional): Only players at this position
+        limit, cursor, fields, all: See utils_pagination.ListArgs
+        
     Returns:
-        Response: JSON array containing all players in the season including
-        player_id, name, position, team_id, and team_name for each player.
+        Response: {'items': [...], 'next_cursor': ...} ordered by player_id, or a
+        plain JSON array of every matching player with all=true. Each player has
+        player_id, name, position, team_id, and team_name.
+        
+    Raises:
+        400: If limit, cursor or fields is invalid
         
     Note:
         Only returns players who have PlayerSeason records for the specified season.
     """
+    try:
+        args = ListArgs(SEASON_PLAYER_FIELDS, key_size=1)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     # Join PlayerSeason, Player, and Team to get all players for the season with team info
     query = (
         db.session.query(Player.player_id, Player.name, Player.position, Team.team_id, Team.name.label('team_name'))
@@ -659,17 +696,24 @@ def get_all_players_for_season(season_id: int) -> Response:
         .join(Team, PlayerSeason.team_id == Team.team_id)
         .filter(PlayerSeason.season_id == season_id)
     )
-    players = [
-        {
+    team_id = request.args.get('team_id', type=int)
+    if team_id is not None:
+        query = query.filter(PlayerSeason.team_id == team_id)
+    position = request.args.get('position')
+    if position:
+        query = query.filter(Player.position == position)
+
+    def serialize(row):
+        player_id, name, position, team_id, team_name = row
+        return {
             'player_id': player_id,
             'name': name,
             'position': position,
             'team_id': team_id,
             'team_name': team_name
-        }
-        for player_id, name, position, team_id, team_name in query.all()
-    ]
-    return jsonify(players)
+        }, (player_id,)
+
+    return paginated_response(query, (Player.player_id,), serialize, args)
 
 @players_bp.route('/players/<int:player_id>/awards', methods=['GET'])
 def get_player_awards(player_id: int) -> Response:
@@ -684,24 +728,8 @@ def get_player_awards(player_id: int) -> Response:
         award_winner_id, award_name, award_description, team_name, season_year,
         and season_id for each award.
     """
-    award_winners = AwardWinner.query.filter_by(player_id=player_id).all()
-    
-    result = []
-    for aw in award_winners:
-        award = Award.query.get(aw.award_id)
-        team = Team.query.get(aw.team_id)
-        season = Season.query.get(aw.season_id)
-        
-        result.append({
-            'award_winner_id': aw.award_winner_id,
-            'award_name': award.name if award else None,
-            'award_description': award.description if award else None,
-            'team_name': team.name if team else None,
-            'season_year': season.year if season else None,
-            'season_id': aw.season_id
-        })
-    
-    return jsonify(result)
+    rows = query_award_winners(AwardWinner.player_id == player_id).all()
+    return jsonify([serialize_award_winner(*row) for row in rows])
 
 @players_bp.route('/players/<int:player_id>/honors', methods=['GET'])
 def get_player_honors(player_id: int) -> Response:
@@ -716,25 +744,8 @@ def get_player_honors(player_id: int) -> Response:
         honor_winner_id, honor_name, honor_side, team_name, season_year,
         season_id, and week for each honor.
     """
-    honor_winners = HonorWinner.query.filter_by(player_id=player_id).all()
-    
-    result = []
-    for hw in honor_winners:
-        honor = Honor.query.get(hw.honor_id)
-        team = Team.query.get(hw.team_id)
-        season = Season.query.get(hw.season_id)
-        
-        result.append({
-            'honor_winner_id': hw.honor_winner_id,
-            'honor_name': honor.name if honor else None,
-            'honor_side': honor.side if honor else None,
-            'team_name': team.name if team else None,
-            'season_year': season.year if season else None,
-            'season_id': hw.season_id,
-            'week': hw.week
-        })
-    
-    return jsonify(result)
+    rows = query_honor_winners(HonorWinner.player_id == player_id).all()
+    return jsonify([serialize_honor_winner(*row) for row in rows])
 
 @players_bp.route('/players/<int:player_id>/rating-development', methods=['GET'])
 def get_player_rating_development(player_id: int) -> Response:
@@ -879,6 +890,7 @@ def update_player_comprehensive(player_id: int) -> Response:
             updated = True
     
     if updated:
+        refresh_player_careers([player_id])
         db.session.commit()
         return jsonify({'message': 'Player updated successfully'})
     else:
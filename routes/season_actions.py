@@ -1,8 +1,12 @@
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, request, jsonify, Response
 from extensions import db
 from models import Player, TeamSeason, Season
 from routes.recruiting import Recruit
 from routes import logger
+from data_versions import bump_season_version
+from utils_career import refresh_player_careers
+from utils_ratings import compute_power_ratings, RATING_METHODS
+from rankings_provider import mark_rankings_set
 from typing import Dict, List, Any, Optional, Union
 
 season_actions_bp = Blueprint('season_actions', __name__)
@@ -30,17 +34,26 @@ def progress_players_logic(season_id: int) -> dict[str, Any]:
     
     # Build a lookup of existing PlayerSeason records for the next season to avoid duplicates
     existing_next_season_ps = {
-        ps.player_id for ps in PlayerSeason.query.filter_by(season_id=next_season.season_id).all()
+        player_id for (player_id,) in
+        db.session.query(PlayerSeason.player_id).filter(PlayerSeason.season_id == next_season.season_id).all()
     }
 
+    # Prefetch every current-season PlayerSeason in one query instead of two lookups per player.
+    # If a player has duplicate rows the lowest id wins, matching the old .first() lookup.
+    current_ps_by_player = {}
+    for ps in PlayerSeason.query.filter_by(season_id=season_id).order_by(PlayerSeason.player_season_id).all():
+        current_ps_by_player.setdefault(ps.player_id, ps)
+
+    # Player column changes are collected here and written in one batch at the end
+    player_updates = {}
+
     # First pass: ensure all players have PlayerSeason records for the current season
+    missing_current_ps = []
     for player in players:
         # Skip players with no team (e.g., graduated)
         if player.team_id is None:
-            logger.debug(f'Skipping player {player.player_id} ({player.name}) in first pass: no team_id')
             continue
-        # Get the current season's PlayerSeason record
-        current_ps = PlayerSeason.query.filter_by(player_id=player.player_id, season_id=season_id).first()
+        current_ps = current_ps_by_player.get(player.player_id)
         if not current_ps:
             # Create a PlayerSeason record for the current season if it doesn't exist
             current_ps = PlayerSeason(
@@ -51,147 +64,151 @@ def progress_players_logic(season_id: int) -> dict[str, Any]:
                 current_year='FR',
                 redshirted=False
             )
-            db.session.add(current_ps)
-            db.session.flush()
+            current_ps_by_player[player.player_id] = current_ps
+            missing_current_ps.append(current_ps)
         
         old_class = current_ps.current_year or current_ps.player_class or 'FR'
 
         if current_ps.redshirted:
             redshirted.append(player.player_id)
-            player.redshirt_used = True
+            player_updates.setdefault(player.player_id, {})['redshirt_used'] = True
         elif old_class in PROGRESSION_MAP:
             progressed.append(player.player_id)
+    db.session.add_all(missing_current_ps)
+    logger.debug(f'progress_players_logic: created {len(missing_current_ps)} missing PlayerSeason rows for season {season_id}')
 
-    # Second pass: create PlayerSeason records for the next season
+    # Second pass: compute next-season PlayerSeason rows in memory
+    next_season_rows = []
+    graduated = 0
     for player in players:
         # Skip if a PlayerSeason already exists for this player in the next season
         if player.player_id in existing_next_season_ps:
             continue
 
         # Get the current season's PlayerSeason to determine progression
-        current_ps = PlayerSeason.query.filter_by(player_id=player.player_id, season_id=season_id).first()
+        current_ps = current_ps_by_player.get(player.player_id)
         if not current_ps:
-            logger.debug(f'Skipping player {player.player_id} ({player.name}): no PlayerSeason for previous season {season_id}')
             continue
 
         # LEAVING LOGIC: If player is marked as leaving, remove from team and do not progress
         if getattr(player, 'leaving', False):
-            player.team_id = None
-            player.leaving = False  # Reset flag for future seasons
+            # Reset flag for future seasons
+            player_updates.setdefault(player.player_id, {}).update(team_id=None, leaving=False)
             logger.info(f'Player {player.player_id} ({player.name}) is leaving, setting team_id=None and skipping progression')
             continue
 
         # Skip players with no team (e.g., graduated)
         if current_ps.team_id is None or player.team_id is None:
-            logger.debug(f'Skipping player {player.player_id} ({player.name}): no team (current_ps.team_id={current_ps.team_id}, player.team_id={player.team_id})')
             continue
         
         old_class = current_ps.current_year or current_ps.player_class or 'FR'
         if current_ps.redshirted:
             new_class = old_class
-            player.redshirt_used = True
+            player_updates.setdefault(player.player_id, {})['redshirt_used'] = True
         elif current_ps.current_year in PROGRESSION_MAP:
             new_class = PROGRESSION_MAP[current_ps.current_year]
         else:
             new_class = old_class
-        has_ever_redshirted = player.redshirt_used or current_ps.redshirted
 
         # Graduated players should not appear on future rosters
         if new_class == "GR":
-            player.team_id = None
-            logger.debug(f'Player {player.player_id} ({player.name}) graduated, setting team_id=None')
-            continue
-
-        # Final safeguard: do not create PlayerSeason if team_id is None
-        if current_ps.team_id is None or player.team_id is None:
-            logger.debug(f'FINAL SAFEGUARD: Skipping player {player.player_id} ({player.name}) - would create PlayerSeason with team_id=None')
+            player_updates.setdefault(player.player_id, {})['team_id'] = None
+            graduated += 1
             continue
 
         # Carry redshirted status does not persist season to season
         next_redshirted = False
 
-        # Create PlayerSeason for next season
-        new_player_season = PlayerSeason(
-            player_id=player.player_id,
-            season_id=next_season.season_id,
-            team_id=current_ps.team_id,
-            player_class=new_class,
-            current_year=new_class,
-            redshirted=next_redshirted,
-            ovr_rating=current_ps.ovr_rating,
-            speed=current_ps.speed,
-            dev_trait=current_ps.dev_trait,
-            height=current_ps.height,
-            weight=current_ps.weight
-        )
-        db.session.add(new_player_season)
-        logger.debug(f'Created PlayerSeason for player {player.player_id} in season {next_season.season_id} with class {new_class}')
+        next_season_rows.append({
+            'player_id': player.player_id,
+            'season_id': next_season.season_id,
+            'team_id': current_ps.team_id,
+            'player_class': new_class,
+            'current_year': new_class,
+            'redshirted': next_redshirted,
+            'ovr_rating': current_ps.ovr_rating,
+            'speed': current_ps.speed,
+            'dev_trait': current_ps.dev_trait,
+            'height': current_ps.height,
+            'weight': current_ps.weight
+        })
+    logger.debug(f'progress_players_logic: {len(next_season_rows)} players progress to season {next_season.season_id}, {graduated} graduated')
+    db.session.bulk_update_mappings(Player, [
+        {'player_id': player_id, **changes} for player_id, changes in player_updates.items()
+    ])
 
     # Activate recruits/transfers for all teams (not only user-controlled)
-    activated_recruits = []
-    activated_transfers = []
-    from routes.transfer import Transfer
+    from models import Transfer
     # Process recruits for every team
-    recruits = Recruit.query.filter_by(season_id=season_id, committed=True).all()
-    transfers = Transfer.query.filter_by(season_id=season_id, committed=True).all()
-
-    db.session.flush()  # Ensure existing data is written before creating players
+    recruits = [r for r in Recruit.query.filter_by(season_id=season_id, committed=True).all() if r.team_id]
+    transfers = [t for t in Transfer.query.filter_by(season_id=season_id, committed=True).all() if t.team_id]
 
-    for recruit in recruits:
-        team_id = recruit.team_id
-        if not team_id:
-            continue
-        player = Player(
+    new_players = [
+        Player(
             name=recruit.name,
             position=recruit.position,
             recruit_stars=recruit.recruit_stars,
             recruit_rank_nat=recruit.recruit_rank_nat,
             state=recruit.state,
-            team_id=team_id
-        )
-        db.session.add(player)
-        db.session.flush()
-        ps = PlayerSeason(
-            player_id=player.player_id,
-            season_id=next_season.season_id,
-            team_id=team_id,
-            player_class='FR',
-            current_year='FR',
-            redshirted=False,
-            height=recruit.height,
-            weight=recruit.weight
+            team_id=recruit.team_id,
+            redshirt_used=False,
+            leaving=False
         )
-        db.session.add(ps)
-        activated_recruits.append(player.player_id)
-
-    for transfer in transfers:
-        team_id = transfer.team_id
-        if not team_id:
-            continue
-        progressed_year = PROGRESSION_MAP.get(transfer.current_status, transfer.current_status)
-        player = Player(
+        for recruit in recruits
+    ] + [
+        Player(
             name=transfer.name,
             position=transfer.position,
             recruit_stars=transfer.recruit_stars,
             recruit_rank_nat=transfer.recruit_rank_pos,
-            team_id=team_id,
-            state=transfer.state
+            team_id=transfer.team_id,
+            state=transfer.state,
+            redshirt_used=False,
+            leaving=False
         )
-        db.session.add(player)
-        db.session.flush()
-        ps = PlayerSeason(
-            player_id=player.player_id,
-            season_id=next_season.season_id,
-            team_id=team_id,
-            player_class=progressed_year,
-            current_year=progressed_year,
-            redshirted=False,
-            ovr_rating=transfer.ovr_rating,
-            height=transfer.height,
-            weight=transfer.weight
-        )
-        db.session.add(ps)
-        activated_transfers.append(player.player_id)
+        for transfer in transfers
+    ]
+    # The database assigns the ids, so concurrent writers and sequences stay consistent.
+    # One flush inserts every new player and sets player_id on each object: batched
+    # INSERT ... RETURNING where the backend can order the returned rows, one INSERT
+    # per player on SQLite, which is in-process and costs about the same here
+    db.session.add_all(new_players)
+    db.session.flush()
+    new_player_ids = [player.player_id for player in new_players]
+    activated_recruits = new_player_ids[:len(recruits)]
+    activated_transfers = new_player_ids[len(recruits):]
+
+    for recruit, player_id in zip(recruits, activated_recruits):
+        next_season_rows.append({
+            'player_id': player_id,
+            'season_id': next_season.season_id,
+            'team_id': recruit.team_id,
+            'player_class': 'FR',
+            'current_year': 'FR',
+            'redshirted': False,
+            'height': recruit.height,
+            'weight': recruit.weight
+        })
+    for transfer, player_id in zip(transfers, activated_transfers):
+        progressed_year = PROGRESSION_MAP.get(transfer.current_status, transfer.current_status)
+        next_season_rows.append({
+            'player_id': player_id,
+            'season_id': next_season.season_id,
+            'team_id': transfer.team_id,
+            'player_class': progressed_year,
+            'current_year': progressed_year,
+            'redshirted': False,
+            'ovr_rating': transfer.ovr_rating,
+            'height': transfer.height,
+            'weight': transfer.weight
+        })
+    db.session.bulk_insert_mappings(PlayerSeason, next_season_rows)
+    # Everyone with a new PlayerSeason gains a season on their career row
+    refresh_player_careers(season_id=next_season.season_id)
+    refresh_player_careers([ps.player_id for ps in missing_current_ps])
+    # Bulk mappings bypass the session events that track season versions; the
+    # Player updates above touch every season, so bump the global scope
+    bump_season_version()
     db.session.commit()
     return {
         "progressed_player_ids": progressed, 
@@ -213,12 +230,34 @@ def progress_players(season_id: int) -> Response:
 
 @season_actions_bp.route('/seasons/<int:season_id>/teams/top25', methods=['POST'])
 def assign_top25(season_id: int) -> Response:
+    """
+    Set final_rank 1-25 for the season's best teams and clear it for the rest.
+    These ranks are then kept by update_stats (see rankings_provider).
+
+    Expected JSON payload (optional):
+        method (str): 'wins' (default), or 'srs' / 'elo' to rank by the power
+            ratings after every game played
+
+    Returns:
+        Response: JSON object with a message and the assigned team ids in rank order.
+
+    Raises:
+        400: If method is unknown
+    """
+    method = (request.get_json(silent=True) or {}).get('method', 'wins')
+    if method != 'wins' and method not in RATING_METHODS:
+        return jsonify({'error': f"method must be one of: wins, {', '.join(RATING_METHODS)}"}), 400
     team_seasons = TeamSeason.query.filter_by(season_id=season_id).all()
-    sorted_teams = sorted(team_seasons, key=lambda ts: (ts.wins if ts.wins is not None else 0, ts.team_id), reverse=True)
+    if method == 'wins':
+        sorted_teams = sorted(team_seasons, key=lambda ts: (ts.wins if ts.wins is not None else 0, ts.team_id), reverse=True)
+    else:
+        rank = {team['team_id']: team[f"{method}_rank"] for team in compute_power_ratings(season_id)['teams']}
+        sorted_teams = sorted(team_seasons, key=lambda ts: rank.get(ts.team_id, len(rank) + 1))
     top25 = sorted_teams[:25]
     for i, ts in enumerate(top25):
         ts.final_rank = i + 1
     for ts in sorted_teams[25:]:
         ts.final_rank = None
+    mark_rankings_set(season_id, method)
     db.session.commit()
-    return jsonify({'message': 'Top 25 assigned by wins', 'assigned_team_ids': [ts.team_id for ts in top25]}), 200
+    return jsonify({'message': f'Top 25 assigned by {method}', 'assigned_team_ids': [ts.team_id for ts in top25]}), 200
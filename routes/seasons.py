@@ -1,9 +1,17 @@
 from flask import Blueprint, request, jsonify, Response
 from marshmallow import ValidationError
 from extensions import db
-from models import Season, Conference, TeamSeason, Game, Team, PlayerSeason, AwardWinner, Honor, HonorWinner
+from models import Season, Conference, TeamSeason, Game, Team, PlayerSeason, AwardWinner, Honor, HonorWinner, SeasonStanding, TeamPowerRating, SeasonRanking
 from schemas import CreateSeasonSchema
 from routes import logger
+from utils_standings import get_team_standing, rebuild_season_standings, format_streak
+from data_versions import season_etag
+from response_cache import cached_response, season_tag
+from utils_leaderboards import compute_leaders, parse_leaderboard_args
+from utils_projections import project_season, DEFAULT_RUNS, MAX_RUNS
+from utils_ratings import compute_power_ratings
+from utils_career import refresh_player_careers
+from rankings_provider import mark_rankings_set
 from typing import Dict, List, Any, Optional, Union
 import datetime
 
@@ -181,7 +189,8 @@ def calculate_user_team_conference_record(team_id: int, season_id: int) -> tuple
     Calculate conference wins and losses for a specific team in a specific season.
     
     This helper function provides a robust calculation of conference record by
-    analyzing actual game results rather than relying on stored values.
+    reading the game-derived record from the materialized season standings
+    rather than relying on manually entered TeamSeason values.
     
     Args:
         team_id (int): ID of the team to calculate conference record for
@@ -195,41 +204,12 @@ def calculate_user_team_conference_record(team_id: int, season_id: int) -> tuple
         the game has been played (scores are not None and not both 0).
         Bye weeks are excluded from the calculation.
     """
-    from models import Game, TeamSeason
-    # Build a mapping: (season_id, team_id) -> conference_id
-    team_conf_map = {(ts.season_id, ts.team_id): ts.conference_id for ts in TeamSeason.query.filter_by(season_id=season_id).all()}
-    all_games = (
-        Game.query.filter(
-            ((Game.home_team_id == team_id) | (Game.away_team_id == team_id)) &
-            (Game.season_id == season_id)
-        ).order_by(Game.week.asc()).all()
-    )
-    conf_wins = 0
-    conf_losses = 0
-    for g in all_games:
-        if getattr(g, 'game_type', None) == 'Bye Week':
-            continue
-        if g.home_score is None or g.away_score is None or (g.home_score == 0 and g.away_score == 0):
-            continue
-        home_conf = team_conf_map.get((g.season_id, g.home_team_id))
-        away_conf = team_conf_map.get((g.season_id, g.away_team_id))
-        if not home_conf or not away_conf:
-            continue
-        if home_conf != away_conf:
-            continue  # Not a conference game
-        is_home = g.home_team_id == team_id
-        is_away = g.away_team_id == team_id
-        if not (is_home or is_away):
-            continue
-        team_score = g.home_score if is_home else g.away_score
-        opp_score = g.away_score if is_home else g.home_score
-        if team_score > opp_score:
-            conf_wins += 1
-        elif team_score < opp_score:
-            conf_losses += 1
-    return conf_wins, conf_losses
+    standing = get_team_standing(season_id, team_id)
+    return standing.conference_wins, standing.conference_losses
 
 @seasons_bp.route('/seasons/<int:season_id>/teams', methods=['GET'])
+@season_etag
+@cached_response(lambda season_id: {season_tag(season_id)})
 def get_teams_in_season(season_id: int) -> Response:
     """
     Retrieve all teams participating in a specific season.
@@ -260,6 +240,7 @@ def get_teams_in_season(season_id: int) -> Response:
         if getattr(t, 'is_user_controlled', False):
             user_team_id = t.team_id
             break
+    user_conf_record = calculate_user_team_conference_record(user_team_id, season_id) if user_team_id else (0, 0)
     if all_param:
         # Return all teams for the season
         return jsonify([
@@ -273,8 +254,8 @@ def get_teams_in_season(season_id: int) -> Response:
                 'conference_name': conferences[ts.conference_id].name if ts.conference_id in conferences else None,
                 'wins': ts.wins,
                 'losses': ts.losses,
-                'conference_wins': (calculate_user_team_conference_record(ts.team_id, season_id)[0] if ts.team_id == user_team_id else ts.conference_wins),
-                'conference_losses': (calculate_user_team_conference_record(ts.team_id, season_id)[1] if ts.team_id == user_team_id else ts.conference_losses),
+                'conference_wins': (user_conf_record[0] if ts.team_id == user_team_id else ts.conference_wins),
+                'conference_losses': (user_conf_record[1] if ts.team_id == user_team_id else ts.conference_losses),
                 'points_for': ts.points_for,
                 'points_against': ts.points_against,
                 'pass_yards': ts.pass_yards,
@@ -318,8 +299,8 @@ def get_teams_in_season(season_id: int) -> Response:
             'conference_name': conferences[ts.conference_id].name if ts.conference_id in conferences else None,
             'wins': ts.wins,
             'losses': ts.losses,
-            'conference_wins': (calculate_user_team_conference_record(ts.team_id, season_id)[0] if ts.team_id == user_team_id else ts.conference_wins),
-            'conference_losses': (calculate_user_team_conference_record(ts.team_id, season_id)[1] if ts.team_id == user_team_id else ts.conference_losses),
+            'conference_wins': (user_conf_record[0] if ts.team_id == user_team_id else ts.conference_wins),
+            'conference_losses': (user_conf_record[1] if ts.team_id == user_team_id else ts.conference_losses),
             'points_for': ts.points_for,
             'points_against': ts.points_against,
             'pass_yards': ts.pass_yards,
@@ -384,10 +365,18 @@ def update_team_season(season_id: int, team_id: int) -> Response:
     ]:
         if field in data:
             setattr(ts, field, data[field])
+    if 'final_rank' in data:
+        # A hand-entered rank makes the season's stored ranks authoritative for update_stats
+        mark_rankings_set(season_id, 'manual')
+    if 'conference_id' in data:
+        # Conference membership decides which games count as conference games for every team
+        db.session.flush()
+        rebuild_season_standings(season_id)
     db.session.commit()
     return jsonify({'message': 'Team season updated'})
 
 @seasons_bp.route('/seasons/<int:season_id>/leaders', methods=['GET'])
+@season_etag
 def get_season_leaders(season_id: int) -> Response:
     """
     Retrieve statistical leaders for a specific season.
@@ -395,30 +384,94 @@ def get_season_leaders(season_id: int) -> Response:
     Args:
         season_id (int): ID of the season to get leaders for
         
+    Query Parameters:
+        limit (int, optional): Leaders per category (default 5)
+        min_attempts (int, optional): Pass attempts to qualify for passing rates (default 50)
+        min_rush_attempts (int, optional): Carries to qualify for yards per carry (default 25)
+        
     Returns:
-        Response: JSON object containing top 5 players in each statistical category
-        including Passing Yards, Rushing Yards, and Receiving Yards. Each category
-        contains player_id, team_id, and value for each leader.
-    """
-    # Example: top 5 in passing yards, rushing yards, receiving yards
-    leaders = {}
-    stat_fields = [
-        ('pass_yards', 'Passing Yards'),
-        ('rush_yards', 'Rushing Yards'),
-        ('rec_yards', 'Receiving Yards')
-    ]
-    for field, label in stat_fields:
-        top = PlayerSeason.query.filter_by(season_id=season_id).order_by(getattr(PlayerSeason, field).desc()).limit(5).all()
-        leaders[label] = [
-            {
-                'player_id': ps.player_id,
-                'team_id': ps.team_id,
-                'value': getattr(ps, field, 0)
-            } for ps in top if getattr(ps, field, None) is not None
-        ]
-    return jsonify(leaders)
+        Response: JSON object keyed by category label (Passing Yards, Rushing
+        Yards, Receiving Yards, Tackles, ..., Completion %, Yards per Attempt,
+        Yards per Carry). Each category lists player_id, team_id, name and value
+        for each leader, best first.
+        
+    Raises:
+        400: If a query parameter is invalid
+        
+    Note:
+        All categories are computed from one query, see utils_leaderboards.
+    """
+    try:
+        k, qualifiers = parse_leaderboard_args(default_limit=5)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(compute_leaders(season_id, k=k, qualifiers=qualifiers))
+
+@seasons_bp.route('/seasons/<int:season_id>/power-ratings', methods=['GET'])
+@season_etag
+def get_power_ratings(season_id: int) -> Response:
+    """
+    Retrieve SRS and Elo power ratings for every team in a season.
+
+    Args:
+        season_id (int): ID of the season
+
+    Query Parameters:
+        week (int, optional): Ratings after this week's games (default: after every game played)
+
+    Returns:
+        Response: JSON object with week, home_edge and teams ordered by SRS,
+        each with team_name, wins, losses, srs, srs_rank, elo and elo_rank.
+
+    Raises:
+        400: If week is negative
+
+    Note:
+        SRS (points better than an average team) is solved from the games up
+        to the week; Elo is kept per week by every game write, see utils_ratings.
+    """
+    week = request.args.get('week', type=int)
+    if week is not None and week < 0:
+        return jsonify({'error': 'week must not be negative'}), 400
+    return jsonify(compute_power_ratings(season_id, week=week))
+
+@seasons_bp.route('/seasons/<int:season_id>/projections', methods=['GET'])
+@season_etag
+@cached_response(lambda season_id: {season_tag(season_id)})
+def get_season_projections(season_id: int) -> Response:
+    """
+    Project final records, bowl eligibility and conference finish from the games still to play.
+
+    Args:
+        season_id (int): ID of the season to project
+
+    Query Parameters:
+        runs (int, optional): Simulated seasons for the conference finish (default 2000, max 20000)
+        conference_id (int, optional): Only return this conference's teams
+
+    Returns:
+        Response: JSON object with runs, home_edge and teams ordered by
+        conference and projected finish. Each team has its current record,
+        rating, expected_wins, final_wins (probability per win total),
+        bowl_eligible (probability of 6+ wins), conference_title and
+        conference_finish (probability per place).
+
+    Raises:
+        400: If runs is out of range
+
+    Note:
+        Ratings are fitted from the season's completed games, see
+        utils_projections.project_season. Unplayed games have null scores (or
+        are 0-0 placeholders).
+    """
+    runs = request.args.get('runs', DEFAULT_RUNS, type=int)
+    if not 1 <= runs <= MAX_RUNS:
+        return jsonify({'error': f"runs must be between 1 and {MAX_RUNS}"}), 400
+    conference_id = request.args.get('conference_id', type=int)
+    return jsonify(project_season(season_id, runs=runs, conference_id=conference_id))
 
 @seasons_bp.route('/seasons/<int:season_id>/standings', methods=['GET'])
+@season_etag
 def get_season_standings(season_id: int) -> Response:
     """
     Retrieve conference standings for a specific season.
@@ -587,10 +640,19 @@ def delete_season(season_id: int) -> Response:
     # Delete all related data
     # TeamSeason
     TeamSeason.query.filter_by(season_id=season_id).delete()
+    # Materialized standings and power ratings
+    SeasonStanding.query.filter_by(season_id=season_id).delete()
+    TeamPowerRating.query.filter_by(season_id=season_id).delete()
+    SeasonRanking.query.filter_by(season_id=season_id).delete()
     # Game
     Game.query.filter_by(season_id=season_id).delete()
-    # PlayerSeason
+    # PlayerSeason, then the careers that summed it
+    player_ids = [
+        player_id for (player_id,) in
+        db.session.query(PlayerSeason.player_id).filter_by(season_id=season_id).distinct()
+    ]
     PlayerSeason.query.filter_by(season_id=season_id).delete()
+    refresh_player_careers(player_ids)
     # AwardWinner
     AwardWinner.query.filter_by(season_id=season_id).delete()
     # Honor winners (season-specific)
@@ -604,7 +666,7 @@ def delete_season(season_id: int) -> Response:
         logger.error(f"Error deleting recruits: {e}")
     # Transfer (if exists)
     try:
-        from routes.transfer import Transfer
+        from models import Transfer
         Transfer.query.filter_by(season_id=season_id).delete()
     except (ImportError, AttributeError, ValueError, RuntimeError) as e:
         # Log error but continue execution
@@ -653,50 +715,37 @@ def get_conference_standings(conference_id: int, season_id: int) -> list[dict[st
         
     Returns:
         list[dict[str, Any]]: List of team entries sorted by conference record.
-        Each entry contains team_id, conference_wins, conference_losses, and
-        manual_conference_position if set.
+        Each entry contains team_id, conference_wins, conference_losses,
+        manual_conference_position if set, and the current streak.
         
     Note:
-        For user-controlled teams, conference record is calculated from actual
-        game results for accuracy. For other teams, stored values are used.
+        For user-controlled teams, conference record is read from the
+        materialized season standings, which are kept in sync with game
+        results. For other teams, stored values are used.
         Teams can be sorted by manual position if set, otherwise by conference
         record (wins descending, losses ascending, team_id ascending).
     """
-    from models import Team, TeamSeason, Game
+    from models import Team, TeamSeason
     teams = Team.query.filter_by(primary_conference_id=conference_id).all()
     team_seasons = {ts.team_id: ts for ts in TeamSeason.query.filter_by(conference_id=conference_id, season_id=season_id).all()}
-    # Build a mapping: (season_id, team_id) -> conference_id
-    team_conf_map = {(ts.season_id, ts.team_id): ts.conference_id for ts in TeamSeason.query.filter_by(season_id=season_id).all()}
-    all_games = Game.query.filter_by(season_id=season_id).all()
+    standings = {
+        st.team_id: st
+        for st in SeasonStanding.query.filter(
+            SeasonStanding.season_id == season_id,
+            SeasonStanding.team_id.in_([t.team_id for t in teams])
+        ).all()
+    }
     conf_team_entries = []
     for team_entry in teams:
         ts = team_seasons.get(team_entry.team_id)
         manual_pos = ts.manual_conference_position if ts else None
+        standing = standings.get(team_entry.team_id)
         if team_entry.is_user_controlled:
-            # Robust conference record calculation for user team only
-            conf_wins = 0
-            conf_losses = 0
-            for g in all_games:
-                if getattr(g, 'game_type', None) == 'Bye Week':
-                    continue
-                if g.home_score is None or g.away_score is None or (g.home_score == 0 and g.away_score == 0):
-                    continue
-                home_conf = team_conf_map.get((g.season_id, g.home_team_id))
-                away_conf = team_conf_map.get((g.season_id, g.away_team_id))
-                if not home_conf or not away_conf:
-                    continue
-                if home_conf != away_conf:
-                    continue
-                is_home = g.home_team_id == team_entry.team_id
-                is_away = g.away_team_id == team_entry.team_id
-                if not (is_home or is_away):
-                    continue
-                team_score = g.home_score if is_home else g.away_score
-                opp_score = g.away_score if is_home else g.home_score
-                if team_score > opp_score:
-                    conf_wins += 1
-                elif team_score < opp_score:
-                    conf_losses += 1
+            # Game-derived conference record for the user team only
+            if standing is None:
+                standing = get_team_standing(season_id, team_entry.team_id)
+            conf_wins = standing.conference_wins
+            conf_losses = standing.conference_losses
         else:
             conf_wins = ts.conference_wins if ts else 0
             conf_losses = ts.conference_losses if ts else 0
@@ -704,7 +753,8 @@ def get_conference_standings(conference_id: int, season_id: int) -> list[dict[st
             'team_id': team_entry.team_id,
             'conference_wins': conf_wins,
             'conference_losses': conf_losses,
-            'manual_conference_position': manual_pos
+            'manual_conference_position': manual_pos,
+            'streak': format_streak(standing.streak) if standing else None
         })
     # If any team has manual_conference_position set, sort by it (nulls last)
     if any(e['manual_conference_position'] is not None for e in conf_team_entries):
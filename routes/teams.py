@@ -318,39 +318,26 @@ def get_team_stat_leaders(season_id: int, team_id: int) -> Response:
         season_id (int): ID of the season to get leaders for
         team_id (int): ID of the team to get leaders for
         
+    Query Parameters:
+        limit (int, optional): Leaders per category (default 3)
+        min_attempts, min_rush_attempts (int, optional): Rate qualifiers, as for
+            /seasons/<season_id>/leaders
+        
     Returns:
-        Response: JSON object containing top 3 players in each statistical category
-        including Passing Yards, Rushing Yards, Receiving Yards, Tackles, Sacks,
-        and Interceptions. Each category contains player_id, name, and value.
-    """
-    from models import PlayerSeason, Player
-    stat_fields = [
-        ('pass_yards', 'Passing Yards'),
-        ('rush_yards', 'Rushing Yards'),
-        ('rec_yards', 'Receiving Yards'),
-        ('tackles', 'Tackles'),
-        ('sacks', 'Sacks'),
-        ('interceptions', 'Interceptions')
-    ]
-    leaders = {}
-    for field, label in stat_fields:
-        query = (
-            db.session.query(PlayerSeason, Player.name)
-            .join(Player, PlayerSeason.player_id == Player.player_id)
-            .filter(PlayerSeason.season_id == season_id, PlayerSeason.team_id == team_id)
-            .order_by(getattr(PlayerSeason, field).desc())
-            .limit(3)
-        )
-        leaders[label] = [
-            {
-                'player_id': ps.player_id,
-                'name': name,
-                'value': getattr(ps, field, 0)
-            }
-            for ps, name in query.all()
-            if getattr(ps, field, None) is not None
-        ]
-    return jsonify(leaders)
+        Response: JSON object containing the top players in each statistical
+        category including Passing Yards, Rushing Yards, Receiving Yards, Tackles,
+        Sacks, Interceptions and the passing and rushing rates. Each category
+        contains player_id, team_id, name, and value.
+        
+    Raises:
+        400: If a query parameter is invalid
+    """
+    from utils_leaderboards import compute_leaders, parse_leaderboard_args
+    try:
+        k, qualifiers = parse_leaderboard_args(default_limit=3)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(compute_leaders(season_id, team_id=team_id, k=k, qualifiers=qualifiers))
 
 @teams_bp.route('/seasons/<int:season_id>/teams/<int:team_id>/awards', methods=['GET'])
 def get_team_awards(season_id: int, team_id: int) -> Response:
@@ -482,6 +469,39 @@ def get_team_transfers(season_id: int, team_id: int) -> Response:
     ]
     return jsonify(transfers)
 
+def parse_stat_entry(entry) -> Dict[str, Any]:
+    """
+    Read one bulk stat entry as {field: value}.
+
+    Accepts {"player_id": 1, "stat_field": "pass_yards", "value": 2500} or
+    {"player_id": 1, "stats": {"pass_yards": 2500, "pass_tds": 20}}. Raises
+    ValueError for a missing player_id, a field outside
+    PLAYER_SEASON_STAT_FIELDS or a value of the wrong type.
+    """
+    from routes.players import PLAYER_SEASON_STAT_FIELDS
+    if not isinstance(entry, dict):
+        raise ValueError("entry must be an object")
+    player_id = entry.get('player_id')
+    if not isinstance(player_id, int) or isinstance(player_id, bool):
+        raise ValueError("player_id must be an integer")
+    if 'stats' in entry:
+        stats = entry['stats']
+        if not isinstance(stats, dict) or not stats:
+            raise ValueError("stats must be a non-empty object")
+    elif 'stat_field' in entry:
+        stats = {entry['stat_field']: entry.get('value')}
+    else:
+        raise ValueError("stat_field and value, or stats, are required")
+    for field, value in stats.items():
+        if field not in PLAYER_SEASON_STAT_FIELDS:
+            raise ValueError(f"'{field}' is not a stat field")
+        if value is None:
+            raise ValueError(f"{field}: value is required")
+        expected = str if field == 'awards' else int
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ValueError(f"{field} must be {'a string' if expected is str else 'an integer'}")
+    return dict(stats)
+
 @teams_bp.route('/seasons/<int:season_id>/teams/<int:team_id>/bulk_stats', methods=['POST'])
 def bulk_stats_entry(season_id: int, team_id: int) -> Response:
     """
@@ -492,28 +512,62 @@ def bulk_stats_entry(season_id: int, team_id: int) -> Response:
         team_id (int): ID of the team to update stats for
         
     Expected JSON payload:
-        List of objects with player_id, stat_field, and value:
+        List of objects with player_id and either stat_field/value or a stats
+        object (see parse_stat_entry):
         [
             {"player_id": 1, "stat_field": "pass_yards", "value": 2500},
-            {"player_id": 2, "stat_field": "rush_yards", "value": 1200}
+            {"player_id": 2, "stats": {"rush_yards": 1200, "rush_tds": 14}}
         ]
         
     Returns:
-        Response: JSON object with success message on completion.
+        Response: JSON object with updated and rejected entry counts and a
+        results array with index, player_id, status ('updated' or 'error') and
+        the fields written or the error for every entry.
+        
+    Raises:
+        400: If the payload is not a JSON array
         
     Note:
-        Only updates stats for players who exist in the specified team/season.
-        Invalid entries are silently ignored.
+        The team's PlayerSeason rows are loaded with one query, every valid
+        entry is written with a single bulk update, and career totals and the
+        team rating are recomputed once, all in one transaction. Invalid
+        entries and players not on the roster are reported, not written.
     """
     from models import PlayerSeason
+    from data_versions import bump_season_version
+    from utils_career import refresh_player_careers
+    from utils_teamseason_stats import refresh_team_rating
     data = request.json
-    # data should be a list of {player_id, stat_field, value}
-    for entry in data:
-        ps = PlayerSeason.query.filter_by(season_id=season_id, team_id=team_id, player_id=entry['player_id']).first()
-        if ps and entry.get('stat_field') and entry.get('value') is not None:
-            setattr(ps, entry['stat_field'], entry['value'])
-    db.session.commit()
-    return jsonify({'message': 'Bulk stats updated'})
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a JSON array of stat entries'}), 400
+    roster = dict(
+        db.session.query(PlayerSeason.player_id, PlayerSeason.player_season_id)
+        .filter(PlayerSeason.season_id == season_id, PlayerSeason.team_id == team_id)
+        .all()
+    )
+    # One mapping per PlayerSeason row; later entries for the same field win
+    mappings = {}
+    results = []
+    for index, entry in enumerate(data):
+        player_id = entry.get('player_id') if isinstance(entry, dict) else None
+        try:
+            stats = parse_stat_entry(entry)
+            if player_id not in roster:
+                raise ValueError(f"player {player_id} is not on this team's roster for the season")
+        except ValueError as e:
+            results.append({'index': index, 'player_id': player_id, 'status': 'error', 'error': str(e)})
+            continue
+        mappings.setdefault(player_id, {'player_season_id': roster[player_id]}).update(stats)
+        results.append({'index': index, 'player_id': player_id, 'status': 'updated', 'fields': sorted(stats)})
+    if mappings:
+        db.session.bulk_update_mappings(PlayerSeason, list(mappings.values()))
+        # Bulk mappings bypass the session events that track season versions
+        bump_season_version(season_id, team_ids=[team_id])
+        refresh_player_careers(mappings)
+        refresh_team_rating(season_id, team_id)
+        db.session.commit()
+    updated = sum(1 for result in results if result['status'] == 'updated')
+    return jsonify({'updated': updated, 'rejected': len(results) - updated, 'results': results})
 
 @teams_bp.route('/teams/user-controlled', methods=['POST'])
 def set_user_controlled_team() -> Response:
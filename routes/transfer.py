@@ -1,28 +1,9 @@
 from flask import Blueprint, request, jsonify, Response
 from extensions import db
-from models import Player, Team, Season, PlayerSeason
+from models import Player, Team, Season, PlayerSeason, Transfer
 
 transfer_bp = Blueprint('transfer', __name__)
 
-# Create a simple Transfer model for storing committed transfers
-class Transfer(db.Model):
-    __tablename__ = 'transfers'
-    transfer_id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(64), nullable=False)
-    position = db.Column(db.String(8), nullable=False)
-    previous_school = db.Column(db.String(64))
-    ovr_rating = db.Column(db.Integer)
-    recruit_stars = db.Column(db.Integer)  # NEW: star rating
-    recruit_rank_pos = db.Column(db.Integer)  # NEW: positional rank
-    dev_trait = db.Column(db.String(16))
-    height = db.Column(db.String(8))
-    weight = db.Column(db.Integer)
-    state = db.Column(db.String(2))
-    current_status = db.Column(db.String(8))
-    team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'))
-    season_id = db.Column(db.Integer, db.ForeignKey('seasons.season_id'))
-    committed = db.Column(db.Boolean, default=True)
-
 @transfer_bp.route('/transfer-portal', methods=['POST'])
 def add_transfer_portal() -> Response:
     """
@@ -9,3 +9,37 @@ class CreateTeamSchema(Schema):
     name = fields.String(required=True)
     abbreviation = fields.String()
     logo_url = fields.String()
+
+
+# Snapshot rows of these tables are also checked against the create schemas above
+SNAPSHOT_BASE_SCHEMAS = {
+    'seasons': CreateSeasonSchema,
+    'teams': CreateTeamSchema,
+}
+
+_SNAPSHOT_FIELD_TYPES = {
+    int: fields.Integer,
+    float: fields.Float,
+    bool: fields.Boolean,
+    str: fields.String,
+}
+
+
+def snapshot_row_schema(table) -> Schema:
+    """
+    Build a schema that loads one exported row of a table (see dynasty_export).
+
+    Every column becomes a field typed from the model. Non-nullable columns without
+    a default are required, and unknown keys are rejected. Columns declared on the
+    table's create schema keep that schema's validation. Null values should be
+    dropped from a row before loading it.
+    """
+    base = SNAPSHOT_BASE_SCHEMAS.get(table.name, Schema)
+    declared = {}
+    for column in table.columns:
+        if column.name in base._declared_fields:
+            continue
+        field_class = _SNAPSHOT_FIELD_TYPES.get(column.type.python_type, fields.Raw)
+        required = not column.nullable and not column.primary_key and column.default is None
+        declared[column.name] = field_class(required=required)
+    return type(f"{table.name.title().replace('_', '')}SnapshotSchema", (base,), declared)()
@@ -0,0 +1,83 @@
+from sqlalchemy import event
+
+from extensions import db
+from routes import logger
+
+# Values SQLite reports back for enum-like pragmas
+SYNCHRONOUS_NAMES = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+TEMP_STORE_NAMES = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: dict) -> None:
+    """Run PRAGMA statements for the configured settings on a raw DB-API connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if value is None:
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def init_sqlite_pragmas(app) -> None:
+    """
+    Apply app.config['SQLITE_PRAGMAS'] to every new connection of the app's engine.
+
+    Args:
+        app: Flask application with Flask-SQLAlchemy already initialized
+
+    Note:
+        Does nothing for non-SQLite databases. The hook is registered on the
+        engine before any connection is opened, so pooled connections are
+        always tuned.
+    """
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+    with app.app_context():
+        engine = db.engine
+        if engine.dialect.name != 'sqlite' or not pragmas:
+            return
+
+        @event.listens_for(engine, 'connect')
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+
+def read_sqlite_settings() -> dict:
+    """Return the effective pragma values on a pooled connection. Requires an app context."""
+    if db.engine.dialect.name != 'sqlite':
+        return {}
+    with db.engine.connect() as connection:
+        def pragma(name):
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        return {
+            'journal_mode': str(pragma('journal_mode')).upper(),
+            'synchronous': SYNCHRONOUS_NAMES.get(pragma('synchronous')),
+            'mmap_size': pragma('mmap_size'),
+            'cache_size': pragma('cache_size'),
+            'temp_store': TEMP_STORE_NAMES.get(pragma('temp_store')),
+            'busy_timeout': pragma('busy_timeout'),
+        }
+
+
+def report_sqlite_settings(app) -> dict:
+    """
+    Log the effective SQLite settings at startup and warn about any that differ
+    from the configured values (e.g. WAL is unavailable for in-memory databases).
+
+    Returns:
+        dict: Effective settings, empty for non-SQLite databases
+    """
+    with app.app_context():
+        effective = read_sqlite_settings()
+    if not effective:
+        return effective
+    logger.info(f"SQLite settings for {app.config['SQLALCHEMY_DATABASE_URI']}: {effective}")
+    for name, requested in (app.config.get('SQLITE_PRAGMAS') or {}).items():
+        if requested is None:
+            continue
+        actual = effective.get(name)
+        if str(actual).upper() != str(requested).upper():
+            logger.warning(f"SQLite pragma {name} requested {requested} but is {actual}")
+    return effective
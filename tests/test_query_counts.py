@@ -0,0 +1,52 @@
+import os
+import sys
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extensions import db
+from models import Season, AwardWinner, HonorWinner
+from benchmarks.generate_dynasty import generate_dynasty
+from benchmarks.run_benchmarks import QUERY_BUDGETS, QueryCounter, build_app
+
+
+@pytest.fixture(scope='module')
+def dynasty(tmp_path_factory):
+    """A tiny generated dynasty, its test client and a QueryCounter on its engine."""
+    app = build_app(str(tmp_path_factory.mktemp('dynasty') / 'dynasty.db'))
+    with app.app_context():
+        generate_dynasty(seasons=2, teams=24, roster_size=6, seed=0)
+        latest = Season.query.order_by(Season.year.desc()).first()
+        award_player = db.session.query(AwardWinner.player_id).filter(AwardWinner.player_id.isnot(None)).first()[0]
+        honor_player = db.session.query(HonorWinner.player_id).filter(HonorWinner.player_id.isnot(None)).first()[0]
+        yield {
+            'client': app.test_client(),
+            'counter': QueryCounter(db.engine),
+            'season_id': latest.season_id,
+            'award_player': award_player,
+            'honor_player': honor_player,
+        }
+        db.session.remove()
+        db.engine.dispose()
+
+
+def count_queries(dynasty, path):
+    """GET path and return the number of statements it executed."""
+    dynasty['counter'].count = 0
+    response = dynasty['client'].get(path)
+    assert response.status_code == 200
+    return dynasty['counter'].count
+
+
+@pytest.mark.parametrize('endpoint, path', [
+    ('honors', '/api/honors'),
+    ('season_honors', '/api/seasons/{season_id}/honors'),
+    ('season_awards', '/api/seasons/{season_id}/awards'),
+    ('season_awards_all', '/api/seasons/{season_id}/awards/all'),
+    ('player_awards', '/api/players/{award_player}/awards'),
+    ('player_honors', '/api/players/{honor_player}/honors'),
+])
+def test_honor_and_award_query_counts(dynasty, endpoint, path):
+    assert count_queries(dynasty, path.format(**dynasty)) <= QUERY_BUDGETS[endpoint]
+
+
+def test_dashboard_query_count(dynasty):
+    assert count_queries(dynasty, '/api/dashboard') <= QUERY_BUDGETS['dashboard']
@@ -0,0 +1,220 @@
+from extensions import db
+from models import Game
+
+# (round, week, games) of the 12-team playoff, in the order rounds are played
+PLAYOFF_LAYOUT = [
+    ('First Round', 17, 4),
+    ('Quarterfinals', 18, 4),
+    ('Semifinals', 19, 2),
+    ('Championship', 20, 1),
+]
+PLAYOFF_ROUNDS = [name for name, _, _ in PLAYOFF_LAYOUT]
+WEEK_ROUNDS = {week: name for name, week, _ in PLAYOFF_LAYOUT}
+# Seeds placed before any game is played, per game of the round as (home, away).
+# None marks a slot filled by a winner of the previous round.
+SEED_SLOTS = {
+    'First Round': [(5, 12), (6, 11), (7, 10), (8, 9)],
+    'Quarterfinals': [(1, None), (2, None), (3, None), (4, None)],
+}
+# Sorts teams whose seed is unknown after every seeded team
+UNSEEDED = 999
+
+
+def pair_winners(winners: list, hosts: list = None) -> list:
+    """
+    Matchups of the next round as (home, away) pairs, from the previous round's
+    winners ordered best seed first: each seeded host meets the worst remaining
+    winner, otherwise the best remaining winner hosts the worst.
+    """
+    if hosts:
+        return [(host, winners[-(i + 1)]) for i, host in enumerate(hosts)]
+    return [(winners[i], winners[-(i + 1)]) for i in range(len(winners) // 2)]
+
+
+def create_bracket_games(season_id: int) -> list:
+    """Add the 11 empty games of a 12-team bracket to the session, in bracket order. The caller commits."""
+    games = [
+        Game(season_id=season_id, week=week, game_type="Playoff", playoff_round=name)
+        for name, week, count in PLAYOFF_LAYOUT for _ in range(count)
+    ]
+    db.session.add_all(games)
+    db.session.flush()
+    return games
+
+
+class PlayoffBracket:
+    """
+    A season's playoff Game rows as a dependency graph, loaded with one query.
+
+    Every game has a home and an away slot. A slot either holds a seed
+    (SEED_SLOTS) or is fed by the winners of the previous round: once that round
+    is complete its winners are ordered by seed and the best remaining seed
+    meets the worst. Results are applied in memory one round at a time and a
+    later game is reset only when the teams it should hold change, so a whole
+    update is persisted by the caller's single commit.
+
+    Usage:
+        bracket = PlayoffBracket.load(season_id)
+        bracket.apply_results([{'game_id': 5, 'home_score': 24, 'away_score': 17}])
+        db.session.commit()
+    """
+
+    def __init__(self, games: list):
+        # Bracket order: week, then game_id
+        self.games = list(games)
+        self.by_id = {game.game_id: game for game in self.games}
+        self._index()
+
+    @classmethod
+    def load(cls, season_id: int) -> 'PlayoffBracket':
+        return cls(
+            Game.query.filter_by(season_id=season_id, game_type="Playoff")
+            .order_by(Game.week.asc(), Game.game_id.asc())
+            .all()
+        )
+
+    def _index(self) -> None:
+        """Group games into rounds and rebuild the feeder and seed-slot edges."""
+        self.rounds = {name: [] for name in PLAYOFF_ROUNDS}
+        for game in self.games:
+            name = self.round_of(game)
+            if name is not None:
+                self.rounds[name].append(game)
+        # game_id -> ids of the games whose winners fill its open slots
+        self.feeders = {}
+        # game_id -> (home seed, away seed), None for a winner-fed slot
+        self.seed_slots = {}
+        previous = []
+        for name in PLAYOFF_ROUNDS:
+            slots = SEED_SLOTS.get(name, [])
+            for i, game in enumerate(self.rounds[name]):
+                self.feeders[game.game_id] = [feeder.game_id for feeder in previous]
+                self.seed_slots[game.game_id] = slots[i] if i < len(slots) else (None, None)
+            previous = self.rounds[name]
+        # Seeds of the teams currently placed in seed slots
+        self.seed_of = {}
+        for game in self.games:
+            home_seed, away_seed = self.seed_slots.get(game.game_id, (None, None))
+            if home_seed is not None and game.home_team_id is not None:
+                self.seed_of[game.home_team_id] = home_seed
+            if away_seed is not None and game.away_team_id is not None:
+                self.seed_of[game.away_team_id] = away_seed
+
+    @staticmethod
+    def round_of(game):
+        """The game's playoff_round, or the round played in its week when the label is missing."""
+        if game.playoff_round in WEEK_ROUNDS.values():
+            return game.playoff_round
+        return WEEK_ROUNDS.get(game.week)
+
+    @staticmethod
+    def is_complete(game) -> bool:
+        return (
+            game.home_team_id is not None and game.away_team_id is not None
+            and game.home_score is not None and game.away_score is not None
+        )
+
+    @staticmethod
+    def winner(game):
+        """Winning team id of a complete game; a tie goes to the away team."""
+        return game.home_team_id if game.home_score > game.away_score else game.away_team_id
+
+    def round_complete(self, name: str) -> bool:
+        return all(self.is_complete(game) for game in self.rounds.get(name, []))
+
+    def team_ids(self) -> set:
+        """Every team id currently placed in the bracket."""
+        return {tid for game in self.games for tid in (game.home_team_id, game.away_team_id) if tid is not None}
+
+    def first_changed_week(self):
+        """
+        Lowest week of the games whose teams or scores differ from the database,
+        or None when nothing changed. Call it before anything flushes the session.
+        """
+        return min((game.week for game in self.games if db.session.is_modified(game)), default=None)
+
+    def seed(self, teams_by_seed: dict) -> None:
+        """
+        Place teams ({seed: team_id}, seeds 1-12) into their seed slots and empty
+        every winner-fed slot. Scores are left as they are.
+        """
+        for game in self.games:
+            home_seed, away_seed = self.seed_slots.get(game.game_id, (None, None))
+            game.home_team_id = teams_by_seed.get(home_seed) if home_seed is not None else None
+            game.away_team_id = teams_by_seed.get(away_seed) if away_seed is not None else None
+        self._index()
+
+    def apply_results(self, results) -> list:
+        """
+        Apply {game_id, home_score, away_score, playoff_round (optional)} results
+        and re-derive every round after the earliest one touched.
+
+        Rounds are processed in order: a round's results are written, then the
+        next round's winner-fed slots are recomputed from it, so one call may
+        carry results for several rounds.
+
+        Returns:
+            list: game_ids of the results that are not games of this bracket
+        """
+        unknown = []
+        by_game = {}
+        for result in results:
+            game = self.by_id.get(result.get('game_id')) if isinstance(result, dict) else None
+            if game is None:
+                unknown.append(result.get('game_id') if isinstance(result, dict) else None)
+                continue
+            by_game[game.game_id] = result
+            if result.get('playoff_round'):
+                game.playoff_round = result['playoff_round']
+        if not by_game:
+            return unknown
+        self._index()
+
+        for game_id, result in by_game.items():
+            if self.round_of(self.by_id[game_id]) is None:
+                # Outside the known rounds: nothing depends on it
+                self._set_score(self.by_id[game_id], result)
+        touched = [
+            PLAYOFF_ROUNDS.index(self.round_of(self.by_id[game_id]))
+            for game_id in by_game if self.round_of(self.by_id[game_id]) is not None
+        ]
+        if not touched:
+            return unknown
+        for index in range(min(touched), len(PLAYOFF_ROUNDS)):
+            for game in self.rounds[PLAYOFF_ROUNDS[index]]:
+                if game.game_id in by_game:
+                    self._set_score(game, by_game[game.game_id])
+            if index + 1 < len(PLAYOFF_ROUNDS):
+                self._fill_round(PLAYOFF_ROUNDS[index + 1])
+        return unknown
+
+    @staticmethod
+    def _set_score(game, result: dict) -> None:
+        game.home_score = result.get('home_score')
+        game.away_score = result.get('away_score')
+
+    def _fill_round(self, name: str) -> None:
+        """
+        Set the winner-fed slots of a round from the round feeding it: the
+        winners ordered by seed when it is complete, empty otherwise. A game
+        whose matchup changes loses its score.
+        """
+        games = self.rounds[name]
+        if not games:
+            return
+        feeding = [self.by_id[game_id] for game_id in self.feeders[games[0].game_id]]
+        winners = []
+        if feeding and all(self.is_complete(game) for game in feeding):
+            winners = sorted((self.winner(game) for game in feeding), key=lambda tid: self.seed_of.get(tid, UNSEEDED))
+        # A seeded host keeps its slot; its opponent waits for the whole round
+        hosts = [game.home_team_id for game in games if self.seed_slots[game.game_id][0] is not None]
+        if hosts:
+            matchups = pair_winners(winners, hosts) if len(winners) >= len(games) else [(host, None) for host in hosts]
+        else:
+            matchups = pair_winners(winners)
+        for i, game in enumerate(games):
+            matchup = matchups[i] if i < len(matchups) else (None, None)
+            if (game.home_team_id, game.away_team_id) != matchup:
+                game.home_team_id, game.away_team_id = matchup
+                game.home_score = None
+                game.away_score = None
@@ -0,0 +1,77 @@
+from sqlalchemy import select
+
+from extensions import db
+from models import PlayerSeason, PlayerCareer
+
+# Career columns summed over seasons, and those taking the best single season
+SUMMED_STATS = [
+    'games_played', 'completions', 'attempts', 'pass_yards', 'pass_tds', 'interceptions',
+    'rush_attempts', 'rush_yards', 'rush_tds', 'rush_fumbles', 'receptions', 'rec_yards',
+    'rec_tds', 'rec_drops', 'tackles', 'tfl', 'sacks', 'forced_fumbles', 'def_tds'
+]
+MAX_STATS = ['longest_rush', 'longest_rec']
+
+career_table = PlayerCareer.__table__
+
+
+def _career_aggregates(player_filter):
+    """One GROUP BY over player_seasons producing a player_careers row per matching player."""
+    columns = [
+        PlayerSeason.player_id,
+        db.func.count(PlayerSeason.player_season_id).label('seasons_played'),
+        db.func.min(PlayerSeason.season_id).label('first_season_id'),
+        db.func.max(PlayerSeason.season_id).label('last_season_id'),
+        db.func.group_concat(PlayerSeason.team_id.distinct()).label('team_ids'),
+    ]
+    columns += [db.func.coalesce(db.func.sum(getattr(PlayerSeason, stat)), 0).label(stat) for stat in SUMMED_STATS]
+    columns += [db.func.coalesce(db.func.max(getattr(PlayerSeason, stat)), 0).label(stat) for stat in MAX_STATS]
+    return select(*columns).where(player_filter).group_by(PlayerSeason.player_id)
+
+
+def refresh_player_careers(player_ids=None, season_id=None):
+    """
+    Recompute the career rows of the given players, or of every player with a
+    PlayerSeason in season_id, with one DELETE and one INSERT ... SELECT.
+    Called by the stat and roster write endpoints so career totals stay in sync.
+    The caller is responsible for committing the session.
+    """
+    if player_ids is not None:
+        player_ids = {player_id for player_id in player_ids if player_id is not None}
+        if not player_ids:
+            return
+        player_filter = PlayerSeason.player_id.in_(player_ids)
+        career_filter = career_table.c.player_id.in_(player_ids)
+    elif season_id is not None:
+        in_season = select(PlayerSeason.player_id).where(PlayerSeason.season_id == season_id)
+        player_filter = PlayerSeason.player_id.in_(in_season)
+        career_filter = career_table.c.player_id.in_(in_season)
+    else:
+        raise ValueError("player_ids or season_id is required")
+    _replace_careers(player_filter, career_filter)
+
+
+def rebuild_player_careers():
+    """Recompute every career row, e.g. after an import. The caller is responsible for committing."""
+    _replace_careers(db.true(), db.true())
+
+
+def _replace_careers(player_filter, career_filter):
+    # Pending PlayerSeason changes must be visible to the aggregate
+    db.session.flush()
+    aggregates = _career_aggregates(player_filter)
+    db.session.execute(career_table.delete().where(career_filter))
+    db.session.execute(
+        career_table.insert().from_select([column.name for column in aggregates.selected_columns], aggregates)
+    )
+
+
+def get_player_career_totals(player_id):
+    """
+    Return the PlayerCareer row for a player (None without any seasons). Read-only:
+    a player missing from player_careers, e.g. in a database not yet migrated with
+    migrations/build_derived_tables.py, gets the same aggregate computed on the fly.
+    """
+    row = db.session.get(PlayerCareer, player_id)
+    if row is None:
+        row = db.session.execute(_career_aggregates(PlayerSeason.player_id == player_id)).first()
+    return row
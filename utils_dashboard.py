@@ -0,0 +1,178 @@
+from extensions import db
+from models import Team, TeamSeason, Game, SeasonStanding, Recruit
+from utils_standings import compute_standings
+
+
+def _load_team_history(team_id):
+    """
+    Load every TeamSeason and SeasonStanding row for a team in two queries,
+    computing (without storing) the standing of any season that is missing one.
+    Returns ({season_id: TeamSeason}, {season_id: SeasonStanding}).
+    """
+    team_seasons = {ts.season_id: ts for ts in TeamSeason.query.filter_by(team_id=team_id).all()}
+    standings = {st.season_id: st for st in SeasonStanding.query.filter_by(team_id=team_id).all()}
+    for season_id in team_seasons:
+        if season_id not in standings:
+            standings[season_id] = compute_standings(season_id, [team_id])[team_id]
+    return team_seasons, standings
+
+
+def _load_season_games(team_id, season_id):
+    """
+    Load a team's games in a season ordered by week, each with the opponent's
+    name and logo joined in the same query.
+    Returns a list of (Game, opponent_name, opponent_logo_url).
+    """
+    opponent_id = db.case((Game.home_team_id == team_id, Game.away_team_id), else_=Game.home_team_id)
+    return (
+        db.session.query(Game, Team.name, Team.logo_url)
+        .outerjoin(Team, Team.team_id == opponent_id)
+        .filter(
+            Game.season_id == season_id,
+            (Game.home_team_id == team_id) | (Game.away_team_id == team_id)
+        )
+        .order_by(Game.week.asc())
+        .all()
+    )
+
+
+def _select_display_games(all_games):
+    """
+    Pick the three games shown on the dashboard: the last completed game and the
+    next two, topped up with earlier completed games. Before the first game is
+    played, the next three games are shown.
+    """
+    completed_games = [g for g in all_games if _has_result(g)]
+    future_games = [g for g in all_games if not _has_result(g)]
+    if completed_games:
+        last_completed_game = completed_games[-1]
+        last_index = all_games.index(last_completed_game)
+        display_games = [last_completed_game] + all_games[last_index + 1:last_index + 3]
+        earlier_games = completed_games[:-1]
+    else:
+        display_games = future_games[:3]
+        earlier_games = completed_games
+    for game in reversed(earlier_games):
+        if len(display_games) >= 3:
+            break
+        display_games.append(game)
+    return display_games
+
+
+def _has_result(game):
+    """Return True if both scores are entered and the game is not an unplayed 0-0 placeholder."""
+    return (
+        game.home_score is not None and game.away_score is not None
+        and not (game.home_score == 0 and game.away_score == 0)
+    )
+
+
+def _recent_activity(team_id, display_games, opponents):
+    activity = []
+    for game in display_games:
+        is_bye_week = (
+            game.game_type == 'Bye Week' or
+            (game.home_team_id == game.away_team_id == team_id)
+        )
+        if is_bye_week:
+            activity.append({
+                "title": "Bye Week",
+                "description": "No game this week",
+                "time_ago": f"Week {game.week}",
+                "status": "bye"
+            })
+            continue
+        opponent_id = game.away_team_id if game.home_team_id == team_id else game.home_team_id
+        opponent_name, opponent_logo_url = opponents.get(game.game_id) or (None, None)
+        if opponent_name is None:
+            opponent_name = f"Team {opponent_id}"
+        prefix = "vs" if game.home_team_id == team_id else "@"
+        title = f"{prefix} {opponent_name}"
+        if _has_result(game):
+            if (game.home_team_id == team_id and game.home_score > game.away_score) or \
+               (game.away_team_id == team_id and game.away_score > game.home_score):
+                result = "Win"
+            else:
+                result = "Loss"
+            activity.append({
+                "title": title,
+                "description": f"{result} ({game.home_score}-{game.away_score}) in week {game.week}",
+                "time_ago": f"Week {game.week}",
+                "status": "completed",
+                "opponent_team_id": opponent_id,
+                "opponent_logo_url": opponent_logo_url
+            })
+        else:
+            activity.append({
+                "title": title,
+                "description": f"Upcoming game in week {game.week}",
+                "time_ago": f"Week {game.week}",
+                "status": "upcoming",
+                "opponent_team_id": opponent_id,
+                "opponent_logo_url": opponent_logo_url
+            })
+    return activity
+
+
+def build_dashboard(team, season):
+    """
+    Assemble the /dashboard payload for a team and season.
+
+    Reads the team's TeamSeason and standings rows for every season, its committed
+    recruit count, its games in the season with opponents joined, and (unless a
+    manual position is set) the conference standings: six to eight statements in
+    total, independent of the number of seasons or teams in the dynasty.
+    """
+    # Local import keeps this module free of route imports for scripts
+    from routes.seasons import get_conference_standings
+
+    team_id = team.team_id
+    season_id = season.season_id
+    team_seasons, standings = _load_team_history(team_id)
+    team_season = team_seasons.get(season_id)
+
+    total_wins = sum(ts.wins for ts in team_seasons.values())
+    total_losses = sum(ts.losses for ts in team_seasons.values())
+    conf_wins = sum(st.conference_wins for st in standings.values())
+    conf_losses = sum(st.conference_losses for st in standings.values())
+
+    current_standing = standings.get(season_id)
+    if current_standing is None:
+        # No TeamSeason for this season: compute the standing from its games
+        current_standing = compute_standings(season_id, [team_id])[team_id]
+
+    recruiting_commits = Recruit.query.filter_by(team_id=team_id, season_id=season_id, committed=True).count()
+
+    rows = _load_season_games(team_id, season_id)
+    all_games = [game for game, _, _ in rows]
+    opponents = {game.game_id: (name, logo_url) for game, name, logo_url in rows}
+    display_games = _select_display_games(all_games)
+
+    conference_position = None
+    if team_season and team_season.manual_conference_position:
+        conference_position = team_season.manual_conference_position
+    elif team_season:
+        conf_entries = get_conference_standings(team_season.conference_id, season_id)
+        conference_position = next(
+            (idx for idx, entry in enumerate(conf_entries, 1) if entry['team_id'] == team_id), None
+        )
+
+    return {
+        "season": {
+            "year": season.year,
+            "dynasty_year": season.year - 2019  # Example: adjust base year as needed
+        },
+        "team": {
+            "record": f"{total_wins}-{total_losses}",
+            "current_season_record": f"{team_season.wins}-{team_season.losses}" if team_season else "-",
+            "current_season_conference_record": f"{current_standing.conference_wins}-{current_standing.conference_losses}",
+            "conference_record": f"{conf_wins}-{conf_losses}",
+            "championships": "Conference Champions" if team_season and team_season.final_rank == 1 else "-",
+            "prestige": team_season.prestige if team_season else "-",
+            "national_ranking": team_season.final_rank if team_season else "-",
+            "conference_position": conference_position,
+            "recruiting_commits": recruiting_commits,
+            "recruiting_rank": team_season.recruiting_rank if team_season else None
+        },
+        "recent_activity": _recent_activity(team_id, display_games, opponents)
+    }
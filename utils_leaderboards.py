@@ -0,0 +1,250 @@
+from flask import request
+
+from sqlalchemy import Float, literal, select, type_coerce, union_all
+
+from extensions import db
+from models import Player, PlayerSeason, PlayerCareer
+from utils_career import SUMMED_STATS, MAX_STATS
+
+# (PlayerSeason column, label) for every counting-stat leaderboard
+STAT_CATEGORIES = [
+    ('pass_yards', 'Passing Yards'),
+    ('pass_tds', 'Passing TDs'),
+    ('completions', 'Completions'),
+    ('rush_yards', 'Rushing Yards'),
+    ('rush_tds', 'Rushing TDs'),
+    ('rush_attempts', 'Rushing Attempts'),
+    ('longest_rush', 'Longest Rush'),
+    ('rec_yards', 'Receiving Yards'),
+    ('rec_tds', 'Receiving TDs'),
+    ('receptions', 'Receptions'),
+    ('longest_rec', 'Longest Reception'),
+    ('tackles', 'Tackles'),
+    ('tfl', 'Tackles for Loss'),
+    ('sacks', 'Sacks'),
+    ('interceptions', 'Interceptions'),
+    ('forced_fumbles', 'Forced Fumbles'),
+    ('def_tds', 'Defensive TDs'),
+]
+
+# (label, numerator column, denominator column, scale) for per-attempt rates. A
+# player qualifies once the denominator reaches the qualifier for that column.
+RATE_CATEGORIES = [
+    ('Completion %', 'completions', 'attempts', 100),
+    ('Yards per Attempt', 'pass_yards', 'attempts', 1),
+    ('Yards per Carry', 'rush_yards', 'rush_attempts', 1),
+]
+
+# Minimum attempts to qualify for a rate leaderboard, keyed by denominator column
+DEFAULT_QUALIFIERS = {
+    'attempts': 50,
+    'rush_attempts': 25,
+}
+
+# Career leaderboard keys for the rate categories, and their default qualifiers
+CAREER_RATES = {
+    key: category for key, category in zip(('completion_pct', 'yards_per_attempt', 'yards_per_carry'), RATE_CATEGORIES)
+}
+CAREER_QUALIFIERS = {
+    'attempts': 200,
+    'rush_attempts': 100,
+}
+
+def _category_query(position: int, value, condition, filters: list, k: int):
+    """Top k PlayerSeason rows by one value, as a subquery tagged with the category's position."""
+    return select(
+        literal(position).label('category'), PlayerSeason.player_id, PlayerSeason.team_id, value.label('value')
+    ).where(*filters, condition).order_by(value.desc(), PlayerSeason.player_id).limit(k).subquery()
+
+
+def compute_leaders(season_id: int, team_id: int = None, k: int = 5, qualifiers: dict = None) -> dict:
+    """
+    Compute every stat and rate leaderboard for a season, or one team's season.
+
+    All categories come from one statement: a UNION ALL of one ORDER BY ...
+    LIMIT k per category, each a bounded top-k sort over the season's rows
+    (ix_player_seasons_season_team), with player names joined to the leaders
+    only. Ties go to the lower player_id. Rates only consider rows whose
+    denominator reaches the qualifier for that column (at least 1).
+
+    Args:
+        season_id (int): Season to rank
+        team_id (int, optional): Only rank this team's players
+        k (int): Leaders per category
+        qualifiers (dict, optional): Minimum attempts per rate denominator column,
+            merged over DEFAULT_QUALIFIERS
+
+    Returns:
+        dict: {label: [{player_id, team_id, name, value}, ...]} for every entry in
+        STAT_CATEGORIES and RATE_CATEGORIES, best first
+    """
+    minimums = {**DEFAULT_QUALIFIERS, **(qualifiers or {})}
+    filters = [PlayerSeason.season_id == season_id]
+    if team_id is not None:
+        filters.append(PlayerSeason.team_id == team_id)
+
+    labels = []
+    categories = []
+    for field, label in STAT_CATEGORIES:
+        column = getattr(PlayerSeason, field)
+        categories.append(_category_query(len(labels), column, column.isnot(None), filters, k))
+        labels.append(label)
+    for label, numerator, denominator, scale in RATE_CATEGORIES:
+        den = getattr(PlayerSeason, denominator)
+        rate = type_coerce(db.func.coalesce(getattr(PlayerSeason, numerator), 0) * float(scale) / den, Float)
+        minimum = max(minimums.get(denominator, 1), 1)
+        categories.append(_category_query(len(labels), rate, den >= minimum, filters, k))
+        labels.append(label)
+
+    ranked = union_all(*[select(category) for category in categories]).subquery()
+    rows = db.session.execute(
+        select(ranked.c.category, ranked.c.player_id, ranked.c.team_id, Player.name, ranked.c.value)
+        .join(Player, Player.player_id == ranked.c.player_id)
+        .order_by(ranked.c.category, ranked.c.value.desc(), ranked.c.player_id)
+    ).all()
+
+    rates = {label for label, _, _, _ in RATE_CATEGORIES}
+    leaders = {label: [] for label in labels}
+    for category, player_id, team, name, value in rows:
+        label = labels[category]
+        leaders[label].append({
+            'player_id': player_id,
+            'team_id': team,
+            'name': name,
+            'value': round(value, 1) if label in rates else value
+        })
+    return leaders
+
+
+def parse_leaderboard_args(default_limit: int):
+    """
+    Read limit, min_attempts and min_rush_attempts from the query string.
+
+    Returns:
+        tuple: (k, qualifiers) for compute_leaders. Raises ValueError for a
+        limit outside 1-100 or a negative qualifier.
+    """
+    k = request.args.get('limit', default_limit, type=int)
+    if not 1 <= k <= 100:
+        raise ValueError("limit must be between 1 and 100")
+    qualifiers = {}
+    for name, column in (('min_attempts', 'attempts'), ('min_rush_attempts', 'rush_attempts')):
+        value = request.args.get(name, type=int)
+        if value is not None:
+            if value < 0:
+                raise ValueError(f"{name} must not be negative")
+            qualifiers[column] = value
+    return k, qualifiers
+
+
+def compute_career_leaders(stat: str, k: int = 25, qualifiers: dict = None, team_id: int = None,
+                           position: str = None, season_min: int = None, season_max: int = None) -> dict:
+    """
+    Rank players by a career total or rate across seasons.
+
+    Without a team or season range the ranking reads the player_careers totals
+    maintained by utils_career. Otherwise it is one GROUP BY over the matching
+    player_seasons rows (by team through ix_player_seasons_team_season, by era
+    through ix_player_seasons_season_team), so only those seasons count; names
+    and team lists are joined to the k leaders afterwards.
+
+    Args:
+        stat (str): A career stat column (summed, longest_rush/longest_rec take
+            the best season) or a CAREER_RATES key
+        k (int): Number of leaders
+        qualifiers (dict, optional): Minimum attempts per rate denominator column,
+            merged over CAREER_QUALIFIERS
+        team_id (int, optional): Only count seasons with this team
+        position (str, optional): Only rank players at this position
+        season_min (int, optional): First season id to count
+        season_max (int, optional): Last season id to count
+
+    Returns:
+        dict: stat, label and leaders, each with player_id, name, position,
+        seasons_played, team_ids and value, best first. Raises ValueError for an
+        unknown stat.
+    """
+    if stat in CAREER_RATES:
+        label, numerator, denominator, scale = CAREER_RATES[stat]
+        minimum = max({**CAREER_QUALIFIERS, **(qualifiers or {})}.get(denominator, 1), 1)
+    elif stat in SUMMED_STATS or stat in MAX_STATS:
+        label = dict(STAT_CATEGORIES).get(stat, stat.replace('_', ' ').title())
+    else:
+        raise ValueError(f"unknown stat '{stat}'")
+
+    if team_id is not None or season_min is not None or season_max is not None:
+        season_filters = []
+        if team_id is not None:
+            season_filters.append(PlayerSeason.team_id == team_id)
+        if season_min is not None:
+            season_filters.append(PlayerSeason.season_id >= season_min)
+        if season_max is not None:
+            season_filters.append(PlayerSeason.season_id <= season_max)
+        player_filters = []
+        if position:
+            player_filters.append(PlayerSeason.player_id.in_(select(Player.player_id).where(Player.position == position)))
+
+        def total(column):
+            aggregate = db.func.max if column in MAX_STATS else db.func.sum
+            return aggregate(getattr(PlayerSeason, column))
+        if stat in CAREER_RATES:
+            value = total(numerator) * scale * 1.0 / total(denominator)
+            condition = total(denominator) >= minimum
+        else:
+            value = total(stat)
+            condition = value.isnot(None)
+        # Rank on player_seasons alone; names and team lists are only looked up for the k leaders
+        ranked = (
+            select(
+                PlayerSeason.player_id.label('player_id'),
+                db.func.count(PlayerSeason.player_season_id).label('seasons_played'),
+                value.label('value')
+            )
+            .where(*season_filters, *player_filters)
+            .group_by(PlayerSeason.player_id)
+            .having(condition)
+            .order_by(db.desc('value'), PlayerSeason.player_id)
+            .limit(k)
+            .subquery()
+        )
+        team_ids = (
+            select(db.func.group_concat(PlayerSeason.team_id.distinct()))
+            .where(PlayerSeason.player_id == ranked.c.player_id, *season_filters)
+            .scalar_subquery()
+        )
+    else:
+        if stat in CAREER_RATES:
+            value = getattr(PlayerCareer, numerator) * scale * 1.0 / getattr(PlayerCareer, denominator)
+            condition = getattr(PlayerCareer, denominator) >= minimum
+        else:
+            value = getattr(PlayerCareer, stat)
+            condition = value.isnot(None)
+        ranked = select(
+            PlayerCareer.player_id, PlayerCareer.seasons_played, PlayerCareer.team_ids, value.label('value')
+        ).where(condition)
+        if position:
+            ranked = ranked.join(Player, Player.player_id == PlayerCareer.player_id).where(Player.position == position)
+        ranked = ranked.order_by(db.desc('value'), PlayerCareer.player_id).limit(k).subquery()
+        team_ids = ranked.c.team_ids
+
+    query = (
+        select(
+            ranked.c.player_id, Player.name, Player.position, ranked.c.seasons_played,
+            team_ids.label('team_ids'), ranked.c.value
+        )
+        .join(Player, Player.player_id == ranked.c.player_id)
+        .order_by(ranked.c.value.desc(), ranked.c.player_id)
+    )
+
+    leaders = [
+        {
+            'player_id': row.player_id,
+            'name': row.name,
+            'position': row.position,
+            'seasons_played': row.seasons_played,
+            'team_ids': [int(team) for team in row.team_ids.split(',')] if row.team_ids else [],
+            'value': round(row.value, 1) if stat in CAREER_RATES else row.value
+        }
+        for row in db.session.execute(query)
+    ]
+    return {'stat': stat, 'label': label, 'leaders': leaders}
@@ -0,0 +1,91 @@
+import base64
+import json
+from flask import request, jsonify, Response
+from extensions import db
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class ListArgs:
+    """
+    Parsed query string of a paginated list endpoint. Raises ValueError with a
+    message for the client when an argument is invalid.
+
+    Query Parameters:
+        all (bool): 'true' or '1' returns every matching row as a plain JSON array
+            (the original unpaginated response)
+        limit (int): Page size, 1 to MAX_PAGE_SIZE (default DEFAULT_PAGE_SIZE)
+        cursor (str): next_cursor value from the previous page
+        fields (str): Comma-separated subset of fields to include in each item
+    """
+
+    def __init__(self, allowed_fields, key_size: int):
+        self.all = request.args.get('all', '').lower() in ('1', 'true', 'yes')
+        self.limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+        if not 1 <= self.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        self.cursor = decode_cursor(request.args.get('cursor'))
+        if self.cursor is not None and len(self.cursor) != key_size:
+            raise ValueError("Invalid cursor")
+        self.fields = None
+        fields = request.args.get('fields')
+        if fields:
+            self.fields = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown = [field for field in self.fields if field not in allowed_fields]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    def project(self, item: dict) -> dict:
+        """Restrict an item to the requested fields."""
+        if self.fields is None:
+            return item
+        return {field: item[field] for field in self.fields}
+
+
+def encode_cursor(values) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a cursor from encode_cursor. Returns None for no cursor; raises ValueError if malformed."""
+    if not token:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or not all(type(value) is int for value in values):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def paginated_response(query, order_columns, serialize, args: ListArgs) -> Response:
+    """
+    Run a list query with keyset pagination and return the JSON response.
+
+    Args:
+        query: SQLAlchemy query with the endpoint's filters applied
+        order_columns: Columns giving a stable, unique ordering (last one a primary key);
+            the cursor holds their values for the last row of the page
+        serialize: Callable turning a result row into (item dict, sort key values)
+        args: Parsed ListArgs
+
+    Returns:
+        Response: With args.all, a JSON array of every matching item. Otherwise
+        {'items': [...], 'next_cursor': str or None}; next_cursor is None on the last page.
+    """
+    query = query.order_by(None).order_by(*order_columns)
+    if args.all:
+        return jsonify([args.project(serialize(row)[0]) for row in query.all()])
+    if args.cursor is not None:
+        query = query.filter(db.tuple_(*order_columns) > db.tuple_(*args.cursor))
+    rows = query.limit(args.limit + 1).all()
+    items = []
+    last_key = None
+    for row in rows[:args.limit]:
+        item, last_key = serialize(row)
+        items.append(args.project(item))
+    next_cursor = encode_cursor(last_key) if len(rows) > args.limit else None
+    return jsonify({'items': items, 'next_cursor': next_cursor})
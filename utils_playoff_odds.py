@@ -0,0 +1,155 @@
+import itertools
+import math
+
+from extensions import db
+from models import Team, TeamSeason
+from utils_bracket import PLAYOFF_ROUNDS, SEED_SLOTS, PlayoffBracket, pair_winners
+from utils_ratings import win_probability
+
+BRACKET_SIZE = 12
+# Expected points of margin per point of team_rating (average OVR) and per final_rank place
+RATING_POINTS = 1.0
+RANK_POINTS = 0.5
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def team_strengths(team_seasons) -> dict:
+    """
+    Strength of each team in points per game, from its TeamSeason scoring margin
+    (off_ppg - def_ppg), team_rating and final_rank. team_rating and final_rank
+    are measured against the mean of the teams given; each team averages the
+    components it has, and a team with none is rated 0.
+    """
+    ratings = {ts.team_id: _float(ts.team_rating) for ts in team_seasons}
+    known_ratings = [rating for rating in ratings.values() if rating is not None]
+    mean_rating = sum(known_ratings) / len(known_ratings) if known_ratings else None
+    known_ranks = [ts.final_rank for ts in team_seasons if ts.final_rank is not None]
+    mean_rank = sum(known_ranks) / len(known_ranks) if known_ranks else None
+
+    strengths = {}
+    for ts in team_seasons:
+        components = []
+        if ts.off_ppg is not None and ts.def_ppg is not None:
+            components.append(ts.off_ppg - ts.def_ppg)
+        if ratings[ts.team_id] is not None:
+            components.append((ratings[ts.team_id] - mean_rating) * RATING_POINTS)
+        if ts.final_rank is not None:
+            components.append((mean_rank - ts.final_rank) * RANK_POINTS)
+        strengths[ts.team_id] = sum(components) / len(components) if components else 0.0
+    return strengths
+
+
+def bracket_odds(teams_by_seed: dict, strengths: dict, decided: dict = None) -> dict:
+    """
+    Exact probability of every team reaching each round after the First Round
+    and of winning the title.
+
+    Every outcome of the 11 games (at most 2^11 paths) is enumerated with the
+    bracket's own advancement rule (utils_bracket.pair_winners), so the result
+    carries no sampling error.
+
+    Args:
+        teams_by_seed (dict): {seed: team_id} for seeds 1-12
+        strengths (dict): {team_id: strength in points}, see team_strengths
+        decided (dict, optional): {frozenset({home, away}): winner} of games
+            already played; those matchups are not simulated
+
+    Returns:
+        dict: {team_id: {'Quarterfinals': p, 'Semifinals': p, 'Championship': p, 'Champion': p}}
+    """
+    decided = decided or {}
+    seed_of = {team_id: seed for seed, team_id in teams_by_seed.items()}
+    odds = {team_id: dict.fromkeys(PLAYOFF_ROUNDS[1:] + ['Champion'], 0.0) for team_id in seed_of}
+    # Seeds waiting on a bye as the host of a later round
+    hosts = {name: [teams_by_seed[home] for home, away in SEED_SLOTS.get(name, []) if away is None] for name in PLAYOFF_ROUNDS}
+
+    def play(round_index: int, matchups: list, probability: float) -> None:
+        name = PLAYOFF_ROUNDS[round_index]
+        outcomes = []
+        for home, away in matchups:
+            if round_index > 0:
+                odds[home][name] += probability
+                odds[away][name] += probability
+            winner = decided.get(frozenset((home, away)))
+            if winner is not None:
+                outcomes.append([(winner, 1.0)])
+            else:
+                p = win_probability(strengths.get(home, 0.0), strengths.get(away, 0.0))
+                outcomes.append([(home, p), (away, 1 - p)])
+        for outcome in itertools.product(*outcomes):
+            path_probability = probability * math.prod(p for _, p in outcome)
+            if path_probability == 0:
+                continue
+            winners = sorted((team_id for team_id, _ in outcome), key=seed_of.get)
+            if round_index + 1 == len(PLAYOFF_ROUNDS):
+                odds[winners[0]]['Champion'] += path_probability
+            else:
+                play(round_index + 1, pair_winners(winners, hosts[PLAYOFF_ROUNDS[round_index + 1]]), path_probability)
+
+    play(0, [(teams_by_seed[home], teams_by_seed[away]) for home, away in SEED_SLOTS[PLAYOFF_ROUNDS[0]]], 1.0)
+    return odds
+
+
+def compute_playoff_odds(season_id: int) -> dict:
+    """
+    Round-advancement and title probabilities for a season's 12-team playoff.
+
+    Seeds come from the bracket when all 12 seed slots are filled, otherwise
+    from the 12 best final_rank values as seed_bracket would place them. Games
+    of the bracket that already have a result are taken as played.
+
+    Returns:
+        dict: season_id, seeded_from ('bracket' or 'final_rank') and the teams
+        ordered by title probability, each with seed, strength and odds
+
+    Raises:
+        ValueError: If fewer than 12 teams can be seeded
+    """
+    bracket = PlayoffBracket.load(season_id)
+    teams_by_seed = {seed: team_id for team_id, seed in bracket.seed_of.items()}
+    seeded_from = 'bracket'
+    if len(teams_by_seed) < BRACKET_SIZE:
+        ranked = (
+            db.session.query(TeamSeason.team_id)
+            .filter(TeamSeason.season_id == season_id, TeamSeason.final_rank.isnot(None))
+            .order_by(TeamSeason.final_rank.asc())
+            .limit(BRACKET_SIZE)
+            .all()
+        )
+        if len(ranked) < BRACKET_SIZE:
+            raise ValueError("Not enough teams with final_rank to seed bracket")
+        teams_by_seed = {seed: team_id for seed, (team_id,) in enumerate(ranked, 1)}
+        seeded_from = 'final_rank'
+
+    rows = (
+        db.session.query(TeamSeason, Team.name)
+        .join(Team, Team.team_id == TeamSeason.team_id)
+        .filter(TeamSeason.season_id == season_id, TeamSeason.team_id.in_(teams_by_seed.values()))
+        .all()
+    )
+    names = {ts.team_id: name for ts, name in rows}
+    strengths = team_strengths([ts for ts, _ in rows])
+    decided = {
+        frozenset((game.home_team_id, game.away_team_id)): PlayoffBracket.winner(game)
+        for game in bracket.games if PlayoffBracket.is_complete(game)
+    }
+    odds = bracket_odds(teams_by_seed, strengths, decided)
+
+    teams = [
+        {
+            'team_id': team_id,
+            'team_name': names.get(team_id),
+            'seed': seed,
+            'strength': round(strengths.get(team_id, 0.0), 2),
+            'odds': {name: round(p, 4) for name, p in odds[team_id].items()}
+        }
+        for seed, team_id in teams_by_seed.items()
+    ]
+    teams.sort(key=lambda team: (-team['odds']['Champion'], team['seed']))
+    return {'season_id': season_id, 'seeded_from': seeded_from, 'teams': teams}
@@ -0,0 +1,149 @@
+import random
+
+from extensions import db
+from models import Game, Team, TeamSeason
+from utils_ratings import srs_ratings, win_probability
+from utils_standings import is_completed_game
+
+DEFAULT_RUNS = 2000
+MAX_RUNS = 20000
+BOWL_ELIGIBLE_WINS = 6
+# Game types that are not part of a team's projected record
+EXCLUDED_GAME_TYPES = ('Playoff', 'Bye Week')
+
+
+def _win_distribution(base_wins: int, probabilities: list) -> list:
+    """Exact distribution of final wins: index = wins, from the current total and each remaining game's win probability."""
+    distribution = [1.0]
+    for p in probabilities:
+        step = [0.0] * (len(distribution) + 1)
+        for wins, probability in enumerate(distribution):
+            step[wins] += probability * (1 - p)
+            step[wins + 1] += probability * p
+        distribution = step
+    return [0.0] * base_wins + distribution
+
+
+def project_season(season_id: int, runs: int = DEFAULT_RUNS, conference_id: int = None) -> dict:
+    """
+    Project every team's final record and conference finish from its remaining games.
+
+    Team strength is the SRS rating fitted from the season's completed games
+    (utils_ratings.srs_ratings), and each unplayed game is won with
+    win_probability of the two ratings plus the fitted home edge. Final win
+    distributions are exact, since a team's remaining games are independent.
+    Conference finish needs the joint outcome, so the remaining conference
+    games are simulated `runs` times. Teams are ranked by conference wins, ties
+    broken at random. The simulation is seeded with the season id, so the same
+    data always gives the same projection.
+
+    Args:
+        season_id (int): ID of the season
+        runs (int): Simulated seasons for the conference finish
+        conference_id (int, optional): Only return this conference's teams
+
+    Returns:
+        dict: season_id, runs, home_edge and teams ordered by conference and
+        projected finish. Each team has its current record, rating, remaining
+        games, expected_wins, final_wins (probability per win total, index =
+        wins), bowl_eligible (probability of 6+ wins), conference_title and
+        conference_finish (probability per place, index 0 = first)
+    """
+    games = (
+        db.session.query(Game.home_team_id, Game.away_team_id, Game.home_score, Game.away_score,
+                         Game.neutral_site, Game.game_type)
+        .filter(Game.season_id == season_id, Game.game_type.notin_(EXCLUDED_GAME_TYPES))
+        .all()
+    )
+    rows = (
+        db.session.query(TeamSeason.team_id, TeamSeason.conference_id, Team.name)
+        .join(Team, Team.team_id == TeamSeason.team_id)
+        .filter(TeamSeason.season_id == season_id)
+        .all()
+    )
+    conference_of = {team_id: conf_id for team_id, conf_id, _ in rows}
+    names = {team_id: name for team_id, _, name in rows}
+
+    # Null scores and 0-0 placeholders are games still to play
+    scheduled = [game for game in games if game.home_team_id is not None and game.away_team_id is not None]
+    played = [game for game in scheduled if is_completed_game(game)]
+    remaining = [game for game in scheduled if not is_completed_game(game)]
+    ratings, home_edge = srs_ratings(
+        (game.home_team_id, game.away_team_id, game.home_score, game.away_score, game.neutral_site)
+        for game in played
+    )
+
+    records = {team_id: {'wins': 0, 'losses': 0, 'conference_wins': 0} for team_id in conference_of}
+    for game in played:
+        winner, loser = (
+            (game.home_team_id, game.away_team_id) if game.home_score > game.away_score
+            else (game.away_team_id, game.home_team_id)
+        )
+        is_conference_game = conference_of.get(winner) is not None and conference_of.get(winner) == conference_of.get(loser)
+        if winner in records:
+            records[winner]['wins'] += 1
+            records[winner]['conference_wins'] += 1 if is_conference_game else 0
+        if loser in records:
+            records[loser]['losses'] += 1
+
+    # Win probability of each side of every remaining game
+    win_chances = {team_id: [] for team_id in conference_of}
+    conference_games = []
+    for game in remaining:
+        edge = 0.0 if game.neutral_site else home_edge
+        p = win_probability(ratings.get(game.home_team_id, 0.0) + edge, ratings.get(game.away_team_id, 0.0))
+        if game.home_team_id in win_chances:
+            win_chances[game.home_team_id].append(p)
+        if game.away_team_id in win_chances:
+            win_chances[game.away_team_id].append(1 - p)
+        if conference_of.get(game.home_team_id) is not None \
+                and conference_of.get(game.home_team_id) == conference_of.get(game.away_team_id):
+            conference_games.append((game.home_team_id, game.away_team_id, p))
+
+    members = {}
+    for team_id, conf_id in conference_of.items():
+        members.setdefault(conf_id, []).append(team_id)
+    position = {team_id: i for i, team_id in enumerate(conference_of)}
+    base = [records[team_id]['conference_wins'] for team_id in conference_of]
+    pending = [(position[home], position[away], p) for home, away, p in conference_games]
+    groups = [[position[team_id] for team_id in group] for group in members.values()]
+    finishes = [[0] * len(members[conference_of[team_id]]) for team_id in conference_of]
+    rng = random.Random(season_id)
+    draw = rng.random
+    for _ in range(runs):
+        conference_wins = base[:]
+        for home, away, p in pending:
+            conference_wins[home if draw() < p else away] += 1
+        # A fraction below one win breaks ties at random
+        standing = [wins + draw() * 0.5 for wins in conference_wins]
+        for group in groups:
+            for place, i in enumerate(sorted(group, key=standing.__getitem__, reverse=True)):
+                finishes[i][place] += 1
+
+    teams = []
+    for team_id, conf_id in conference_of.items():
+        if conference_id is not None and conf_id != conference_id:
+            continue
+        record = records[team_id]
+        distribution = _win_distribution(record['wins'], win_chances[team_id])
+        finish = [count / runs for count in finishes[position[team_id]]]
+        teams.append({
+            'team_id': team_id,
+            'team_name': names.get(team_id),
+            'conference_id': conf_id,
+            'wins': record['wins'],
+            'losses': record['losses'],
+            'conference_wins': record['conference_wins'],
+            'rating': round(ratings.get(team_id, 0.0), 2),
+            'remaining_games': len(win_chances[team_id]),
+            'expected_wins': round(sum(wins * p for wins, p in enumerate(distribution)), 2),
+            'final_wins': [round(p, 4) for p in distribution],
+            'bowl_eligible': round(sum(distribution[BOWL_ELIGIBLE_WINS:]), 4),
+            'conference_title': round(finish[0], 4),
+            'conference_finish': [round(p, 4) for p in finish]
+        })
+    # Conference, then expected place
+    teams.sort(key=lambda team: (
+        team['conference_id'], sum(place * p for place, p in enumerate(team['conference_finish'])), team['team_id']
+    ))
+    return {'season_id': season_id, 'runs': runs, 'home_edge': round(home_edge, 2), 'teams': teams}
@@ -0,0 +1,318 @@
+import math
+
+from sqlalchemy import select
+
+from data_versions import bump_season_version
+from extensions import db
+from models import Game, Season, Team, TeamSeason, TeamPowerRating
+from utils_standings import is_completed_game
+
+# Standard deviation of a game's final margin around the expected margin, in points
+MARGIN_SD = 14.0
+# Every team is treated as having also played this many games against an average
+# team with a 0 margin, which keeps early-season ratings from running away
+PRIOR_GAMES = 1.0
+SOLVE_TOLERANCE = 1e-6
+ELO_START = 1500.0
+ELO_K = 20.0
+# Elo points added to the home team's rating when predicting a game
+ELO_HOME_EDGE = 55.0
+# Share of last season's distance from ELO_START a team keeps into the next season
+ELO_CARRYOVER = 2 / 3
+RATING_METHODS = ('srs', 'elo')
+
+power_rating_table = TeamPowerRating.__table__
+
+
+def win_probability(home_strength: float, away_strength: float) -> float:
+    """Probability the home team wins, with the margin normally distributed around the strength difference."""
+    return 0.5 * (1 + math.erf((home_strength - away_strength) / (MARGIN_SD * math.sqrt(2))))
+
+
+def srs_ratings(games) -> tuple:
+    """
+    Simple Rating System: the point margins that best explain the given games.
+
+    Solves the least-squares problem margin = rating_home - rating_away
+    + home_edge (0 at neutral sites) over every game, with the PRIOR_GAMES
+    ridge, by conjugate gradient on the normal equations. Each iteration is one
+    pass over the games, so a season's solve is linear in its games.
+
+    Args:
+        games: Iterable of (home_team_id, away_team_id, home_score, away_score,
+            neutral_site) for completed games
+
+    Returns:
+        tuple: ({team_id: rating}, home_edge), ratings in points better than an
+        average team on a neutral field
+    """
+    index = {}
+    rows = []
+    for home, away, home_score, away_score, neutral in games:
+        h = index.setdefault(home, len(index))
+        a = index.setdefault(away, len(index))
+        rows.append((h, a, 0.0 if neutral else 1.0, float(home_score - away_score)))
+    if not rows:
+        return {}, 0.0
+    edge = len(index)
+    size = edge + 1
+
+    def normal(x):
+        # (A^T A + PRIOR_GAMES * I) x, A having one row per game
+        out = [PRIOR_GAMES * value for value in x]
+        for h, a, home, _ in rows:
+            residual = x[h] - x[a] + home * x[edge]
+            out[h] += residual
+            out[a] -= residual
+            out[edge] += home * residual
+        return out
+
+    rhs = [0.0] * size
+    for h, a, home, margin in rows:
+        rhs[h] += margin
+        rhs[a] -= margin
+        rhs[edge] += home * margin
+
+    x = [0.0] * size
+    r = rhs[:]
+    p = r[:]
+    rr = sum(value * value for value in r)
+    threshold = SOLVE_TOLERANCE * SOLVE_TOLERANCE * max(rr, 1.0)
+    for _ in range(size):
+        if rr <= threshold:
+            break
+        q = normal(p)
+        alpha = rr / sum(pi * qi for pi, qi in zip(p, q))
+        x = [xi + alpha * pi for xi, pi in zip(x, p)]
+        r = [ri - alpha * qi for ri, qi in zip(r, q)]
+        rr_next = sum(value * value for value in r)
+        p = [ri + (rr_next / rr) * pi for ri, pi in zip(r, p)]
+        rr = rr_next
+
+    return {team_id: x[i] for team_id, i in index.items()}, x[edge]
+
+
+def elo_change(home_elo: float, away_elo: float, home_score: int, away_score: int, neutral: bool = False) -> float:
+    """
+    Points the home team gains (the away team loses the same) from one result.
+    The margin multiplier grows with the log of the margin and shrinks when the
+    favourite wins, so blowouts by strong teams are not over-rewarded.
+    """
+    edge = 0.0 if neutral else ELO_HOME_EDGE
+    difference = home_elo + edge - away_elo
+    expected = 1 / (1 + 10 ** (-difference / 400))
+    margin = home_score - away_score
+    if margin == 0:
+        return ELO_K * (0.5 - expected)
+    winner_difference = difference if margin > 0 else -difference
+    multiplier = math.log(abs(margin) + 1) * 2.2 / (winner_difference * 0.001 + 2.2)
+    return ELO_K * multiplier * ((1.0 if margin > 0 else 0.0) - expected)
+
+
+def _scored_games(season_id: int):
+    """Query for the columns of a season's games that have both teams and both scores."""
+    return db.session.query(
+        Game.home_team_id, Game.away_team_id, Game.home_score, Game.away_score,
+        Game.neutral_site, Game.game_type, Game.week
+    ).filter(
+        Game.season_id == season_id,
+        Game.home_team_id.isnot(None),
+        Game.away_team_id.isnot(None),
+        Game.home_score.isnot(None),
+        Game.away_score.isnot(None)
+    )
+
+
+def _adjacent_season(season_id: int, later: bool):
+    """The season before (or after) this one by year, or None."""
+    year = select(Season.year).where(Season.season_id == season_id).scalar_subquery()
+    query = select(Season.season_id)
+    if later:
+        query = query.where(Season.year > year).order_by(Season.year.asc())
+    else:
+        query = query.where(Season.year < year).order_by(Season.year.desc())
+    return db.session.execute(query.limit(1)).scalar()
+
+
+def _has_elo_ratings(season_id: int) -> bool:
+    return db.session.execute(
+        select(power_rating_table.c.season_id).where(power_rating_table.c.season_id == season_id).limit(1)
+    ).first() is not None
+
+
+def _latest_elo(season_id: int, before_week: int = None) -> dict:
+    """{team_id: elo} from each team's last stored week of the season (before before_week when given)."""
+    query = (
+        select(power_rating_table.c.team_id, power_rating_table.c.elo)
+        .where(power_rating_table.c.season_id == season_id)
+        .order_by(power_rating_table.c.week.asc())
+    )
+    if before_week is not None:
+        query = query.where(power_rating_table.c.week < before_week)
+    return dict(db.session.execute(query).all())
+
+
+def _season_start_elo(season_id: int) -> dict:
+    """
+    Week 0 ratings: every team of the season starts from ELO_START plus
+    ELO_CARRYOVER of its distance from it at the end of the previous season,
+    which is replayed in memory if it has no stored ratings.
+    """
+    previous = _adjacent_season(season_id, later=False)
+    final = {}
+    if previous is not None:
+        if _has_elo_ratings(previous):
+            final = _latest_elo(previous)
+        else:
+            final = _snapshot_elo(_replay_season_elo(previous))
+    team_ids = db.session.execute(select(TeamSeason.team_id).where(TeamSeason.season_id == season_id)).scalars()
+    return {
+        team_id: ELO_START + (final[team_id] - ELO_START) * ELO_CARRYOVER if team_id in final else ELO_START
+        for team_id in team_ids
+    }
+
+
+def _replay_games(season_id: int, ratings: dict, from_week: int) -> dict:
+    """
+    Play the season's completed games from from_week on over ratings ({team_id: elo},
+    updated in place) and return {(team_id, week): elo} after each team's games,
+    including week 0 when replaying from the start.
+    """
+    snapshot = {(team_id, 0): elo for team_id, elo in ratings.items()} if from_week == 0 else {}
+    games = (
+        _scored_games(season_id)
+        .filter(Game.week >= from_week)
+        .order_by(Game.week.asc(), Game.game_id.asc())
+        .all()
+    )
+    for game in games:
+        if not is_completed_game(game):
+            continue
+        home = ratings.get(game.home_team_id, ELO_START)
+        away = ratings.get(game.away_team_id, ELO_START)
+        change = elo_change(home, away, game.home_score, game.away_score, bool(game.neutral_site))
+        ratings[game.home_team_id] = home + change
+        ratings[game.away_team_id] = away - change
+        snapshot[(game.home_team_id, game.week)] = home + change
+        snapshot[(game.away_team_id, game.week)] = away - change
+    return snapshot
+
+
+def _replay_season_elo(season_id: int) -> dict:
+    """A whole season's {(team_id, week): elo} computed without storing it, for seasons with no stored ratings."""
+    return _replay_games(season_id, _season_start_elo(season_id), 0)
+
+
+def _snapshot_elo(snapshot: dict, before_week: int = None) -> dict:
+    """{team_id: elo} from each team's last week in a snapshot, like _latest_elo does for stored ratings."""
+    return {
+        team_id: elo
+        for (team_id, week), elo in sorted(snapshot.items(), key=lambda item: item[0][1])
+        if before_week is None or week < before_week
+    }
+
+
+def refresh_elo_ratings(season_id: int, from_week: int = 0, cascade: bool = True) -> None:
+    """
+    Replay a season's Elo ratings from from_week on. Called by every game write
+    with the week of the game, so only that week and the ones after it are
+    recomputed, from the ratings stored before it; the replay is one pass over
+    those games. With cascade, later seasons that already have ratings are
+    replayed as well, since they start from this season's final ratings, and
+    their data versions are bumped. The caller is responsible for committing the session.
+    """
+    # Pending game changes must be visible to the replay
+    db.session.flush()
+    ratings = _latest_elo(season_id, before_week=from_week) if from_week > 0 else {}
+    if not ratings:
+        from_week = 0
+        ratings = _season_start_elo(season_id)
+    snapshot = _replay_games(season_id, ratings, from_week)
+
+    db.session.execute(
+        power_rating_table.delete().where(
+            power_rating_table.c.season_id == season_id, power_rating_table.c.week >= from_week
+        )
+    )
+    if snapshot:
+        db.session.execute(power_rating_table.insert(), [
+            {'season_id': season_id, 'team_id': team_id, 'week': week, 'elo': elo}
+            for (team_id, week), elo in snapshot.items()
+        ])
+
+    following = _adjacent_season(season_id, later=True) if cascade else None
+    if following is not None and _has_elo_ratings(following):
+        refresh_elo_ratings(following)
+        # Core writes to team_power_ratings are not tracked, and no game of the
+        # later season changed, so its ETag and cached responses must be bumped here
+        bump_season_version(following)
+
+
+def rebuild_elo_ratings() -> None:
+    """Replay every season in year order, e.g. after an import. The caller is responsible for committing."""
+    db.session.execute(power_rating_table.delete())
+    for season_id in db.session.execute(select(Season.season_id).order_by(Season.year.asc())).scalars():
+        refresh_elo_ratings(season_id, cascade=False)
+
+
+def compute_power_ratings(season_id: int, week: int = None) -> dict:
+    """
+    SRS and Elo ratings of every team in a season after a given week.
+
+    SRS is solved from the season's completed games up to the week (all of
+    them without one); Elo is read from team_power_ratings, or replayed in
+    memory for a season whose ratings have not been built. Never writes.
+
+    Returns:
+        dict: season_id, week, home_edge (SRS points) and teams ordered by SRS,
+        each with team_name, wins, losses, srs, srs_rank, elo and elo_rank
+    """
+    query = _scored_games(season_id)
+    if week is not None:
+        query = query.filter(Game.week <= week)
+    played = [game for game in query.all() if is_completed_game(game)]
+    srs, home_edge = srs_ratings(
+        (game.home_team_id, game.away_team_id, game.home_score, game.away_score, game.neutral_site)
+        for game in played
+    )
+    before_week = week + 1 if week is not None else None
+    if _has_elo_ratings(season_id):
+        elo = _latest_elo(season_id, before_week=before_week)
+    else:
+        elo = _snapshot_elo(_replay_season_elo(season_id), before_week=before_week)
+
+    records = {}
+    for game in played:
+        if game.home_score == game.away_score:
+            continue
+        home_won = game.home_score > game.away_score
+        for team_id, won in ((game.home_team_id, home_won), (game.away_team_id, not home_won)):
+            record = records.setdefault(team_id, [0, 0])
+            record[0 if won else 1] += 1
+    rows = (
+        db.session.query(TeamSeason.team_id, Team.name)
+        .join(Team, Team.team_id == TeamSeason.team_id)
+        .filter(TeamSeason.season_id == season_id)
+        .all()
+    )
+    teams = [
+        {
+            'team_id': team_id,
+            'team_name': name,
+            'wins': records.get(team_id, [0, 0])[0],
+            'losses': records.get(team_id, [0, 0])[1],
+            'srs': round(srs.get(team_id, 0.0), 2),
+            'elo': round(elo.get(team_id, ELO_START), 1)
+        }
+        for team_id, name in rows
+    ]
+    for method in RATING_METHODS:
+        for rank, team in enumerate(sorted(teams, key=lambda team: (-team[method], team['team_id'])), 1):
+            team[f"{method}_rank"] = rank
+    teams.sort(key=lambda team: team['srs_rank'])
+    return {
+        'season_id': season_id,
+        'week': week if week is not None else max((game.week for game in played), default=0),
+        'home_edge': round(home_edge, 2),
+        'teams': teams
+    }
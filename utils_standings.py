@@ -0,0 +1,153 @@
+from extensions import db
+from models import Game, TeamSeason, SeasonStanding
+
+
+def is_completed_game(game):
+    """
+    Return True if a game counts towards standings: not a bye week, both scores
+    entered and not an unplayed 0-0 placeholder.
+    """
+    if game.game_type == 'Bye Week':
+        return False
+    if game.home_score is None or game.away_score is None:
+        return False
+    return not (game.home_score == 0 and game.away_score == 0)
+
+
+def format_streak(streak):
+    """Format a signed streak counter as 'W3' / 'L2', or None when there is no streak."""
+    if not streak:
+        return None
+    return f"W{streak}" if streak > 0 else f"L{-streak}"
+
+
+def _compute_records(season_id, team_ids=None):
+    """
+    Compute game-derived records for the given teams (all teams in the season if None).
+    Returns a dict {team_id: {wins, losses, conference_wins, conference_losses, points_for, points_against, streak}}.
+    """
+    query = Game.query.filter(
+        Game.season_id == season_id,
+        Game.home_score != None,
+        Game.away_score != None
+    )
+    if team_ids is not None:
+        query = query.filter((Game.home_team_id.in_(team_ids)) | (Game.away_team_id.in_(team_ids)))
+    games = [g for g in query.order_by(Game.week.asc(), Game.game_id.asc()).all() if is_completed_game(g)]
+
+    # Conference membership for this season, restricted to the teams that actually appear
+    involved = set(team_ids or [])
+    for g in games:
+        involved.add(g.home_team_id)
+        involved.add(g.away_team_id)
+    involved.discard(None)
+    conf_query = db.session.query(TeamSeason.team_id, TeamSeason.conference_id).filter(TeamSeason.season_id == season_id)
+    if team_ids is not None:
+        conf_query = conf_query.filter(TeamSeason.team_id.in_(involved))
+    team_conf_map = dict(conf_query.all())
+
+    if team_ids is None:
+        targets = set(team_conf_map) | involved
+    else:
+        targets = set(team_ids)
+    records = {
+        team_id: {
+            'wins': 0, 'losses': 0, 'conference_wins': 0, 'conference_losses': 0,
+            'points_for': 0, 'points_against': 0, 'streak': 0
+        }
+        for team_id in targets
+    }
+    for g in games:
+        home_conf = team_conf_map.get(g.home_team_id)
+        away_conf = team_conf_map.get(g.away_team_id)
+        is_conf_game = bool(home_conf) and home_conf == away_conf
+        for team_id, team_score, opp_score in (
+            (g.home_team_id, g.home_score, g.away_score),
+            (g.away_team_id, g.away_score, g.home_score),
+        ):
+            record = records.get(team_id)
+            if record is None:
+                continue
+            record['points_for'] += team_score
+            record['points_against'] += opp_score
+            if team_score > opp_score:
+                record['wins'] += 1
+                record['conference_wins'] += 1 if is_conf_game else 0
+                record['streak'] = record['streak'] + 1 if record['streak'] > 0 else 1
+            elif team_score < opp_score:
+                record['losses'] += 1
+                record['conference_losses'] += 1 if is_conf_game else 0
+                record['streak'] = record['streak'] - 1 if record['streak'] < 0 else -1
+            else:
+                record['streak'] = 0
+    return records
+
+
+def _write_records(season_id, records):
+    """Upsert computed records into season_standings. Does not commit."""
+    if not records:
+        return
+    existing = {
+        row.team_id: row
+        for row in SeasonStanding.query.filter(
+            SeasonStanding.season_id == season_id,
+            SeasonStanding.team_id.in_(list(records))
+        ).all()
+    }
+    for team_id, record in records.items():
+        row = existing.get(team_id)
+        if row is None:
+            row = SeasonStanding(season_id=season_id, team_id=team_id)
+            db.session.add(row)
+        for field, value in record.items():
+            setattr(row, field, value)
+
+
+def refresh_team_standings(season_id, team_ids):
+    """
+    Recompute the standings rows for a set of teams in one season.
+    Called by every game write so the materialized standings stay in sync.
+    The caller is responsible for committing the session.
+    """
+    team_ids = {team_id for team_id in team_ids if team_id is not None}
+    if not season_id or not team_ids:
+        return
+    _write_records(season_id, _compute_records(season_id, team_ids))
+
+
+def rebuild_season_standings(season_id):
+    """
+    Recompute the standings rows for every team in a season, e.g. after conference
+    assignments change. The caller is responsible for committing the session.
+    """
+    _write_records(season_id, _compute_records(season_id))
+
+
+def compute_standings(season_id, team_ids):
+    """
+    Return {team_id: SeasonStanding} computed from the games without storing them:
+    the read-only fallback for teams whose rows have not been built yet, e.g. in a
+    database not migrated with migrations/build_derived_tables.py.
+    """
+    return {
+        team_id: SeasonStanding(season_id=season_id, team_id=team_id, **record)
+        for team_id, record in _compute_records(season_id, team_ids).items()
+    }
+
+
+def get_team_standing(season_id, team_id):
+    """Return the SeasonStanding row for a team, computed on the fly if it has not been built."""
+    row = SeasonStanding.query.filter_by(season_id=season_id, team_id=team_id).first()
+    if row is None:
+        row = compute_standings(season_id, [team_id])[team_id]
+    return row
+
+
+def get_team_standings_all_seasons(team_id):
+    """Return the SeasonStanding rows for every season of a team, computing any that have not been built."""
+    rows = SeasonStanding.query.filter_by(team_id=team_id).all()
+    have = {row.season_id for row in rows}
+    for (season_id,) in db.session.query(TeamSeason.season_id).filter(TeamSeason.team_id == team_id).all():
+        if season_id not in have:
+            rows.append(compute_standings(season_id, [team_id])[team_id])
+    return rows
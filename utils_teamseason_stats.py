@@ -1,6 +1,6 @@
 from extensions import db
 from models import TeamSeason, Game, PlayerSeason
-import requests
+from data_versions import bump_season_version
 
 def update_teamseason_stats_for_team(season_id, team_id, top_25_ranks=None):
     """
@@ -42,26 +42,105 @@ def update_teamseason_stats_for_team(season_id, team_id, top_25_ranks=None):
         team_season.final_rank = None
     db.session.commit()
 
+def refresh_team_rating(season_id, team_id):
+    """
+    Recompute one team's team_rating (average ovr_rating of its PlayerSeason rows) from a single aggregate query.
+    Leaves points, final_rank and the manually entered team totals alone. The caller is responsible for committing.
+    """
+    avg_rating = (
+        db.session.query(db.func.avg(PlayerSeason.ovr_rating))
+        .filter(PlayerSeason.season_id == season_id, PlayerSeason.team_id == team_id, PlayerSeason.ovr_rating != None)
+        .scalar()
+    )
+    TeamSeason.query.filter_by(season_id=season_id, team_id=team_id).update(
+        {TeamSeason.team_rating: round(avg_rating, 1) if avg_rating is not None else None},
+        synchronize_session=False
+    )
+
+def aggregate_game_points_for_season(season_id):
+    """
+    Aggregate points for/against and games played for every team in a season in one query.
+    Games are unioned as (home side) + (away side) rows and grouped by team.
+    Returns a dict {team_id: (points_for, points_against, games_played)}.
+    """
+    scored = (
+        (Game.season_id == season_id) &
+        (Game.home_score != None) &
+        (Game.away_score != None)
+    )
+    home_rows = db.select(
+        Game.home_team_id.label('team_id'),
+        Game.home_score.label('points_for'),
+        Game.away_score.label('points_against')
+    ).where(scored & (Game.home_team_id != None))
+    # A game with the same team on both sides is counted once, as the home side
+    away_rows = db.select(
+        Game.away_team_id.label('team_id'),
+        Game.away_score.label('points_for'),
+        Game.home_score.label('points_against')
+    ).where(scored & (Game.away_team_id != None) & ((Game.home_team_id == None) | (Game.away_team_id != Game.home_team_id)))
+    sides = db.union_all(home_rows, away_rows).subquery()
+    rows = db.session.execute(
+        db.select(
+            sides.c.team_id,
+            db.func.sum(sides.c.points_for),
+            db.func.sum(sides.c.points_against),
+            db.func.count()
+        ).group_by(sides.c.team_id)
+    ).all()
+    return {team_id: (points_for, points_against, games_played) for team_id, points_for, points_against, games_played in rows}
+
+
+def aggregate_team_ratings_for_season(season_id):
+    """
+    Average ovr_rating of every team's PlayerSeason rows in a season in one GROUP BY query.
+    Returns a dict {team_id: average_ovr_rating}.
+    """
+    rows = (
+        db.session.query(PlayerSeason.team_id, db.func.avg(PlayerSeason.ovr_rating))
+        .filter(PlayerSeason.season_id == season_id, PlayerSeason.ovr_rating != None)
+        .group_by(PlayerSeason.team_id)
+        .all()
+    )
+    return {team_id: avg for team_id, avg in rows}
+
+
 def update_teamseason_stats_for_season(season_id, top_25_ranks=None):
     """
-    For each team in the given season, recalculate and update points_for, points_against, off_ppg, def_ppg, team_rating, and final_rank.
+    For every team in the given season, recalculate and update points_for, points_against, off_ppg, def_ppg, team_rating, and final_rank.
     Optionally accepts a dict top_25_ranks {team_id: rank} for final_rank.
+    Uses two aggregate queries (games and player ratings) and a single bulk update committed in one transaction.
     """
-    team_seasons = TeamSeason.query.filter_by(season_id=season_id).all()
-    for team_season in team_seasons:
-        update_teamseason_stats_for_team(season_id, team_season.team_id, top_25_ranks=top_25_ranks)
+    points = aggregate_game_points_for_season(season_id)
+    ratings = aggregate_team_ratings_for_season(season_id)
+    team_seasons = (
+        db.session.query(TeamSeason.team_season_id, TeamSeason.team_id)
+        .filter(TeamSeason.season_id == season_id)
+        .all()
+    )
+    mappings = []
+    for team_season_id, team_id in team_seasons:
+        points_for, points_against, games_played = points.get(team_id, (0, 0, 0))
+        avg_rating = ratings.get(team_id)
+        mappings.append({
+            'team_season_id': team_season_id,
+            'points_for': points_for,
+            'points_against': points_against,
+            'off_ppg': round(points_for / games_played, 1) if games_played > 0 else None,
+            'def_ppg': round(points_against / games_played, 1) if games_played > 0 else None,
+            'team_rating': round(avg_rating, 1) if avg_rating is not None else None,
+            'final_rank': top_25_ranks.get(team_id) if top_25_ranks else None,
+        })
+    db.session.bulk_update_mappings(TeamSeason, mappings)
+    # Bulk mappings bypass the session events that track season versions
+    bump_season_version(season_id)
+    db.session.commit()
 
 def fetch_top_25_ranks(season_id):
     """
-    Fetch the top 25 rankings for a season from the frontend API and return a dict {team_id: rank}.
+    Return the Top 25 for a season as a dict {team_id: rank} from the app's
+    rankings provider (see rankings_provider): the stored rankings by default,
+    or the HTTP rankings service with a bounded timeout and a cached fallback.
     """
-    url = f"http://localhost:3000/rankings?season={season_id}"
-    try:
-        resp = requests.get(url)
-        resp.raise_for_status()
-        data = resp.json()
-        # Expecting a list of dicts with 'team_id' and 'rank' keys
-        return {entry['team_id']: entry['rank'] for entry in data if 'team_id' in entry and 'rank' in entry}
-    except Exception as e:
-        print(f"Error fetching rankings: {e}")
-        return {}
+    from rankings_provider import get_rankings_provider
+    return get_rankings_provider().top_25(season_id)